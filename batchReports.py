@@ -0,0 +1,167 @@
+# batch_reports.py
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import headlessCharts
+from snapshot import load_snapshot
+
+# Snapshot opened once per worker process by _init_worker
+_worker_snapshot = None
+
+
+class ReportBatch:
+    """Outcome of generate_reports."""
+
+    def __init__(self, users, files, seconds, workers):
+        self.users = users
+        self.files = files  # Number of artifacts written
+        self.seconds = seconds
+        self.workers = workers
+
+    @property
+    def users_per_second(self):
+        return self.users / self.seconds if self.seconds else 0.0
+
+    def __repr__(self):
+        return (f"ReportBatch({self.users:,} users, {self.files:,} files in {self.seconds:.2f} s "
+                f"on {self.workers} workers, {self.users_per_second:,.1f} users/s)")
+
+
+def report_summary(health, months=6, year=None, month=None):
+    """
+    The figures behind the monthly report sections: FinancialHealth sections 1.1-1.5,
+    the disposable income summary and the forecast deficit alerts. Monthly figures and the
+    score are for the given calendar month (default: an average month).
+    """
+    tracker = health.income_tracker
+    score = health.calculate_financial_health_score(year, month)
+    monthly_income = health.get_monthly_income(year, month)
+    monthly_expenses = health.get_monthly_expenses(year, month)
+    savings_capacity = None
+    if monthly_income != 0:
+        savings_capacity = max(0, (monthly_income - monthly_expenses) / monthly_income * 100)
+    disposable_income = tracker.calculate_disposable_income()
+
+    deficits = []
+    if tracker.income_forecaster.count:
+        deficits = [alert._asdict() for alert in tracker.forecast_alerts(months, quiet=True)]
+
+    return {
+        'year': year,
+        'month': month,
+        'score': score,
+        'status': health.get_status_indicator(score),
+        'monthly_income': monthly_income,
+        'monthly_expenses': monthly_expenses,
+        'savings_capacity': savings_capacity,
+        'total_debts': health.total_debts,
+        'total_savings_and_assets': health.savings + health.liquid_assets,
+        'total_liquid_assets': health.get_total_liquid_assets(),
+        'bank_accounts': dict(health.bank_accounts),
+        'disposable_income': disposable_income,
+        'savings_contributions': min(tracker.savings_contributions, disposable_income),
+        'money_left_to_invest': tracker.calculate_money_left_to_invest(disposable_income),
+        'forecast_deficits': deficits,
+        'debts': {name: dict(details) for name, details in health.debt_manager.debts.items()},
+    }
+
+
+def _report_charts(health, year=None, month=None):
+    """
+    (file stem, headlessCharts function, owner, options) for every chart that has data to show.
+    Charts of monthly figures get the report's year and month in their options.
+    """
+    tracker = health.income_tracker
+    debt_manager = health.debt_manager
+    period = {'year': year, 'month': month}
+    charts = [
+        ('income_expense_summary', headlessCharts.display_income_expense_summary, health, period),
+        ('debt_vs_savings_balance', headlessCharts.display_debt_vs_savings_balance, health, {}),
+    ]
+    if len(health.historical_scores) >= 2:
+        charts.append(('score_evolution', headlessCharts.plot_score_evolution, health, {}))
+    if health.get_monthly_income(year, month) != 0:
+        charts.append(('savings_capacity_gauge', headlessCharts.display_savings_capacity_gauge, health, period))
+    if len(health.historical_savings) >= 2 and len(health.historical_debts) >= 2:
+        charts.append(('debt_savings_trend', headlessCharts.plot_debt_savings_trend, health, {}))
+    if health.bank_accounts or health.liquid_assets > 0:
+        charts.append(('liquid_assets', headlessCharts.display_liquid_assets_pie_chart, health, {}))
+    if tracker.calculate_disposable_income() > 0:
+        charts.append(('disposable_income', headlessCharts.disposable_income_summary, tracker, {}))
+    if debt_manager.debt_history:
+        charts.append(('debt_progress', headlessCharts.plot_debt_progress, debt_manager, {}))
+        charts.append(('debt_progress_line', headlessCharts.plot_debt_progress_line, debt_manager, {}))
+    return charts
+
+
+def write_user_report(health, directory, fmt='png', months=6, pool=None, year=None, month=None):
+    """
+    Writes one user's summary.json and charts into `directory`; returns the written paths.
+    Monthly figures are for the given calendar month (default: an average month).
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    path = os.path.join(directory, 'summary.json')
+    with open(path, 'w') as file:
+        json.dump(report_summary(health, months, year, month), file, indent=2)
+    paths.append(path)
+    for stem, render, owner, options in _report_charts(health, year, month):
+        path = os.path.join(directory, f'{stem}.{fmt}')
+        with open(path, 'wb') as file:
+            render(owner, fmt=fmt, pool=pool, buffer=file, **options)
+        paths.append(path)
+    return paths
+
+
+def _init_worker(snapshot_path):
+    global _worker_snapshot
+    _worker_snapshot = load_snapshot(snapshot_path)
+
+
+def _report_shard(user_ids, output_dir, fmt, months, year, month):
+    """Runs in a worker: writes the reports of one shard of users from the worker's snapshot."""
+    pool = headlessCharts.FigurePool()  # Figures are reused across the users of the shard
+    files = 0
+    for user_id in user_ids:
+        health = _worker_snapshot.financial_health(user_id)
+        files += len(write_user_report(health, os.path.join(output_dir, str(user_id)), fmt, months, pool, year, month))
+    return len(user_ids), files
+
+
+def generate_reports(snapshot_path, output_dir, user_ids=None, workers=None, shard_size=64, fmt='png', months=6,
+                     year=None, month=None):
+    """
+    Writes a report directory per user of a snapshot (see snapshot.save_snapshot) under `output_dir`.
+    Scores and monthly figures are for the given calendar month (default: an average month),
+    so a batch gives the same results whenever it runs.
+
+    Users are split into shards of `shard_size` ids and spread over `workers` processes. Each
+    worker memory-maps the snapshot once and materializes its users itself, so only user ids
+    cross process boundaries. With `workers=1` everything runs in this process.
+    """
+    workers = workers or os.cpu_count() or 1
+    if user_ids is None:
+        user_ids = load_snapshot(snapshot_path).user_ids.tolist()
+    else:
+        user_ids = [int(user_id) for user_id in user_ids]
+    shards = [user_ids[start:start + shard_size] for start in range(0, len(user_ids), shard_size)]
+
+    start = time.perf_counter()
+    if workers == 1:
+        _init_worker(snapshot_path)
+        results = [_report_shard(shard, output_dir, fmt, months, year, month) for shard in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(snapshot_path,)) as executor:
+            futures = [executor.submit(_report_shard, shard, output_dir, fmt, months, year, month) for shard in shards]
+            results = [future.result() for future in futures]
+    seconds = time.perf_counter() - start
+    return ReportBatch(sum(users for users, _ in results), sum(files for _, files in results), seconds, workers)
+
+#---------------------------------------------------Example Usage---------------------------------------------------------------------------------------------------
+
+# save_snapshot("population_snapshot", users)  # {user_id: FinancialHealth}
+# batch = generate_reports("population_snapshot", "reports/2024-05", workers=8, year=2024, month=5)
+# print(batch)
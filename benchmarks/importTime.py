@@ -0,0 +1,70 @@
+# import_time.py
+"""
+Measures the cold import time of each top-level module in a fresh interpreter and reports
+which plotting libraries the import pulled in.
+
+Usage: python benchmarks/importTime.py [--repeat N] [--json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Every top-level module of the repository, so new modules are measured without editing this list
+MODULES = sorted(name[:-len('.py')] for name in os.listdir(REPO_ROOT) if name.endswith('.py'))
+
+PLOTTING_LIBRARIES = ['matplotlib', 'pandas', 'plotly']
+
+# Runs in the child interpreter: time one import, then report what got loaded
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {libraries!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module, repeat):
+    """Imports `module` in `repeat` fresh interpreters and returns the timings."""
+    probe = _PROBE.format(module=module, libraries=PLOTTING_LIBRARIES)
+    samples = []
+    loaded = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', probe], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        samples.append(result['seconds'])
+        loaded = result['loaded']
+    return {
+        'module': module,
+        'min_ms': min(samples) * 1000,
+        'median_ms': statistics.median(samples) * 1000,
+        'plotting_libraries_loaded': loaded,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='fresh interpreters per module')
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    args = parser.parse_args()
+
+    results = [measure_import(module, args.repeat) for module in MODULES]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'module':<20}{'min (ms)':>10}{'median (ms)':>14}  plotting libraries loaded")
+    for result in results:
+        loaded = ', '.join(result['plotting_libraries_loaded']) or '-'
+        print(f"{result['module']:<20}{result['min_ms']:>10.1f}{result['median_ms']:>14.1f}  {loaded}")
+
+
+if __name__ == '__main__':
+    main()
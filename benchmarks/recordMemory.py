@@ -0,0 +1,126 @@
+# record_memory.py
+"""
+Measures the memory per entry of income/expense sources and debts with tracemalloc:
+the legacy layouts (3-tuples and 3-key dicts) against the slotted records, and the
+cost per entry of storing them through IncomeTracker and DebtManagement, next to the
+baseline layout those classes used before (dicts of tuples, dicts and balance lists).
+Every layout is measured inside its {name: entry} dict, whose per-key cost the records
+do not change, so that cost is reported separately.
+
+Usage: python benchmarks/recordMemory.py [--entries N] [--json]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import syntheticData  # noqa: E402
+from budgetManagement import IncomeTracker  # noqa: E402
+from debtManagement import DebtManagement  # noqa: E402
+from records import DebtRecord, SourceEntry  # noqa: E402
+
+
+def bytes_per_entry(build, count):
+    """Memory still allocated after build() returns, divided by `count`."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return allocated / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--entries', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    args = parser.parse_args()
+
+    count = args.entries
+    rng = np.random.default_rng(args.seed)
+    names, amounts, frequencies = syntheticData.sources(count, rng)
+    daily_amounts = IncomeTracker().utilities.calculate_daily_amounts(amounts, frequencies).tolist()
+    source_values = list(zip(amounts, frequencies, daily_amounts))
+    debt_names, balances, rates, urgencies = syntheticData.debts(count, rng)
+    debt_values = list(zip(balances, rates, urgencies))
+
+    # Values are created up front, so the record layouts are compared on the containers alone
+    results = {
+        'entries': count,
+        'dict_per_key': bytes_per_entry(lambda: dict.fromkeys(names), count),
+        'source': {
+            'tuple': bytes_per_entry(lambda: {name: (a, f, d) for name, (a, f, d) in zip(names, source_values)}, count),
+            'SourceEntry': bytes_per_entry(lambda: {name: SourceEntry(*value) for name, value in zip(names, source_values)}, count),
+        },
+        'debt': {
+            'dict': bytes_per_entry(lambda: {name: {'balance': b, 'interest_rate': r, 'urgency': u}
+                                             for name, (b, r, u) in zip(debt_names, debt_values)}, count),
+            'DebtRecord': bytes_per_entry(lambda: {name: DebtRecord(*value) for name, value in zip(debt_names, debt_values)}, count),
+        },
+    }
+
+    # Storage through the public API, including the values, totals and (for debts) history and priority index,
+    # against the layout the classes used before the records: a dict of tuples, and a dict of dicts plus a
+    # dict of balance lists for the debt history
+    # Both source layouts go through utilities' scalar conversion, so they allocate the same daily amounts
+    def baseline_sources():
+        convert = IncomeTracker().utilities.calculate_daily_amount
+        return {name: (amount, frequency, convert(amount, frequency))
+                for name, amount, frequency in zip(names, amounts, frequencies)}
+
+    def baseline_debts():
+        debts, history = {}, {}
+        for name, (balance, rate, urgency) in zip(debt_names, debt_values):
+            debts[name] = {'balance': balance, 'interest_rate': rate, 'urgency': urgency}
+            history[name] = [balance]
+        return debts, history
+
+    def tracker_sources():
+        tracker = IncomeTracker()
+        for name, amount, frequency in zip(names, amounts, frequencies):
+            tracker.add_income_source(name, amount, frequency)
+        return tracker
+
+    def manager_debts():
+        manager = DebtManagement()
+        for name, (balance, rate, urgency) in zip(debt_names, debt_values):
+            manager.add_debt(name, balance, rate, urgency, 0)
+        return manager
+
+    results['stored'] = {
+        'IncomeTracker source': {'baseline': bytes_per_entry(baseline_sources, count),
+                                 'current': bytes_per_entry(tracker_sources, count)},
+        'DebtManagement debt': {'baseline': bytes_per_entry(baseline_debts, count),
+                                'current': bytes_per_entry(manager_debts, count)},
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{count:,} entries, bytes per entry")
+    for kind, (before, after) in (('source', ('tuple', 'SourceEntry')), ('debt', ('dict', 'DebtRecord'))):
+        old, new = results[kind][before], results[kind][after]
+        print(f"{kind:<8}{before:>12}{old:>8.1f}{after:>14}{new:>8.1f}   saves {old - new:.1f} ({1 - new / old:.0%})")
+    overhead = results['dict_per_key']
+    source_saving = 1 - (results['source']['SourceEntry'] - overhead) / (results['source']['tuple'] - overhead)
+    print(f"Both include the dict's own {overhead:.1f} bytes per key, which the records leave untouched.")
+    print(f"Sources save little because a 3-tuple is already compact: {source_saving:.0%} of the entry itself.")
+    print("Stored through the API (baseline: the pre-record dict/tuple/list layout, no index or timestamps)")
+    for name, sizes in results['stored'].items():
+        baseline, current = sizes['baseline'], sizes['current']
+        print(f"{name:<24}{'baseline':>12}{baseline:>8.1f}{'current':>14}{current:>8.1f}   {current / baseline:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+# report_scaling.py
+"""
+Measures batch report generation throughput and speedup as the number of worker
+processes grows, on a synthetic population saved as a snapshot.
+
+Usage: python benchmarks/reportScaling.py [--users N] [--workers 1,2,4] [--fmt png|svg] [--json]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from batchReports import generate_reports  # noqa: E402
+from snapshot import save_snapshot  # noqa: E402
+from syntheticData import build_users  # noqa: E402
+
+
+def default_workers():
+    """1, 2, 4, ... up to the number of cores (always including it)."""
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 < cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--workers', type=lambda text: [int(n) for n in text.split(',')], default=default_workers(),
+                        help='comma-separated worker counts to try')
+    parser.add_argument('--shard-size', type=int, default=16)
+    parser.add_argument('--fmt', choices=('png', 'svg'), default='png')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        snapshot_path = save_snapshot(os.path.join(workdir, 'snapshot'), build_users(args.users, np.random.default_rng(args.seed)))
+        for workers in args.workers:
+            output_dir = os.path.join(workdir, f'reports_{workers}')
+            batch = generate_reports(snapshot_path, output_dir, workers=workers, shard_size=args.shard_size, fmt=args.fmt)
+            results.append({
+                'workers': workers,
+                'users': batch.users,
+                'files': batch.files,
+                'seconds': batch.seconds,
+                'users_per_second': batch.users_per_second,
+            })
+
+    # Speedup and efficiency are relative to the first worker count tried (1 by default)
+    baseline = results[0]
+    for result in results:
+        result['speedup'] = baseline['seconds'] / result['seconds']
+        result['efficiency'] = result['speedup'] * baseline['workers'] / result['workers']
+
+    if args.json:
+        print(json.dumps({'cores': os.cpu_count(), 'results': results}, indent=2))
+        return
+
+    print(f"{args.users} users, {os.cpu_count()} cores, {args.fmt} charts")
+    print(f"{'workers':>8}{'seconds':>10}{'users/s':>10}{'speedup':>10}{'efficiency':>12}")
+    for result in results:
+        print(f"{result['workers']:>8}{result['seconds']:>10.2f}{result['users_per_second']:>10.1f}"
+              f"{result['speedup']:>10.2f}{result['efficiency']:>12.0%}")
+
+
+if __name__ == '__main__':
+    main()
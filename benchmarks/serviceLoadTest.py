@@ -0,0 +1,117 @@
+# service_load_test.py
+"""
+Drives a FinancialService through its LocalServer stand-in with many concurrent clients
+and reports p50/p99 latency per route.
+
+Usage: python benchmarks/serviceLoadTest.py [--users N] [--requests N] [--concurrency N]
+                                            [--workers N] [--processes] [--seed N] [--json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from financialService import FinancialService, LocalServer  # noqa: E402
+from syntheticData import build_users  # noqa: E402
+
+# Share of requests per route; the cheap reads dominate, as in production traffic
+MIX = {
+    'totals': 0.35,
+    'score': 0.35,
+    'forecast': 0.15,
+    'payoff': 0.10,
+    'chart': 0.05,
+}
+
+ROUTE_PARAMS = {
+    'totals': {},
+    'score': {},
+    'forecast': {'months': 6},
+    'payoff': {'monthly_budget': 1500},
+    'chart': {'chart': 'plot_debt_progress_line'},
+}
+
+
+async def run(args):
+    rng = np.random.default_rng(args.seed)
+    users = build_users(args.users, rng)
+    routes = list(MIX)
+    plan = rng.choice(len(routes), size=args.requests, p=list(MIX.values()))
+    targets = rng.integers(0, args.users, size=args.requests)
+    latencies = {route: [] for route in routes}
+    errors = 0
+
+    async with FinancialService(max_workers=args.workers, use_processes=args.processes) as service:
+        for user_id, health in users.items():
+            service.register(user_id, health)
+        server = LocalServer(service)
+        next_request = iter(range(args.requests))
+
+        async def client():
+            nonlocal errors
+            for i in next_request:
+                route = routes[plan[i]]
+                response = await server.handle(route, int(targets[i]), **ROUTE_PARAMS[route])
+                if response.status != 200:
+                    errors += 1
+                latencies[route].append(response.latency)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+
+    def summary(samples):
+        samples = np.array(samples) * 1000
+        return {
+            'count': len(samples),
+            'p50_ms': float(np.percentile(samples, 50)) if len(samples) else None,
+            'p99_ms': float(np.percentile(samples, 99)) if len(samples) else None,
+        }
+
+    return {
+        'users': args.users,
+        'requests': args.requests,
+        'concurrency': args.concurrency,
+        'workers': args.workers,
+        'pool': 'process' if args.processes else 'thread',
+        'seconds': elapsed,
+        'requests_per_second': args.requests / elapsed,
+        'errors': errors,
+        'all': summary([latency for samples in latencies.values() for latency in samples]),
+        'routes': {route: summary(samples) for route, samples in latencies.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=64, help='concurrent clients')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='pool size for heavy calls')
+    parser.add_argument('--processes', action='store_true', help='use a process pool instead of threads')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"{result['requests']} requests, {result['concurrency']} clients, {result['workers']} "
+          f"{result['pool']} workers: {result['requests_per_second']:.0f} req/s, {result['errors']} errors")
+    print(f"{'route':<10}{'count':>8}{'p50 (ms)':>12}{'p99 (ms)':>12}")
+    for route, stats in [*result['routes'].items(), ('all', result['all'])]:
+        if stats['count']:
+            print(f"{route:<10}{stats['count']:>8}{stats['p50_ms']:>12.2f}{stats['p99_ms']:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
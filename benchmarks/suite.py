@@ -0,0 +1,270 @@
+# suite.py
+"""
+Times the hot paths of every module on seeded synthetic data at 10^2 to 10^6 sources,
+debts, history months or users, and reports seconds and throughput per case and size.
+Results are JSON-serializable so runs can be saved with --output and compared over time.
+
+Usage: python benchmarks/suite.py [--max-size N] [--cases a,b] [--repeat N] [--seed N]
+                                  [--output results.json] [--json]
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import financialHealth  # noqa: E402
+import forecastEngine  # noqa: E402
+import frequencyEngine  # noqa: E402
+import syntheticData  # noqa: E402
+from budgetManagement import IncomeTracker  # noqa: E402
+
+SIZES = [10 ** exponent for exponent in range(2, 7)]
+
+# Cases that build one Python object per user stop here; their vectorized counterparts go on to 10^6
+PER_OBJECT_MAX_SIZE = 10 ** 5
+
+# Repeated calls per timing of the O(1) reads, so they are long enough to measure
+CALLS = 10_000
+
+
+#-------------------------------------------------------Cases--------------------------------------------------------------------------------------------------------
+# Each case takes (size, rng), builds its data untimed and returns (timed function, items it processes).
+# Timed functions must be safe to run repeatedly on the same data. Printing methods run quiet.
+
+
+def add_income_source(size, rng):
+    names, amounts, frequencies = syntheticData.sources(size, rng)
+
+    def run():
+        tracker = IncomeTracker()
+        for name, amount, frequency in zip(names, amounts, frequencies):
+            tracker.add_income_source(name, amount, frequency)
+    return run, size
+
+
+def add_expense_source(size, rng):
+    names, amounts, frequencies = syntheticData.sources(size, rng)
+
+    def run():
+        tracker = IncomeTracker()
+        for name, amount, frequency in zip(names, amounts, frequencies):
+            tracker.add_expense_source(name, amount, frequency)
+    return run, size
+
+
+def add_expense_sources(size, rng):
+    names, amounts, frequencies = syntheticData.sources(size, rng)
+
+    def run():
+        IncomeTracker().add_expense_sources(names, amounts, frequencies)
+    return run, size
+
+
+def check_budget_alerts(size, rng):
+    tracker = syntheticData.build_tracker(size, rng)
+
+    def run():
+        tracker.check_budget_alerts(quiet=True)
+    return run, size
+
+
+def calculate_disposable_income(size, rng):
+    tracker = syntheticData.build_tracker(size, rng, budgets=False)
+
+    def run():
+        for _ in range(CALLS):
+            tracker.calculate_disposable_income()
+    return run, CALLS
+
+
+def forecast_disposable_income(size, rng):
+    """Uncached forecasts with every model from `size` months of history."""
+    tracker = syntheticData.add_history(IncomeTracker(), size, rng)
+
+    def run():
+        for model in forecastEngine.MODELS:
+            tracker._forecast_cache.clear()
+            tracker.forecast_disposable_income(12, model)
+    return run, len(forecastEngine.MODELS)
+
+
+def forecast_population(size, rng):
+    """Forecasts with every model for `size` users with two years of history each."""
+    history = rng.uniform(1000, 8000, (size, 24))
+
+    def run():
+        for model in forecastEngine.MODELS:
+            forecastEngine.forecast_population(history, 12, model)
+    return run, size * len(forecastEngine.MODELS)
+
+
+def to_monthly(size, rng):
+    """Exact calendar month totals of `size` amounts with mixed frequencies and months."""
+    amounts = rng.uniform(10, 5000, size)
+    frequencies = np.array(frequencyEngine.FREQUENCIES)[rng.integers(0, len(frequencyEngine.FREQUENCIES), size)]
+    months = rng.integers(1, 13, size)
+
+    def run():
+        frequencyEngine.to_monthly(amounts, frequencies, 2024, months)
+    return run, size
+
+
+def prioritize_debts(size, rng):
+    manager = syntheticData.build_debt_manager(size, rng)
+
+    def run():
+        manager.prioritize_debts(quiet=True)
+    return run, size
+
+
+def make_payment(size, rng):
+    manager = syntheticData.build_debt_manager(size, rng)
+    names = list(manager.debts)
+
+    def run():
+        for name in names:
+            manager.make_payment(name, 10, 0)
+    return run, size
+
+
+def calculate_payoff_time(size, rng):
+    manager = syntheticData.build_debt_manager(size, rng)
+    names = list(manager.debts)
+
+    def run():
+        for name in names:
+            manager.calculate_payoff_time(name, 500, quiet=True)
+    return run, size
+
+
+def payoff_time_grid(size, rng):
+    manager = syntheticData.build_debt_manager(size, rng)
+    payments = [250, 500, 1000, 2000]
+
+    def run():
+        manager.payoff_time_grid(payments)
+    return run, size * len(payments)
+
+
+def calculate_financial_health_score(size, rng):
+    population = syntheticData.build_population(size, rng)
+
+    def run():
+        for health in population:
+            health.calculate_financial_health_score()
+    return run, size
+
+
+def calculate_financial_health_scores(size, rng):
+    columns = syntheticData.score_columns(size, rng)
+
+    def run():
+        financialHealth.calculate_financial_health_scores(*columns)
+    return run, size
+
+
+# name -> (case, largest size it runs at)
+CASES = {
+    'add_income_source': (add_income_source, None),
+    'add_expense_source': (add_expense_source, None),
+    'add_expense_sources': (add_expense_sources, None),
+    'check_budget_alerts': (check_budget_alerts, None),
+    'calculate_disposable_income': (calculate_disposable_income, None),
+    'forecast_disposable_income': (forecast_disposable_income, None),
+    'forecast_population': (forecast_population, None),
+    'to_monthly': (to_monthly, None),
+    'prioritize_debts': (prioritize_debts, None),
+    'make_payment': (make_payment, None),
+    'calculate_payoff_time': (calculate_payoff_time, None),
+    'payoff_time_grid': (payoff_time_grid, None),
+    'calculate_financial_health_score': (calculate_financial_health_score, PER_OBJECT_MAX_SIZE),
+    'calculate_financial_health_scores': (calculate_financial_health_scores, None),
+}
+
+#-------------------------------------------------------Runner-------------------------------------------------------------------------------------------------------
+
+
+def run_case(name, size, repeat, seed):
+    """Builds a case at one size and times `repeat` runs of it."""
+    case, _ = CASES[name]
+    run, items = case(size, np.random.default_rng(seed))
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    best = min(samples)
+    return {
+        'case': name,
+        'size': size,
+        'items': items,
+        'min_s': best,
+        'median_s': statistics.median(samples),
+        'ns_per_item': best / items * 1e9,
+        'items_per_second': items / best if best else None,
+    }
+
+
+def environment():
+    """What a result depends on besides the code: versions, machine and commit."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'cores': os.cpu_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--max-size', type=float, default=10 ** 6, help='largest size to run (e.g. 1e4)')
+    parser.add_argument('--cases', type=lambda text: text.split(','), default=list(CASES),
+                        help='comma-separated case names (default: all)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='also write the JSON results to this file')
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    args = parser.parse_args()
+
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)} (choose from {', '.join(CASES)})")
+
+    results = []
+    for name in args.cases:
+        case_max_size = CASES[name][1] or args.max_size
+        for size in SIZES:
+            if size > min(args.max_size, case_max_size):
+                break
+            result = run_case(name, size, args.repeat, args.seed)
+            results.append(result)
+            if not args.json:
+                print(f"{name:<36}{size:>10,}{result['min_s']:>12.4f} s{result['ns_per_item']:>14,.0f} ns/item", flush=True)
+
+    report = {'environment': environment(), 'repeat': args.repeat, 'seed': args.seed, 'results': results}
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+# synthetic_data.py
+"""
+Seeded generators of synthetic sources, debts, histories and users shared by the benchmarks.
+Every generator takes a numpy Generator, so the same seed always builds the same data.
+"""
+import contextlib
+import io
+import os
+import sys
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from budgetManagement import IncomeTracker  # noqa: E402
+from debtManagement import DebtManagement  # noqa: E402
+from financialHealth import FinancialHealth  # noqa: E402
+
+FREQUENCIES = np.array(['D', 'W', 'M', 'Y'])
+
+
+def sources(count, rng, prefix='Source'):
+    """(names, amounts, frequencies) of `count` distinct sources."""
+    names = [f"{prefix} {i}" for i in range(count)]
+    amounts = rng.uniform(10, 5000, count).round(2)
+    frequencies = FREQUENCIES[rng.integers(0, len(FREQUENCIES), count)]
+    return names, amounts.tolist(), frequencies.tolist()
+
+
+def build_tracker(count, rng, budgets=True):
+    """An IncomeTracker with `count` income and `count` expense sources, every expense budgeted."""
+    tracker = IncomeTracker()
+    tracker.add_income_sources(*sources(count, rng, 'Income'))
+    names, amounts, frequencies = sources(count, rng, 'Expense')
+    tracker.add_expense_sources(names, amounts, frequencies)
+    if budgets:
+        # Budgets between 70% and 130% of the spending, so all alert kinds occur
+        for name, amount in zip(names, amounts):
+            tracker.set_budget(name, amount / rng.uniform(0.7, 1.3))
+    return tracker
+
+
+def add_history(tracker, months, rng):
+    """Appends `months` months of income and expense history to a tracker."""
+    income = rng.uniform(2000, 8000, months)
+    expenses = rng.uniform(1000, 5000, months)
+    for month in range(months):
+        tracker.add_historical_data(income[month], expenses[month], month)
+    return tracker
+
+
+def debts(count, rng):
+    """(names, balances, interest rates, urgencies) of `count` debts."""
+    names = [f"Debt {i}" for i in range(count)]
+    balances = rng.integers(500, 20000, count).astype(float).tolist()
+    rates = rng.uniform(2, 25, count).round(2).tolist()
+    urgencies = rng.integers(1, 4, count).tolist()
+    return names, balances, rates, urgencies
+
+
+def build_debt_manager(count, rng):
+    """A DebtManagement holding `count` debts."""
+    manager = DebtManagement()
+    for name, balance, rate, urgency in zip(*debts(count, rng)):
+        manager.add_debt(name, balance, rate, urgency, 0)
+    return manager
+
+
+def build_population(count, rng):
+    """`count` minimal FinancialHealth objects (one income, one expense, savings and debts)."""
+    income = rng.uniform(2000, 8000, count).tolist()
+    rent = rng.uniform(800, 2500, count).tolist()
+    savings, liquid_assets, total_debts, _ = (column.tolist() for column in score_columns(count, rng))
+    population = []
+    for i in range(count):
+        tracker = IncomeTracker()
+        tracker.add_income_source("Salary", income[i], 'M')
+        tracker.add_expense_source("Rent", rent[i], 'M')
+        health = FinancialHealth(tracker)
+        health.update_savings(savings[i], 0)
+        health.update_liquid_assets(liquid_assets[i])
+        health.update_total_debts(total_debts[i], 0)
+        population.append(health)
+    return population
+
+
+def score_columns(count, rng):
+    """(savings, liquid_assets, total_debts, monthly_expenses) columns of a population of `count` users."""
+    return (rng.uniform(0, 50000, count), rng.uniform(0, 10000, count),
+            rng.uniform(0, 60000, count), rng.uniform(500, 8000, count))
+
+
+def build_users(count, rng):
+    """Creates `count` users with a few sources, a year of history and some debts."""
+    users = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for user_id in range(count):
+            tracker = IncomeTracker()
+            tracker.add_income_source("Salary", float(rng.integers(2000, 8000)), 'M')
+            tracker.add_expense_source("Rent", float(rng.integers(800, 2500)), 'M')
+            tracker.add_expense_source("Groceries", float(rng.integers(50, 150)), 'W')
+            for month in range(12):
+                tracker.add_historical_data(rng.uniform(2000, 8000), rng.uniform(1000, 5000), month)
+            health = FinancialHealth(tracker)
+            health.update_savings(float(rng.integers(0, 20000)))
+            health.update_liquid_assets(float(rng.integers(0, 5000)))
+            for debt in range(int(rng.integers(1, 5))):
+                health.debt_manager.add_debt(f"Debt {debt}", float(rng.integers(500, 20000)), float(rng.uniform(2, 25)))
+                health.debt_manager.make_payment(f"Debt {debt}", 100)
+            users[user_id] = health
+    return users
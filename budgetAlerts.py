@@ -0,0 +1,78 @@
+# budget_alerts.py
+import numpy as np
+
+# Alert levels stored in the `level` field of the results
+LEVEL_OK = 0
+LEVEL_APPROACHING = 1
+LEVEL_EXCEEDED = 2
+LEVEL_NAMES = ('OK', 'Approaching', 'Exceeded')
+
+# One record per (user, category) budget pair
+ALERT_DTYPE = np.dtype([
+    ('user_id', np.int64),
+    ('category_id', np.int32),
+    ('utilization', np.float64),  # Spending as a percentage of the budget
+    ('level', np.int8),
+])
+
+
+class BudgetAlertEngine:
+    """
+    Vectorized version of IncomeTracker.check_budget_alerts for a whole population.
+    Results are returned as a structured array and nothing is printed.
+    """
+
+    def __init__(self, approaching_threshold=80, exceeded_threshold=100):
+        """
+        Utilization at or above `approaching_threshold` percent is "approaching";
+        strictly above `exceeded_threshold` percent is "exceeded".
+        """
+        if approaching_threshold > exceeded_threshold:
+            raise ValueError("The approaching threshold cannot be above the exceeded threshold.")
+        self.approaching_threshold = approaching_threshold
+        self.exceeded_threshold = exceeded_threshold
+
+    def evaluate(self, user_ids, category_ids, amounts, budgets, alerts_only=False):
+        """
+        Computes utilization (amount / budget * 100) and the alert level of every budget pair.
+        All arguments are equal-length arrays; with `alerts_only` the OK pairs are dropped.
+        """
+        amounts = np.asarray(amounts, dtype=np.float64)
+        budgets = np.asarray(budgets, dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            utilization = amounts / budgets * 100
+
+        results = np.empty(len(utilization), dtype=ALERT_DTYPE)
+        results['user_id'] = user_ids
+        results['category_id'] = category_ids
+        results['utilization'] = utilization
+        level = results['level']
+        level[:] = LEVEL_OK
+        level[utilization >= self.approaching_threshold] = LEVEL_APPROACHING
+        level[utilization > self.exceeded_threshold] = LEVEL_EXCEEDED
+
+        if alerts_only:
+            results = results[level != LEVEL_OK]
+        return results
+
+    def evaluate_ledger(self, ledger, user_ids, categories, budgets, alerts_only=False):
+        """
+        Evaluates budgets against the expense amounts stored in a PopulationLedger.
+        Like check_budget_alerts, budgets without a matching expense are skipped.
+        """
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        budgets = np.asarray(budgets, dtype=np.float64)
+        category_ids, amounts = ledger.expenses.get_amounts(user_ids, categories)
+        matched = ~np.isnan(amounts)
+        return self.evaluate(
+            user_ids[matched],
+            category_ids[matched],
+            amounts[matched],
+            budgets[matched],
+            alerts_only=alerts_only,
+        )
+
+    def count_by_level(self, results):
+        """Returns how many pairs fall in each alert level, keyed by level name."""
+        counts = np.bincount(results['level'], minlength=len(LEVEL_NAMES))
+        return {name: int(count) for name, count in zip(LEVEL_NAMES, counts)}
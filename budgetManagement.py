@@ -1,12 +1,65 @@
-import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import utilities
+from records import SourceEntry
 import datetime
-from matplotlib.patches import Patch
+import forecastEngine
+import frequencyEngine
+from typing import NamedTuple
+from timeSeries import TimeSeries
+
+# Plotting libraries are imported on first use, so compute-only callers never load them
+mpl = utilities.LazyModule("matplotlib")
+plt = utilities.LazyModule("matplotlib.pyplot")
+mpatches = utilities.LazyModule("matplotlib.patches")
+
+class BudgetAlert(NamedTuple):
+    """One alert of IncomeTracker.check_budget_alerts."""
+    category: str
+    utilization: float  # Spending as a percentage of the budget
+    exceeded: bool  # True above 100%, False when approaching (80% to 100%)
+
+
+class DisposableIncomeSummary(NamedTuple):
+    """Figures behind IncomeTracker.disposable_income_summary."""
+    disposable_income: float
+    savings_contributions: float  # Contributions actually covered by the disposable income
+    money_left_to_invest: float
+
+
+class DeficitAlert(NamedTuple):
+    """One projected deficit of IncomeTracker.forecast_alerts."""
+    month: int  # 1-based month of the forecast
+    deficit: float
+
+#-------------------------------------------------------Text Formatters------------------------------------------------------------------------------------------
+# Human-readable text for the records above, printed by the methods unless they are quiet
+
+
+def format_budget_alert(alert):
+    """Formats a BudgetAlert."""
+    if alert.exceeded:
+        return f"Exceeded budget for {alert.category}! Spending is at {alert.utilization:.2f}% of the budget."
+    return f"Approaching budget limit for {alert.category}. Spending is at {alert.utilization:.2f}% of the budget."
+
+
+def format_disposable_income_summary(summary):
+    """Formats the investment suggestion of a DisposableIncomeSummary."""
+    if summary.money_left_to_invest > 0:
+        return f"Suggestion: You can consider investing ${summary.money_left_to_invest:.2f} into stocks, mutual funds, or other investments based on your financial goals."
+    return "Suggestion: Focus on building more savings before considering investments."
+
+
+def format_deficit_alert(alert):
+    """Formats a DeficitAlert."""
+    return f"Alert: You are projected to face a deficit of ${alert.deficit:.2f} in month {alert.month}. Consider adjusting your spending or increasing income."
+
 
 class IncomeTracker:
-    def __init__(self):
+    # Expense categories counted as essential when calculating disposable income
+    ESSENTIAL_EXPENSES = frozenset(['Rent', 'Utilities', 'Debt Payments', 'Groceries', 'Transportation'])
+
+    def __init__(self, history_capacity=None):
+        """`history_capacity` bounds the stored monthly history and the forecasts built on it (None keeps all of it)."""
         self.utilities = utilities.Utilities()
         
         # {Salary: (1000, O, dailySalary), Investment: (500, D, dailyInvestment), Rental Income: (200, M, DailyRentalIncome)}
@@ -14,24 +67,166 @@ class IncomeTracker:
         self.expenses_sources = {}
         self.budgets = {}  # New dictionary to store budgets for each expense category
         
-        self.historical_income = []  # Stores historical income data
-        self.historical_expenses = []  # Stores historical expense data
+        self.historical_income = TimeSeries(capacity=history_capacity)  # Stores historical income data
+        self.historical_expenses = TimeSeries(capacity=history_capacity)  # Stores historical expense data
+        # Running statistics over the history, so forecasts never rescan it
+        self.income_forecaster = forecastEngine.StreamingForecaster()
+        self.expenses_forecaster = forecastEngine.StreamingForecaster()
+        self._history_version = 0  # Bumped by add_historical_data to invalidate cached forecasts
+        self._forecast_cache = {}  # {(history version, months, model): (income, expenses)}
         
         self.savings_contributions = 0
+        # Running daily totals, kept in sync by every add/update/remove
         self.total_income = 0
         self.total_expenses = 0
+        self.total_essential_expenses = 0
+        # Running sums of the raw amounts per frequencyEngine frequency id, for exact monthly roll-ups
+        self.income_by_frequency = [0.0] * len(frequencyEngine.FREQUENCIES)
+        self.expenses_by_frequency = [0.0] * len(frequencyEngine.FREQUENCIES)
 #-------------------------------------------------------Income Tracking--------------------------------------------------------------------------------------------       
+    def _set_income_source(self, source, entry):
+        """Stores an income entry, replacing any previous one without double counting it."""
+        previous = self.income_sources.get(source)
+        if previous is not None:
+            previous = SourceEntry.coerce(previous)  # Entries written directly may be plain tuples
+            self.total_income -= previous.daily_amount
+            self.income_by_frequency[frequencyEngine.frequency_id(previous.frequency)] -= previous.amount
+        self.income_sources[source] = entry
+        self.total_income += entry.daily_amount
+        self.income_by_frequency[frequencyEngine.frequency_id(entry.frequency)] += entry.amount
+
+    def _set_expense_source(self, source, entry):
+        """Stores an expense entry, replacing any previous one without double counting it."""
+        previous = self.expenses_sources.get(source)
+        essential = source in self.ESSENTIAL_EXPENSES
+        if previous is not None:
+            previous = SourceEntry.coerce(previous)
+            self.total_expenses -= previous.daily_amount
+            self.expenses_by_frequency[frequencyEngine.frequency_id(previous.frequency)] -= previous.amount
+            if essential:
+                self.total_essential_expenses -= previous.daily_amount
+        self.expenses_sources[source] = entry
+        self.total_expenses += entry.daily_amount
+        self.expenses_by_frequency[frequencyEngine.frequency_id(entry.frequency)] += entry.amount
+        if essential:
+            self.total_essential_expenses += entry.daily_amount
+
     def add_income_source(self, source, amount, frequency):
+        """Add an income source, or replace it if it already exists."""
         daily_amount = self.utilities.calculate_daily_amount(amount, frequency)
-        self.income_sources[source] = (amount, frequency, daily_amount)
-        self.total_income += daily_amount
+        self._set_income_source(source, SourceEntry(amount, frequency, daily_amount))
         
     def add_expense_source(self, source, amount, frequency):
+        """Add an expense source, or replace it if it already exists."""
         daily_amount = self.utilities.calculate_daily_amount(amount, frequency)
-        self.expenses_sources[source] = (amount, frequency, daily_amount) 
-        self.total_expenses += daily_amount
+        self._set_expense_source(source, SourceEntry(amount, frequency, daily_amount))
+
+    def add_income_sources(self, sources, amounts, frequencies):
+        """Add several income sources at once, converting all frequencies in one vectorized pass."""
+        daily_amounts = self.utilities.calculate_daily_amounts(amounts, frequencies)
+        for source, amount, frequency, daily_amount in zip(
+            sources, np.asarray(amounts).tolist(), np.asarray(frequencies).tolist(), daily_amounts.tolist()
+        ):
+            self._set_income_source(source, SourceEntry(amount, frequency, daily_amount))
+
+    def add_expense_sources(self, sources, amounts, frequencies):
+        """Add several expense sources at once, converting all frequencies in one vectorized pass."""
+        daily_amounts = self.utilities.calculate_daily_amounts(amounts, frequencies)
+        for source, amount, frequency, daily_amount in zip(
+            sources, np.asarray(amounts).tolist(), np.asarray(frequencies).tolist(), daily_amounts.tolist()
+        ):
+            self._set_expense_source(source, SourceEntry(amount, frequency, daily_amount))
+
+    def update_income_source(self, source, amount=None, frequency=None):
+        """Change the amount and/or frequency of an existing income source."""
+        if source not in self.income_sources:
+            print(f"Income source {source} not found.")
+            return
+        old_amount, old_frequency, _ = self.income_sources[source]
+        self.add_income_source(source, old_amount if amount is None else amount,
+                               old_frequency if frequency is None else frequency)
+
+    def update_expense_source(self, source, amount=None, frequency=None):
+        """Change the amount and/or frequency of an existing expense source."""
+        if source not in self.expenses_sources:
+            print(f"Expense source {source} not found.")
+            return
+        old_amount, old_frequency, _ = self.expenses_sources[source]
+        self.add_expense_source(source, old_amount if amount is None else amount,
+                                old_frequency if frequency is None else frequency)
+
+    def remove_income_source(self, source):
+        """Remove an income source and take it out of the running totals."""
+        if source not in self.income_sources:
+            print(f"Income source {source} not found.")
+            return
+        entry = SourceEntry.coerce(self.income_sources.pop(source))
+        self.total_income -= entry.daily_amount
+        self.income_by_frequency[frequencyEngine.frequency_id(entry.frequency)] -= entry.amount
+        if not self.income_sources:
+            self.total_income = 0  # Drop accumulated rounding error
+            self.income_by_frequency = [0.0] * len(frequencyEngine.FREQUENCIES)
+
+    def remove_expense_source(self, source):
+        """Remove an expense source and take it out of the running totals."""
+        if source not in self.expenses_sources:
+            print(f"Expense source {source} not found.")
+            return
+        entry = SourceEntry.coerce(self.expenses_sources.pop(source))
+        self.total_expenses -= entry.daily_amount
+        self.expenses_by_frequency[frequencyEngine.frequency_id(entry.frequency)] -= entry.amount
+        if source in self.ESSENTIAL_EXPENSES:
+            self.total_essential_expenses -= entry.daily_amount
+        if not self.expenses_sources:
+            self.total_expenses = 0  # Drop accumulated rounding error
+            self.total_essential_expenses = 0
+            self.expenses_by_frequency = [0.0] * len(frequencyEngine.FREQUENCIES)
+
+    def get_expense_category_total(self, category):
+        """Returns the daily equivalent spending of one expense category (0 if it is not tracked)."""
+        entry = self.expenses_sources.get(category)
+        return SourceEntry.coerce(entry).daily_amount if entry is not None else 0
+
+    def recalculate_totals(self):
+        """
+        Rebuilds the running totals from the sources, e.g. after editing the dictionaries directly.
+        Entries stored as plain (amount, frequency, daily_amount) tuples are converted to SourceEntry.
+        """
+        self.total_income = 0
+        self.income_by_frequency = [0.0] * len(frequencyEngine.FREQUENCIES)
+        for source, entry in self.income_sources.items():
+            entry = self.income_sources[source] = SourceEntry.coerce(entry)
+            self.total_income += entry.daily_amount
+            self.income_by_frequency[frequencyEngine.frequency_id(entry.frequency)] += entry.amount
+        self.total_expenses = 0
+        self.total_essential_expenses = 0
+        self.expenses_by_frequency = [0.0] * len(frequencyEngine.FREQUENCIES)
+        for source, entry in self.expenses_sources.items():
+            entry = self.expenses_sources[source] = SourceEntry.coerce(entry)
+            self.total_expenses += entry.daily_amount
+            self.expenses_by_frequency[frequencyEngine.frequency_id(entry.frequency)] += entry.amount
+            if source in self.ESSENTIAL_EXPENSES:
+                self.total_essential_expenses += entry.daily_amount
+
+    def get_monthly_income(self, year=None, month=None):
+        """Total recurring income over a calendar month (default: an average month), see frequencyEngine."""
+        return frequencyEngine.monthly_total(self.income_by_frequency, year, month)
+
+    def get_monthly_expenses(self, year=None, month=None):
+        """Total recurring expenses over a calendar month (default: an average month), see frequencyEngine."""
+        return frequencyEngine.monthly_total(self.expenses_by_frequency, year, month)
         
     def pie_chart_distribution(self, isIncome: bool):
+        fig = plt.figure()
+        self.draw_pie_chart_distribution(fig, isIncome)
+        
+        # Show the pie chart
+        plt.show()
+
+    def draw_pie_chart_distribution(self, fig, isIncome: bool):
+        """Draws the income or expense distribution pie chart onto a matplotlib Figure."""
+        ax = fig.add_subplot()
+
         # Calculate the total income or expenses
         if isIncome:
             total = self.total_income
@@ -45,7 +240,7 @@ class IncomeTracker:
         hash_items = list(hashMap.items())  # Convert to a list for indexing
         
         # Define colors for the pie chart slices
-        colors = plt.cm.Paired(range(len(hash_items)))  # Automatically generate distinct colors
+        colors = mpl.colormaps['Paired'](range(len(hash_items)))  # Automatically generate distinct colors
         
         # Calculate the percentage of each source along with its assigned color
         percentages = {key: (value[0] / total * 100, colors[i]) for i, (key, value) in enumerate(hash_items)}
@@ -58,23 +253,30 @@ class IncomeTracker:
         pie_colors = [color for value, color in filtered_percentages.values()]
         
         # Create the pie chart with non-zero values
-        wedges, _, _ = plt.pie(pie_values, autopct='%1.1f%%', colors=pie_colors)
+        wedges, _, _ = ax.pie(pie_values, autopct='%1.1f%%', colors=pie_colors)
         
         # Create custom legend patches to match the colors
-        legend_patches = [Patch(color=percentages[key][1], label=key) for key in percentages.keys()]
+        legend_patches = [mpatches.Patch(color=percentages[key][1], label=key) for key in percentages.keys()]
         
         # Add a legend with custom colored patches
-        plt.legend(handles=legend_patches, loc="center left", bbox_to_anchor=(0.9, 0.5), fontsize=12)
+        ax.legend(handles=legend_patches, loc="center left", bbox_to_anchor=(0.9, 0.5), fontsize=12)
         
         # Enlarge the title of the chart
-        plt.title(title, fontsize=18)
-        
-        plt.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
+        ax.set_title(title, fontsize=18)
         
-        # Show the pie chart
-        plt.show()
+        ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
 
     def bar_graph_income_vs_expenses1(self):
+        fig = plt.figure(figsize=(10, 6))
+        self.draw_bar_graph_income_vs_expenses1(fig)
+
+        # Display the bar graph
+        plt.show()
+
+    def draw_bar_graph_income_vs_expenses1(self, fig):
+        """Draws the segmented income vs expenses bar graph onto a matplotlib Figure."""
+        ax = fig.add_subplot()
+
         # Get income and expense sources separately
         income_sources = {key: value[2] for key, value in self.income_sources.items()}
         expense_sources = {key: value[2] for key, value in self.expenses_sources.items()}
@@ -88,36 +290,42 @@ class IncomeTracker:
         # Combine sorted income and expenses
         all_sorted_categories = [item[0] for item in sorted_income] + [item[0] for item in sorted_expenses]
         
-        # Create a DataFrame for the bar graph, ensuring alignment of categories
-        data = {
-            'Income': [income_sources.get(category, 0) for category in all_sorted_categories],
-            'Expenses': [-expense_sources.get(category, 0) for category in all_sorted_categories]  # Negative for expenses
-        }
-        
-        # Create a DataFrame with the correct order
-        df = pd.DataFrame(data, index=all_sorted_categories)
+        # Income and expense amounts aligned on the combined categories
+        income = [income_sources.get(category, 0) for category in all_sorted_categories]
+        expenses = [-expense_sources.get(category, 0) for category in all_sorted_categories]  # Negative for expenses
 
-        # Plot the bar graph
-        ax = df.plot(kind='bar', stacked=True, figsize=(10, 6), color=['green', 'red'])
+        # Plot the bar graph (income above the axis, expenses below), drawn on the axes directly
+        # rather than through DataFrame.plot, which would load pyplot
+        positions = np.arange(len(all_sorted_categories))
+        ax.bar(positions, income, width=0.5, color='green')
+        ax.bar(positions, expenses, width=0.5, color='red')
+        ax.set_xticks(positions)
+        ax.set_xticklabels(all_sorted_categories, rotation=90)
 
         # Add legends for income and expenses
-        income_legend = [Patch(color='green', label=key) for key, _ in sorted_income]
-        expense_legend = [Patch(color='red', label=key) for key, _ in sorted_expenses]
+        income_legend = [mpatches.Patch(color='green', label=key) for key, _ in sorted_income]
+        expense_legend = [mpatches.Patch(color='red', label=key) for key, _ in sorted_expenses]
 
         # Add separate legend boxes
-        income_legend_box = plt.legend(handles=income_legend, loc="upper left", title="Income", bbox_to_anchor=(0.75, 1), fontsize=10)
-        plt.gca().add_artist(income_legend_box)  # To keep both legends
-        plt.legend(handles=expense_legend, loc="upper right", title="Expenses", bbox_to_anchor=(0.25, 0.5), fontsize=10)
+        income_legend_box = ax.legend(handles=income_legend, loc="upper left", title="Income", bbox_to_anchor=(0.75, 1), fontsize=10)
+        ax.add_artist(income_legend_box)  # To keep both legends
+        ax.legend(handles=expense_legend, loc="upper right", title="Expenses", bbox_to_anchor=(0.25, 0.5), fontsize=10)
 
         # Add labels and title
-        plt.xlabel('Categories')
-        plt.ylabel('Amount (Daily Equivalent)')
-        plt.title('Segmented Income vs Expenses')
+        ax.set_xlabel('Categories')
+        ax.set_ylabel('Amount (Daily Equivalent)')
+        ax.set_title('Segmented Income vs Expenses')
+        fig.tight_layout()
 
-        # Display the bar graph
+    def bar_graph_income_vs_expenses2(self):
+        fig = plt.figure()
+        self.draw_bar_graph_income_vs_expenses2(fig)
+
+        # Show the plot
         plt.show()
 
-    def bar_graph_income_vs_expenses2(self):
+    def draw_bar_graph_income_vs_expenses2(self, fig):
+        """Draws the stacked income and expenses breakdown onto a matplotlib Figure."""
         # Get income and expense sources separately
         income_sources = {key: value[2] for key, value in self.income_sources.items()}
         expense_sources = {key: value[2] for key, value in self.expenses_sources.items()}
@@ -136,8 +344,8 @@ class IncomeTracker:
         income_colors = ['#ff9999','#66b3ff','#99ff99', '#ffcc99']
         expense_colors = ['#c2c2f0','#ffb3e6','#c4e17f', '#ff9999']
 
-        # Create figure and axis
-        fig, ax = plt.subplots()
+        # Create the axis
+        ax = fig.add_subplot()
 
         # Plot the stacked bar for income categories
         income_bottom = 0
@@ -158,9 +366,7 @@ class IncomeTracker:
         # Display legend
         ax.legend(loc='upper right', bbox_to_anchor=(1.15, 1))
 
-        # Show the plot
-        plt.tight_layout()
-        plt.show()
+        fig.tight_layout()
 #-------------------------------------------------Budget Setting & Comparison---------------------------------------------------------------------------------------
 
     def set_budget(self, category, amount):
@@ -169,72 +375,75 @@ class IncomeTracker:
 
     def budget_progress_bar(self):
         """Displays the budget utilization for each category."""
+        budget_data = self._budget_utilization()
+                
+        # Display progress bars for each category
+        for category, utilized, budget in budget_data:
+            print(f"Category: {category}, Utilized: {utilized:.2f}%, Budget: {budget}")
+        
+        fig = plt.figure()
+        self.draw_budget_progress_bar(fig, budget_data)
+        plt.show()
+
+    def _budget_utilization(self):
+        """Returns (category, utilization % capped at 100, budget) for every budgeted expense."""
         budget_data = []
         
         # Iterate through the expense sources and compare with the budget
-        for category, (amount, frequency, daily_amount) in self.expenses_sources.items():
+        for category, entry in self.expenses_sources.items():
             if category in self.budgets:
                 budget = self.budgets[category]
-                utilized = (amount / budget) * 100  # Calculate utilization percentage
+                utilized = (SourceEntry.coerce(entry).amount / budget) * 100  # Calculate utilization percentage
                 
                 # If budget is exceeded, cap it at 100%
                 utilized = min(utilized, 100)
                 
                 budget_data.append((category, utilized, budget))
-                
-        # Display progress bars for each category
-        for category, utilized, budget in budget_data:
-            print(f"Category: {category}, Utilized: {utilized:.2f}%, Budget: {budget}")
-        
+        return budget_data
+
+    def draw_budget_progress_bar(self, fig, budget_data=None):
+        """Draws the budget utilization bars onto a matplotlib Figure."""
+        if budget_data is None:
+            budget_data = self._budget_utilization()
+        ax = fig.add_subplot()
+
         # Visual progress bar using matplotlib
         categories = [item[0] for item in budget_data]
         utilization = [item[1] for item in budget_data]
         
-        plt.bar(categories, utilization, color='blue')
-        plt.axhline(y=100, color='r', linestyle='--')  # Reference line at 100%
-        plt.ylabel('Budget Utilization (%)')
-        plt.title('Budget Utilization by Category')
-        plt.show()
+        ax.bar(categories, utilization, color='blue')
+        ax.axhline(y=100, color='r', linestyle='--')  # Reference line at 100%
+        ax.set_ylabel('Budget Utilization (%)')
+        ax.set_title('Budget Utilization by Category')
 
-    def check_budget_alerts(self):
-        """Check for budget alerts: approaching or exceeding the budget."""
+    def check_budget_alerts(self, quiet=None):
+        """
+        Check for budget alerts: approaching or exceeding the budget.
+        Returns a list of BudgetAlert, printed unless quiet (see utilities.should_print).
+        """
         alerts = []
-        for category, (amount, _, _) in self.expenses_sources.items():
+        for category, entry in self.expenses_sources.items():
             if category in self.budgets:
                 budget = self.budgets[category]
-                utilization = (amount / budget) * 100
+                utilization = (SourceEntry.coerce(entry).amount / budget) * 100
                 
-                if utilization > 100:
-                    alerts.append(f"Exceeded budget for {category}! Spending is at {utilization:.2f}% of the budget.")
-                elif utilization >= 80:
-                    alerts.append(f"Approaching budget limit for {category}. Spending is at {utilization:.2f}% of the budget.")
+                if utilization >= 80:
+                    alerts.append(BudgetAlert(category, utilization, utilization > 100))
         
         # Display all alerts
-        for alert in alerts:
-            print(alert)
+        if alerts and utilities.should_print(quiet):
+            print("\n".join(format_budget_alert(alert) for alert in alerts))
+        return alerts
          
 #-------------------------------------------------Real-Time Budget Comparison----------------------------------------------------------------------------------------
         
     def real_time_budget_comparison(self):
         """Display a real-time comparison of total income vs total expenses."""
-        total_income = sum([income[2] for income in self.income_sources.values()])
-        total_expenses = sum([expense[2] for expense in self.expenses_sources.values()])
-        
-        # Create a bar chart for income vs expenses
-        categories = ['Total Income', 'Total Expenses']
-        amounts = [total_income, total_expenses]
+        total_income = self.total_income
+        total_expenses = self.total_expenses
         
-        # Color coding for surplus/deficit indication
-        if total_income > total_expenses:
-            bar_colors = ['green','green']
-        elif total_income == total_expenses:
-            bar_colors = ['yellow','yellow']
-        else:
-            bar_colors = ['red','red']
-        
-        plt.bar(categories, amounts, color=bar_colors)
-        plt.title('Real-Time Budget Comparison')
-        plt.ylabel('Amount (Daily Equivalent)')
+        fig = plt.figure()
+        self.draw_real_time_budget_comparison(fig)
         
         # Determine surplus/deficit message
         if total_income > total_expenses:
@@ -251,11 +460,33 @@ class IncomeTracker:
         
         print(msg)
         
-        # Adjust plot layout to make space for the suggestion text
-        plt.subplots_adjust(bottom=0.2)
-        
         # Show the plot
         plt.show()
+
+    def draw_real_time_budget_comparison(self, fig):
+        """Draws the total income vs total expenses bars onto a matplotlib Figure."""
+        total_income = self.total_income
+        total_expenses = self.total_expenses
+        ax = fig.add_subplot()
+
+        # Create a bar chart for income vs expenses
+        categories = ['Total Income', 'Total Expenses']
+        amounts = [total_income, total_expenses]
+        
+        # Color coding for surplus/deficit indication
+        if total_income > total_expenses:
+            bar_colors = ['green','green']
+        elif total_income == total_expenses:
+            bar_colors = ['yellow','yellow']
+        else:
+            bar_colors = ['red','red']
+        
+        ax.bar(categories, amounts, color=bar_colors)
+        ax.set_title('Real-Time Budget Comparison')
+        ax.set_ylabel('Amount (Daily Equivalent)')
+
+        # Adjust plot layout to make space for the suggestion text
+        fig.subplots_adjust(bottom=0.2)
              
     def suggest_adjustments(self, total_income, total_expenses):
         """Provide suggestions to avoid or reduce a deficit."""
@@ -281,14 +512,7 @@ class IncomeTracker:
 
     def calculate_disposable_income(self):
         """Calculate disposable income (income minus essential expenses)."""
-        essential_expenses = ['Rent', 'Utilities', 'Debt Payments', 'Groceries', 'Transportation']
-        
-        total_essential_expenses = sum(
-            value[2] for key, value in self.expenses_sources.items() if key in essential_expenses
-        )
-        total_income = sum([income[2] for income in self.income_sources.values()])
-        
-        disposable_income = total_income - total_essential_expenses
+        disposable_income = self.total_income - self.total_essential_expenses
         return max(0, disposable_income)  # Ensure disposable income cannot be negative
     
     def calculate_money_left_to_invest(self, disposable_income):
@@ -297,16 +521,42 @@ class IncomeTracker:
         savings_contributions = min(self.savings_contributions, disposable_income)
         return max(0, disposable_income - savings_contributions)
 
-    def disposable_income_summary(self):
-        """Display a summary of disposable income, savings, and investment options."""
+    def get_disposable_income_summary(self):
+        """Returns the DisposableIncomeSummary without drawing or printing anything."""
+        disposable_income = self.calculate_disposable_income()
+        return DisposableIncomeSummary(
+            disposable_income,
+            min(self.savings_contributions, disposable_income),
+            self.calculate_money_left_to_invest(disposable_income),
+        )
+
+    def disposable_income_summary(self, quiet=None):
+        """
+        Display a summary of disposable income, savings, and investment options.
+        Returns the DisposableIncomeSummary; when quiet, neither the chart nor the suggestion is shown.
+        """
+        summary = self.get_disposable_income_summary()
+        if not utilities.should_print(quiet):
+            return summary
+        
+        fig = plt.figure()
+        self.draw_disposable_income_summary(fig)
+        # Show the pie chart
+        plt.show()
+
+        # Provide investment suggestions
+        print(format_disposable_income_summary(summary))
+        return summary
+
+    def draw_disposable_income_summary(self, fig):
+        """Draws the disposable income allocation pie and summary onto a matplotlib Figure."""
         disposable_income = self.calculate_disposable_income()
         money_left_to_invest = self.calculate_money_left_to_invest(disposable_income)
+        ax = fig.add_subplot()
         
         # Adjust savings contributions if they exceed the disposable income
         actual_savings_contributions = min(self.savings_contributions, disposable_income)
         
-
-        
         # Data preparation for the pie chart (filter out zero values)
         allocations = {'Savings Contributions': actual_savings_contributions, 
                        'Money Left to Invest': money_left_to_invest}
@@ -315,21 +565,21 @@ class IncomeTracker:
         # Define colors and labels
         labels = list(filtered_allocations.keys())
         sizes = list(filtered_allocations.values())
-        colors = plt.cm.Paired(range(len(labels)))  # Automatically generate distinct colors
+        colors = mpl.colormaps['Paired'](range(len(labels)))  # Automatically generate distinct colors
         
         # Create the pie chart
-        wedges, _, _ = plt.pie(sizes, autopct='%1.1f%%', colors=colors)
+        wedges, _, _ = ax.pie(sizes, autopct='%1.1f%%', colors=colors)
         
         # Create custom legend patches to match the colors
-        legend_patches = [Patch(color=colors[i], label=label) for i, label in enumerate(labels)]
+        legend_patches = [mpatches.Patch(color=colors[i], label=label) for i, label in enumerate(labels)]
         
         # Add a legend with custom colored patches
-        plt.legend(handles=legend_patches, loc="center left", bbox_to_anchor=(0.9, 0.5), fontsize=12)
+        ax.legend(handles=legend_patches, loc="center left", bbox_to_anchor=(0.9, 0.5), fontsize=12)
         
         # Add the title
-        plt.title('Disposable Income Allocation', fontsize=18)
+        ax.set_title('Disposable Income Allocation', fontsize=18)
         
-        plt.axis('equal')  # Ensure pie chart is circular
+        ax.axis('equal')  # Ensure pie chart is circular
         
         # Print a summary
         summary1 = f"Total Disposable Income: ${disposable_income:.2f}"
@@ -338,48 +588,59 @@ class IncomeTracker:
         
         msg =  f"{summary1}\n{summary2}\n{summary3}"
         
-        # Display the suggestion text below the graph using plt.text()
-        plt.text(0, -1.3, msg, fontsize=12, color="black", ha='center', wrap=True)
-        # Show the pie chart
-        plt.show()
-
-        # Provide investment suggestions
-        if money_left_to_invest > 0:
-            print(f"Suggestion: You can consider investing ${money_left_to_invest:.2f} into stocks, mutual funds, or other investments based on your financial goals.")
-        else:
-            print("Suggestion: Focus on building more savings before considering investments.")
+        # Display the suggestion text below the graph
+        ax.text(0, -1.3, msg, fontsize=12, color="black", ha='center', wrap=True)
 
 #------------------------------------------------Forecasted Budget & Income Projection------------------------------------------------------------------------------
 
-    def add_historical_data(self, income, expenses):
-        """Add historical income and expense data (e.g., from previous months)."""
-        self.historical_income.append(income)
-        self.historical_expenses.append(expenses)
+    def add_historical_data(self, income, expenses, timestamp=None):
+        """Add historical income and expense data (e.g., from previous months), recorded at `timestamp` (defaults to now)."""
+        capacity = self.historical_income.capacity
+        if capacity is not None and len(self.historical_income) == capacity:
+            # The oldest month drops out of the history, so it drops out of the forecasts too
+            # (the value after it restarts the smoothed level; with capacity 1 that is the new one)
+            incomes = self.historical_income.values[:2].tolist() + [income]
+            expense_values = self.historical_expenses.values[:2].tolist() + [expenses]
+            self.income_forecaster.evict(incomes[0], incomes[1])
+            self.expenses_forecaster.evict(expense_values[0], expense_values[1])
+        self.historical_income.append(income, timestamp)
+        self.historical_expenses.append(expenses, timestamp)
+        self.income_forecaster.update(income)
+        self.expenses_forecaster.update(expenses)
+        self._history_version += 1
+        self._forecast_cache.clear()
     
-    def forecast_income_expenses(self, months=6):
-        """Forecast future income and expenses based on historical data."""
-        # Use average of historical income and expenses for forecasting
-        avg_income = np.mean(self.historical_income)
-        avg_expenses = np.mean(self.historical_expenses)
-        
-        # Forecast income and expenses for each of the next 'months'
-        projected_income = [avg_income] * months
-        projected_expenses = [avg_expenses] * months
-        
-        return projected_income, projected_expenses
-
-    def forecast_disposable_income(self, months=6):
+    def forecast_income_expenses(self, months=6, model=forecastEngine.MEAN):
+        """
+        Forecast future income and expenses based on historical data.
+        `model` is one of forecastEngine.MODELS: 'mean' (historical average), 'ses'
+        (exponential smoothing), 'linear' (trend) or 'seasonal_naive' (same month last year).
+        Results are cached until the next add_historical_data call, so the projection,
+        disposable income, plot and alert methods all share one computation.
+        """
+        key = (self._history_version, months, model)
+        cached = self._forecast_cache.get(key)
+        if cached is None:
+            cached = (tuple(self.income_forecaster.forecast(months, model).tolist()),
+                      tuple(self.expenses_forecaster.forecast(months, model).tolist()))
+            self._forecast_cache[key] = cached
+        projected_income, projected_expenses = cached
+        
+        # Return fresh lists so callers can modify them without touching the cache
+        return list(projected_income), list(projected_expenses)
+
+    def forecast_disposable_income(self, months=6, model=forecastEngine.MEAN):
         """Forecast disposable income for the next X months."""
-        projected_income, projected_expenses = self.forecast_income_expenses(months)
+        projected_income, projected_expenses = self.forecast_income_expenses(months, model)
         
         # Calculate projected disposable income (income - expenses)
         projected_disposable_income = [income - expense for income, expense in zip(projected_income, projected_expenses)]
         
         return projected_disposable_income
 
-    def forecast_with_planned_expenses(self, months=6, planned_expenses=None):
+    def forecast_with_planned_expenses(self, months=6, planned_expenses=None, model=forecastEngine.MEAN):
         """Include planned expenses into the forecast."""
-        projected_income, projected_expenses = self.forecast_income_expenses(months)
+        projected_income, projected_expenses = self.forecast_income_expenses(months, model)
         
         # Initialize planned expenses if none provided
         if planned_expenses is None:
@@ -397,37 +658,48 @@ class IncomeTracker:
         
         return projected_disposable_income, adjusted_expenses
     
-    def plot_forecast(self, months=6, planned_expenses=None):
+    def plot_forecast(self, months=6, planned_expenses=None, model=forecastEngine.MEAN):
         """Plot income, expenses, and disposable income forecast."""
-        projected_income, adjusted_expenses = self.forecast_income_expenses(months)
-        projected_disposable_income, _ = self.forecast_with_planned_expenses(months, planned_expenses)
-        
-        months_list = list(range(1, months + 1))
-        
-        # Plot forecast data
-        plt.figure(figsize=(10, 6))
-        
-        plt.plot(months_list, projected_income, label="Projected Income", color="green", marker='o')
-        plt.plot(months_list, adjusted_expenses, label="Projected Expenses", color="red", marker='x')
-        plt.plot(months_list, projected_disposable_income, label="Projected Disposable Income", color="blue", marker='s')
-        
-        plt.xlabel("Months")
-        plt.ylabel("Amount ($)")
-        plt.title(f"Forecast for Next {months} Months")
-        plt.legend()
-        plt.grid(True)
+        fig = plt.figure(figsize=(10, 6))
+        self.draw_forecast(fig, months, planned_expenses, model)
         
         # Show the plot
-        plt.tight_layout()
         plt.show()
 
-    def forecast_alerts(self, months=6, planned_expenses=None):
-        """Check if any future months show a deficit and provide adjustment suggestions."""
-        projected_disposable_income, _ = self.forecast_with_planned_expenses(months, planned_expenses)
+    def draw_forecast(self, fig, months=6, planned_expenses=None, model=forecastEngine.MEAN):
+        """Draws the income, expenses, and disposable income forecast onto a matplotlib Figure."""
+        projected_income, adjusted_expenses = self.forecast_income_expenses(months, model)
+        projected_disposable_income, _ = self.forecast_with_planned_expenses(months, planned_expenses, model)
         
-        for month, disposable_income in enumerate(projected_disposable_income, 1):
-            if disposable_income < 0:
-                print(f"Alert: You are projected to face a deficit of ${-disposable_income:.2f} in month {month}. Consider adjusting your spending or increasing income.")
+        months_list = list(range(1, months + 1))
+        
+        # Plot forecast data
+        ax = fig.add_subplot()
+        
+        ax.plot(months_list, projected_income, label="Projected Income", color="green", marker='o')
+        ax.plot(months_list, adjusted_expenses, label="Projected Expenses", color="red", marker='x')
+        ax.plot(months_list, projected_disposable_income, label="Projected Disposable Income", color="blue", marker='s')
+        
+        ax.set_xlabel("Months")
+        ax.set_ylabel("Amount ($)")
+        ax.set_title(f"Forecast for Next {months} Months")
+        ax.legend()
+        ax.grid(True)
+        
+        fig.tight_layout()
+
+    def forecast_alerts(self, months=6, planned_expenses=None, model=forecastEngine.MEAN, quiet=None):
+        """
+        Check if any future months show a deficit and provide adjustment suggestions.
+        Returns a list of DeficitAlert, printed unless quiet.
+        """
+        projected_disposable_income, _ = self.forecast_with_planned_expenses(months, planned_expenses, model)
+        
+        alerts = [DeficitAlert(month, -disposable_income)
+                  for month, disposable_income in enumerate(projected_disposable_income, 1) if disposable_income < 0]
+        if alerts and utilities.should_print(quiet):
+            print("\n".join(format_deficit_alert(alert) for alert in alerts))
+        return alerts
 
 # #---------------------------------------------------Example Usage---------------------------------------------------------------------------------------------------
 # incomeTrack = IncomeTracker()
@@ -1,118 +1,477 @@
-import pandas as pd
-import matplotlib.pyplot as plt
+import heapq
+from typing import NamedTuple
+
 import numpy as np
+import utilities
+from records import DebtRecord
+from timeSeries import TimeSeries
+
+# Plotting libraries are imported on first use, so compute-only callers never load them
+plt = utilities.LazyModule("matplotlib.pyplot")
+
+# Repayment orders understood by simulate_debt_payoff
+AVALANCHE = 'avalanche'  # Highest interest rate first, as in prioritize_debts
+SNOWBALL = 'snowball'  # Smallest balance first
+
+
+class PayoffSimulation:
+    """Month-by-month result of simulate_debt_payoff. Rows are months, columns are debts."""
+
+    def __init__(self, balances, interest, payments, payoff_month):
+        self.balances = balances  # (months + 1, debts); row 0 holds the starting balances
+        self.interest = interest  # (months, debts) interest accrued in each month
+        self.payments = payments  # (months, debts) amount paid in each month
+        self.payoff_month = payoff_month  # 1-based month each debt reached zero, -1 if never
+        self.total_interest = interest.sum(axis=0)
+
+    @property
+    def months(self):
+        """Number of simulated months."""
+        return self.interest.shape[0]
+
+    @property
+    def debt_free(self):
+        """True if every debt was paid off within the horizon."""
+        return bool((self.payoff_month >= 0).all())
+
+
+def repayment_order(balances, interest_rates, urgencies=None, strategy=AVALANCHE):
+    """
+    Returns debt indices in the order extra money is applied.
+    Avalanche sorts like prioritize_debts (-interest_rate, balance, -urgency);
+    snowball sorts by balance, then by higher interest rate.
+    """
+    balances = np.asarray(balances, dtype=np.float64)
+    interest_rates = np.asarray(interest_rates, dtype=np.float64)
+    urgencies = np.ones_like(balances) if urgencies is None else np.asarray(urgencies, dtype=np.float64)
+    # np.lexsort is stable and sorts by its last key first
+    if strategy == AVALANCHE:
+        return np.lexsort((-urgencies, balances, -interest_rates))
+    if strategy == SNOWBALL:
+        return np.lexsort((-urgencies, -interest_rates, balances))
+    raise ValueError(f"Unknown repayment strategy: {strategy}")
+
+
+def simulate_debt_payoff(balances, interest_rates, monthly_budget, order=AVALANCHE, urgencies=None,
+                         minimum_payments=None, max_months=360):
+    """
+    Simulates paying off all debts at once with a fixed monthly budget.
+    Each month interest accrues (annual rate in percent / 12), every debt receives its
+    minimum payment, and the rest of the budget goes to the debts in repayment order.
+    `order` is AVALANCHE, SNOWBALL or a sequence of debt indices (custom order).
+    """
+    balance = np.array(balances, dtype=np.float64)
+    n = len(balance)
+    interest_rates = np.asarray(interest_rates, dtype=np.float64)
+    monthly_rate = interest_rates / 100 / 12
+    minimum = np.zeros(n) if minimum_payments is None else np.asarray(minimum_payments, dtype=np.float64)
+    if minimum.sum() > monthly_budget:
+        raise ValueError("The monthly budget does not cover the minimum payments.")
+    if isinstance(order, str):
+        order = repayment_order(balance, interest_rates, urgencies, order)
+    else:
+        order = np.asarray(order, dtype=np.int64)
+        if len(order) != n or len(np.unique(order)) != n:
+            raise ValueError("A custom order must list every debt index exactly once.")
+
+    # Simulate with columns already in repayment order, then restore the caller's order at the end
+    balance = balance[order]
+    monthly_rate = monthly_rate[order]
+    minimum = minimum[order]
+    balances_by_month = np.empty((max_months + 1, n))
+    interest_by_month = np.empty((max_months, n))
+    payments_by_month = np.empty((max_months, n))
+    balances_by_month[0] = balance
+    months = max_months
+    for month in range(max_months):
+        interest = interest_by_month[month]
+        np.multiply(balance, monthly_rate, out=interest)
+        balance += interest
+        paid = payments_by_month[month]
+        np.minimum(minimum, balance, out=paid)
+        balance -= paid
+
+        # Spend what is left of the budget in order: each debt gets min(balance, money left)
+        extra = monthly_budget - paid.sum()
+        extra_paid = extra - (np.cumsum(balance) - balance)
+        np.maximum(extra_paid, 0, out=extra_paid)
+        np.minimum(extra_paid, balance, out=extra_paid)
+        balance -= extra_paid
+        paid += extra_paid
+
+        balances_by_month[month + 1] = balance
+        if not balance.any():
+            months = month + 1
+            break
+
+    restore = np.argsort(order)
+    balances_by_month = balances_by_month[:months + 1, restore]
+    interest_by_month = interest_by_month[:months, restore]
+    payments_by_month = payments_by_month[:months, restore]
+    paid_off = balances_by_month == 0
+    payoff_month = np.where(paid_off.any(axis=0), paid_off.argmax(axis=0), -1)
+    return PayoffSimulation(balances_by_month, interest_by_month, payments_by_month, payoff_month)
+
+
+# Returned by payoff_months when the payment does not cover the monthly interest
+PAYOFF_NEVER = -1
+
+
+def payoff_months(balances, interest_rates, payments):
+    """
+    Vectorized calculate_payoff_time: months needed to pay off each balance with a fixed
+    monthly payment, using n = log(p / (p - b * r)) / log(1 + r) rounded up.
+    Arguments broadcast against each other (e.g. debts[:, None] against payments[None, :]).
+    Payments that do not exceed the monthly interest give PAYOFF_NEVER.
+    """
+    balances = np.asarray(balances, dtype=np.float64)
+    payments = np.asarray(payments, dtype=np.float64)
+    monthly_rate = np.asarray(interest_rates, dtype=np.float64) / 100 / 12
+    balances, payments, monthly_rate = np.broadcast_arrays(balances, payments, monthly_rate)
+
+    monthly_interest = balances * monthly_rate
+    payable = payments > monthly_interest
+    with np.errstate(divide='ignore', invalid='ignore'):
+        months = np.log(payments / (payments - monthly_interest)) / np.log(1 + monthly_rate)
+        # Interest-free debts: the formula above is 0 / 0, the answer is simply b / p
+        months = np.where(monthly_rate == 0, balances / payments, months)
+    return np.where(payable, np.ceil(np.where(payable, months, 0)), PAYOFF_NEVER).astype(np.int64)
+
+
+class ExtraPaymentSuggestion(NamedTuple):
+    """One suggestion of DebtManagement.suggest_extra_payments."""
+    name: str
+    extra_payment: float
+    interest_savings: float  # Interest saved this month by the extra payment
+
+
+class PayoffTime(NamedTuple):
+    """Result of DebtManagement.calculate_payoff_time."""
+    name: str
+    monthly_payment: float
+    months: int  # PAYOFF_NEVER if the payment does not cover the monthly interest
+
+#-------------------------------------------------------Text Formatters------------------------------------------------------------------------------------------
+# Human-readable text for the records above, printed by the methods unless they are quiet
+
+
+def format_prioritized_debts(sorted_debts):
+    """Formats the (name, details) pairs returned by prioritize_debts."""
+    lines = ["Prioritized Debt List:"]
+    for debt, details in sorted_debts:
+        lines.append(f"{debt}: Balance = ${details['balance']}, Interest Rate = {details['interest_rate']}%, Urgency = {details['urgency']}")
+    return "\n".join(lines)
+
+
+def format_extra_payment_suggestions(suggestions):
+    """Formats a list of ExtraPaymentSuggestion."""
+    if not suggestions:
+        return "No active debts to suggest extra payments for."
+    lines = ["Extra Payment Suggestions:"]
+    for suggestion in suggestions:
+        lines.append(
+            f"Extra payment of ${suggestion.extra_payment:.2f} towards {suggestion.name} "
+            f"could save you around ${suggestion.interest_savings:.2f} in interest this month."
+        )
+    return "\n".join(lines)
+
+
+def format_payoff_time(payoff):
+    """Formats a PayoffTime."""
+    if payoff.months == PAYOFF_NEVER:
+        return f"Monthly payment of ${payoff.monthly_payment:.2f} is too low to pay off {payoff.name}. Increase the payment amount."
+    return f"Payoff time for {payoff.name} with a monthly payment of ${payoff.monthly_payment:.2f} is approximately {payoff.months} months."
+
+
+class PaymentHistory(TimeSeries):
+    """
+    Balance history of one debt: an unbounded float64 TimeSeries of the balance after each
+    payment. Timestamps never decrease, so time-range queries are binary searches.
+    """
+    __slots__ = ()
+
+    @property
+    def balances(self):
+        """Recorded balances, oldest first (a view)."""
+        return self.values
+
+    def __repr__(self):
+        return f"PaymentHistory({self.values.tolist()})"
+
+
+class DebtPriorityIndex:
+    """
+    Keeps debts ordered like prioritize_debts: (-interest_rate, balance, -urgency), ties
+    broken by insertion order. Changes are O(log n) heap pushes of a new key tuple, and a
+    heap entry is live only while its key is the very tuple stored for the debt, so
+    superseded entries are skipped when popped (even if a debt's key later returns to an
+    old value) and purged once they outnumber the live ones.
+    Iteration reuses the last full order: O(n) while nothing changed, and after changes a
+    re-sort of that order, which is near-linear when few debts moved. Use top_k for the
+    highest-priority few.
+    """
+
+    def __init__(self):
+        self._heap = []  # (key, name) entries, some of them superseded
+        self._keys = {}  # name -> current key; its last item is the insertion number used as tie-breaker
+        self._counter = 0  # Next insertion number; never reused
+        self._order = []  # Names in priority order as of the last iteration
+        self._added = []  # Names inserted since then
+        self._changed = False
+
+    def update(self, name, balance, interest_rate, urgency):
+        """Inserts a debt or re-positions it after its balance, rate or urgency changed."""
+        current = self._keys.get(name)
+        if current is None:
+            sequence = self._counter
+            self._counter += 1
+            self._added.append(name)
+        else:
+            sequence = current[3]
+        key = (-interest_rate, balance, -urgency, sequence)
+        if key == current:
+            return
+        self._keys[name] = key
+        heapq.heappush(self._heap, (key, name))
+        self._changed = True
+        if len(self._heap) > 2 * len(self._keys) + 16:
+            self._rebuild()
+
+    def remove(self, name):
+        """Drops a debt from the index; its heap entry becomes superseded."""
+        if self._keys.pop(name, None) is not None:
+            self._changed = True
+
+    def _rebuild(self):
+        self._heap = [(key, name) for name, key in self._keys.items()]
+        heapq.heapify(self._heap)
+
+    def top_k(self, k):
+        """Returns the names of the k highest-priority debts in O(k log n)."""
+        names = []
+        valid = []
+        while self._heap and len(names) < k:
+            entry = heapq.heappop(self._heap)
+            key, name = entry
+            if self._keys.get(name) is not key:
+                continue  # Superseded by a later update or removal; drop it for good
+            valid.append(entry)
+            names.append(name)
+        for entry in valid:
+            heapq.heappush(self._heap, entry)
+        return names
+
+    def __iter__(self):
+        """Iterates over all debt names in priority order."""
+        if self._changed:
+            keys = self._keys
+            # dict.fromkeys drops names removed and re-added since the last order
+            order = [name for name in dict.fromkeys(self._order + self._added) if name in keys]
+            order.sort(key=keys.__getitem__)
+            self._order, self._added, self._changed = order, [], False
+        return iter(self._order)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, name):
+        return name in self._keys
+
+
+class DebtBook(dict):
+    """
+    The {name: DebtRecord} dict of a DebtManagement. Values stored in it (DebtRecords, or
+    dicts with balance, interest_rate and optional urgency keys) become DebtRecords linked
+    to the priority index, and removing them drops them from it, so direct edits such as
+    debts[name]['interest_rate'] = 20 keep prioritize_debts in order.
+    """
+    __slots__ = ('index',)
+
+    def __init__(self, index, debts=()):
+        super().__init__()
+        self.index = index
+        self.update(debts)
+
+    def __setitem__(self, name, debt):
+        debt = DebtRecord.coerce(debt)
+        previous = self.get(name)
+        if previous is not None and previous is not debt:
+            previous._index = None
+        super().__setitem__(name, debt)
+        debt._name, debt._index = name, self.index
+        self.index.update(name, debt.balance, debt.interest_rate, debt.urgency)
+
+    def _release(self, name, debt):
+        debt._index = None
+        self.index.remove(name)
+
+    def __delitem__(self, name):
+        self._release(name, self[name])
+        super().__delitem__(name)
+
+    def pop(self, name, *default):
+        if name not in self:
+            return super().pop(name, *default)
+        debt = super().pop(name)
+        self._release(name, debt)
+        return debt
+
+    def popitem(self):
+        name, debt = super().popitem()
+        self._release(name, debt)
+        return name, debt
+
+    def setdefault(self, name, default=None):
+        if name not in self:
+            self[name] = default
+        return self[name]
+
+    def update(self, debts=(), **kwargs):
+        for name, debt in dict(debts, **kwargs).items():
+            self[name] = debt
+
+    def __ior__(self, debts):
+        self.update(debts)
+        return self
+
+    def clear(self):
+        for name in list(self):
+            del self[name]
+
+    def __reduce__(self):
+        return DebtBook, (self.index, dict(self))
+
 
 class DebtManagement:
     def __init__(self):
-        self.debts = {}  # Store debts with their balance, interest rate, and urgency (optional)
-        self.debt_history = {}  # Store history of debt payments
+        self.priority_index = DebtPriorityIndex()  # Debts in prioritize_debts order, updated incrementally
+        self.debts = DebtBook(self.priority_index)  # {name: DebtRecord} with the balance, interest rate, and urgency (optional)
+        self.debt_history = {}  # {name: PaymentHistory} of balances after each payment
 
 #-------------------------------------------------------Debt Prioritization--------------------------------------------------------------------------------------------       
 
-    def add_debt(self, name, balance, interest_rate, urgency=1):
+    def add_debt(self, name, balance, interest_rate, urgency=1, timestamp=None):
         """
         Adds a debt with balance, interest rate, and urgency.
         Urgency is optional and defaults to 1.
         """
-        self.debts[name] = {
-            'balance': balance,
-            'interest_rate': interest_rate,
-            'urgency': urgency
-        }
-        self.debt_history[name] = [balance]  # Initialize history with the initial balance
+        self.debts[name] = DebtRecord(balance, interest_rate, urgency)
+        self.debt_history[name] = PaymentHistory()
+        self.debt_history[name].append(balance, timestamp)  # Initialize history with the initial balance
 
-    def prioritize_debts(self):
+    def prioritize_debts(self, quiet=None):
         """
         Prioritizes debts based on interest rate, balance, and urgency.
-        Returns a sorted list of debts.
+        Returns a sorted list of (name, details) pairs, printed unless quiet (see utilities.should_print).
         """
-        # Sort debts by interest rate (descending), then balance (ascending), then urgency (descending)
-        sorted_debts = sorted(
-            self.debts.items(),
-            key=lambda x: (-x[1]['interest_rate'], x[1]['balance'], -x[1]['urgency'])
-        )
+        # Interest rate (descending), then balance (ascending), then urgency (descending), kept by the priority index
+        sorted_debts = [(name, self.debts[name]) for name in self.priority_index]
         
         # Display prioritized debt list
-        print("Prioritized Debt List:")
-        for debt, details in sorted_debts:
-            print(f"{debt}: Balance = ${details['balance']}, Interest Rate = {details['interest_rate']}%, Urgency = {details['urgency']}")
+        if utilities.should_print(quiet):
+            print(format_prioritized_debts(sorted_debts))
         
         return sorted_debts
+
+    def top_priority_debts(self, k):
+        """
+        Returns the k highest-priority debts as (name, details) pairs, without
+        sorting the whole portfolio or printing.
+        """
+        return [(name, self.debts[name]) for name in self.priority_index.top_k(k)]
     
 #-------------------------------------------------------Debt Payment Progress--------------------------------------------------------------------------------------------       
 
-    def make_payment(self, name, payment):
+    def make_payment(self, name, payment, timestamp=None):
         """
         Makes a payment towards a specific debt, reducing its balance.
+        The new balance is recorded in the history at `timestamp` (defaults to now).
         """
         if name in self.debts:
             # Calculate new balance after payment
-            new_balance = max(0, self.debts[name]['balance'] - payment)
-            self.debts[name]['balance'] = new_balance
-            # Record the new balance in the history
-            self.debt_history[name].append(new_balance)
+            debt = self.debts[name]
+            new_balance = max(0, debt.balance - payment)
+            debt.balance = new_balance
+            self.priority_index.update(name, new_balance, debt.interest_rate, debt.urgency)
+            # Record the new balance in the history (started here for debts stored directly in self.debts)
+            history = self.debt_history.get(name)
+            if history is None:
+                history = self.debt_history[name] = PaymentHistory()
+            history.append(new_balance, timestamp)
         else:
             print(f"Debt {name} not found.")
+
+    def balances_between(self, name, start=None, end=None):
+        """Returns (timestamps, balances) recorded for a debt between two dates (inclusive)."""
+        return self.debt_history[name].between(start, end)
+
+    def export_debt_history(self):
+        """Returns {name: (timestamps, balances)} with views onto the history buffers."""
+        return {name: (history.timestamps, history.balances) for name, history in self.debt_history.items()}
     
     def plot_debt_progress(self):
         """
         Plots a bar graph showing the remaining balance of each debt over time.
         """
-        # Find the maximum length of the history lists
-        max_length = max(len(history) for history in self.debt_history.values())
+        fig = plt.figure(figsize=(10, 6))
+        self.draw_debt_progress(fig)
         
-        # Pad all histories with NaN to match the maximum length
-        padded_history = {name: history + [np.nan] * (max_length - len(history))
-                          for name, history in self.debt_history.items()}
-
-        # Prepare data for plotting
-        df = pd.DataFrame(padded_history)
+        # Show the plot
+        plt.show()
 
-        # Plot the bar graph with historical data for each debt
-        df.plot(kind='bar', stacked=True, figsize=(10, 6))
+    def draw_debt_progress(self, fig):
+        """Draws the stacked remaining-balance bars onto a matplotlib Figure."""
+        # Each debt is stacked on the ones before it, over however many payments it has
+        max_length = max(len(history) for history in self.debt_history.values())
+        bottom = np.zeros(max_length)
+
+        ax = fig.add_subplot()
+        for name, history in self.debt_history.items():
+            balances = history.balances
+            positions = np.arange(len(balances))
+            ax.bar(positions, balances, bottom=bottom[:len(balances)], width=0.5, label=name)
+            bottom[:len(balances)] += balances
+        ax.set_xticks(np.arange(max_length))
         
-        plt.title("Debt Payment Progress Over Time")
-        plt.xlabel("Payment Instances")
-        plt.ylabel("Remaining Balance ($)")
-        plt.legend(title="Debt Name")
-        plt.grid(axis='y', linestyle='--', linewidth=0.7)
+        ax.set_title("Debt Payment Progress Over Time")
+        ax.set_xlabel("Payment Instances")
+        ax.set_ylabel("Remaining Balance ($)")
+        ax.legend(title="Debt Name")
+        ax.grid(axis='y', linestyle='--', linewidth=0.7)
         
-        # Show the plot
-        plt.tight_layout()
-        plt.show()
+        fig.tight_layout()
 
     def plot_debt_progress_line(self):
         """
         Plots a line chart showing the remaining balance of each debt over time.
         """
-        # Find the maximum length of the history lists
-        max_length = max(len(history) for history in self.debt_history.values())
+        fig = plt.figure(figsize=(10, 6))
+        self.draw_debt_progress_line(fig)
         
-        # Pad all histories with NaN to match the maximum length
-        padded_history = {name: history + [np.nan] * (max_length - len(history))
-                        for name, history in self.debt_history.items()}
-
-        # Prepare data for plotting
-        df = pd.DataFrame(padded_history)
+        # Show the plot
+        plt.show()
 
-        # Plot the line chart
-        df.plot(kind='line', marker='o', figsize=(10, 6))
+    def draw_debt_progress_line(self, fig):
+        """Draws the remaining-balance lines onto a matplotlib Figure."""
+        # Each debt is drawn straight from its history buffer, whatever its length
+        ax = fig.add_subplot()
+        for name, history in self.debt_history.items():
+            ax.plot(np.arange(len(history)), history.balances, marker='o', label=name)
         
-        plt.title("Debt Payment Progress Over Time")
-        plt.xlabel("Payment Instances")
-        plt.ylabel("Remaining Balance ($)")
-        plt.legend(title="Debt Name")
-        plt.grid(axis='y', linestyle='--', linewidth=0.7)
+        ax.set_title("Debt Payment Progress Over Time")
+        ax.set_xlabel("Payment Instances")
+        ax.set_ylabel("Remaining Balance ($)")
+        ax.legend(title="Debt Name")
+        ax.grid(axis='y', linestyle='--', linewidth=0.7)
         
-        # Show the plot
-        plt.tight_layout()
-        plt.show()
+        fig.tight_layout()
 
 #-------------------------------------------------------Extra Payment Suggestions--------------------------------------------------------------------------------------------       
 
-    def suggest_extra_payments(self, disposable_income, percentage=0.2):
+    def suggest_extra_payments(self, disposable_income, percentage=0.2, quiet=None):
         """
         Suggest extra payments based on disposable income.
+        Returns a list of ExtraPaymentSuggestion, printed unless quiet.
         """
         # Calculate the suggested extra payment amount as a percentage of disposable income
         extra_payment = disposable_income * percentage
@@ -120,71 +479,98 @@ class DebtManagement:
         # Sort debts by interest rate in descending order (focus on highest-interest debts first)
         sorted_debts = sorted(
             self.debts.items(),
-            key=lambda x: -x[1]['interest_rate']
+            key=lambda x: -x[1].interest_rate
         )
         
         suggestions = []
         
         for name, details in sorted_debts:
-            balance = details['balance']
-            interest_rate = details['interest_rate']
+            balance = details.balance
+            interest_rate = details.interest_rate
             
             if balance > 0:
                 # Calculate interest savings if the extra payment is applied to this debt
                 monthly_interest_rate = interest_rate / 12 / 100
                 interest_savings = extra_payment * monthly_interest_rate
                 
-                suggestion = (
-                    f"Extra payment of ${extra_payment:.2f} towards {name} "
-                    f"could save you around ${interest_savings:.2f} in interest this month."
-                )
-                suggestions.append(suggestion)
+                suggestions.append(ExtraPaymentSuggestion(name, extra_payment, interest_savings))
         
         # Display suggestions
-        if suggestions:
-            print("Extra Payment Suggestions:")
-            for suggestion in suggestions:
-                print(suggestion)
-        else:
-            print("No active debts to suggest extra payments for.")
+        if utilities.should_print(quiet):
+            print(format_extra_payment_suggestions(suggestions))
+        
+        return suggestions
 
 #-------------------------------------------------------Debt Payoff Calculator--------------------------------------------------------------------------------------------       
 
-    def calculate_payoff_time(self, name, monthly_payment):
+    def calculate_payoff_time(self, name, monthly_payment, quiet=None):
         """
         Calculates the estimated time to pay off a debt.
+        Returns a PayoffTime, printed unless quiet, or None if the debt does not exist.
         """
         if name not in self.debts:
-            print(f"Debt {name} not found.")
-            return
+            if utilities.should_print(quiet):
+                print(f"Debt {name} not found.")
+            return None
 
-        balance = self.debts[name]['balance']
-        interest_rate = self.debts[name]['interest_rate'] / 100
-        monthly_interest_rate = interest_rate / 12
+        debt = self.debts[name]
+        payoff = PayoffTime(name, monthly_payment, int(payoff_months(debt.balance, debt.interest_rate, monthly_payment)))
+        if utilities.should_print(quiet):
+            print(format_payoff_time(payoff))
+        return payoff
 
-        # Check if the monthly payment is sufficient to reduce the balance
-        if monthly_payment <= balance * monthly_interest_rate:
-            print(f"Monthly payment of ${monthly_payment:.2f} is too low to pay off {name}. Increase the payment amount.")
-            return
-
-        # Calculate the number of months to pay off the debt
-        try:
-            n = np.log(monthly_payment / (monthly_payment - balance * monthly_interest_rate)) / np.log(1 + monthly_interest_rate)
-            n = np.ceil(n)  # Round up to the nearest whole month
-
-            print(f"Payoff time for {name} with a monthly payment of ${monthly_payment:.2f} is approximately {int(n)} months.")
-        except ValueError:
-            print(f"Error calculating payoff time for {name}. Please check the input values.")
+    def payoff_time_grid(self, monthly_payments):
+        """
+        Payoff months for every debt at every payment level in one vectorized call.
+        Returns (debt names, months) where months has one row per debt and one column
+        per payment; PAYOFF_NEVER marks payments too small to cover the interest.
+        """
+        names = list(self.debts)
+        debts = list(self.debts.values())
+        balances = np.array([debt.balance for debt in debts], dtype=np.float64)
+        interest_rates = np.array([debt.interest_rate for debt in debts], dtype=np.float64)
+        payments = np.asarray(monthly_payments, dtype=np.float64)
+        return names, payoff_months(balances[:, None], interest_rates[:, None], payments[None, :])
 
     def show_adjusted_payoff(self, name, monthly_payment, adjustment_percentages=[10, 20, 30]):
         """
         Shows how adjusting the payment amount affects the payoff timeline.
         """
+        if name not in self.debts:
+            print(f"Debt {name} not found.")
+            return
+
+        adjusted_payments = monthly_payment * (1 + np.asarray(adjustment_percentages, dtype=np.float64) / 100)
+        debt = self.debts[name]
+        months = payoff_months(debt.balance, debt.interest_rate, adjusted_payments)
+
         print(f"\nImpact of Payment Adjustments for {name}:")
-        for percentage in adjustment_percentages:
-            adjusted_payment = monthly_payment * (1 + percentage / 100)
+        for percentage, adjusted_payment, n in zip(adjustment_percentages, adjusted_payments, months.tolist()):
             print(f"\nWith a {percentage}% increase:")
-            self.calculate_payoff_time(name, adjusted_payment)
+            print(format_payoff_time(PayoffTime(name, adjusted_payment, n)))
+
+#-------------------------------------------------------Payoff Simulation--------------------------------------------------------------------------------------------       
+
+    def simulate_payoff(self, monthly_budget, strategy=AVALANCHE, minimum_payments=None, max_months=360):
+        """
+        Simulates paying off every debt with a monthly budget, including interest.
+        `strategy` is AVALANCHE, SNOWBALL or a list of debt names (custom order);
+        `minimum_payments` optionally maps debt names to their minimum payment.
+        Returns (debt names, PayoffSimulation); simulation columns follow the names.
+        """
+        names = list(self.debts)
+        debts = list(self.debts.values())
+        balances = [debt.balance for debt in debts]
+        interest_rates = [debt.interest_rate for debt in debts]
+        urgencies = [debt.urgency for debt in debts]
+        if not isinstance(strategy, str):
+            position = {name: i for i, name in enumerate(names)}
+            strategy = [position[name] for name in strategy]
+        if minimum_payments is not None:
+            minimum_payments = [minimum_payments.get(name, 0) for name in names]
+        simulation = simulate_debt_payoff(balances, interest_rates, monthly_budget, strategy, urgencies,
+                                          minimum_payments, max_months)
+        return names, simulation
 
 #---------------------------------------------------Example Usage---------------------------------------------------------------------------------------------------
 
@@ -1,5 +1,45 @@
-import plotly.graph_objects as go
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
+import utilities
+
+# Plotly is imported on first use, so compute-only callers never load it
+go = utilities.LazyModule("plotly.graph_objects")
+pio = utilities.LazyModule("plotly.io")
+
+
+class GoalSimulation:
+    """Outcome of EmergencyFund.simulate_time_to_reach_goal."""
+
+    def __init__(self, months_to_goal, horizon, percentiles, deadline=None):
+        self.months_to_goal = months_to_goal  # Per path; np.inf if the goal is not reached within the horizon
+        self.horizon = horizon
+        self.percentiles = {q: self.percentile(q) for q in percentiles}
+        self.probability_by_deadline = None if deadline is None else self.probability_by(deadline)
+
+    def percentile(self, q):
+        """Months to reach the goal at percentile q (np.inf if beyond the horizon)."""
+        # 'higher' always returns an actual month count, never an interpolation involving inf
+        return float(np.percentile(self.months_to_goal, q, method='higher'))
+
+    def probability_by(self, months):
+        """Share of paths that reach the goal within `months` months."""
+        return float(np.mean(self.months_to_goal <= months))
+
+
+def _simulate_goal_chunk(seed, n_paths, horizon, remaining, mean, std, shock_probability, shock_mean):
+    """Simulates one chunk of savings paths and returns the month each path reaches the goal."""
+    rng = np.random.default_rng(seed)
+    flows = rng.normal(mean, std, size=(n_paths, horizon))
+    np.maximum(flows, 0, out=flows)  # Contributions are never negative; withdrawals come from shocks
+    if shock_probability > 0:
+        shocked = rng.random((n_paths, horizon)) < shock_probability
+        flows[shocked] -= rng.exponential(shock_mean, size=int(shocked.sum()))
+    saved = np.cumsum(flows, axis=1, out=flows)
+    reached = saved >= remaining
+    return np.where(reached.any(axis=1), reached.argmax(axis=1) + 1, np.inf)
+
 
 
 class EmergencyFund():
@@ -20,6 +60,36 @@ class EmergencyFund():
     def get_time_to_reach_goal(self, amount_saved_per_month : float):
         time_to_save = round(self.remaining / amount_saved_per_month, 1)
         return time_to_save
+
+    def simulate_time_to_reach_goal(self, amount_saved_per_month : float, contribution_std : float = 0,
+                                    shock_probability : float = 0, shock_mean : float = 0,
+                                    n_paths : int = 100_000, horizon : int = 120, deadline : int = None,
+                                    percentiles=(10, 50, 90), seed : int = None, workers : int = None,
+                                    chunk_size : int = 10_000):
+        """
+        Monte Carlo version of get_time_to_reach_goal. Each path draws a monthly contribution
+        from Normal(amount_saved_per_month, contribution_std) (floored at 0), and in any month
+        an expense shock ~ Exponential(shock_mean) hits with probability shock_probability.
+        Returns a GoalSimulation with percentiles of months-to-goal and, if `deadline` is given,
+        the probability of reaching the goal within that many months.
+
+        Paths are simulated in chunks of `chunk_size`, each with its own child seed, so a seeded
+        run gives the same result whether it runs in-process or on a pool of `workers` processes.
+        """
+        remaining = self.emergency_fund_goal - self.emergency_fund_progress
+        if remaining <= 0:
+            return GoalSimulation(np.zeros(n_paths), horizon, percentiles, deadline)
+
+        chunks = [min(chunk_size, n_paths - start) for start in range(0, n_paths, chunk_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+        args = [(chunk_seed, size, horizon, remaining, amount_saved_per_month, contribution_std,
+                 shock_probability, shock_mean) for chunk_seed, size in zip(seeds, chunks)]
+        if workers is not None and workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_simulate_goal_chunk, *zip(*args)))
+        else:
+            results = [_simulate_goal_chunk(*chunk_args) for chunk_args in args]
+        return GoalSimulation(np.concatenate(results), horizon, percentiles, deadline)
     
     def emergency_fund_progess_gauge(self):
         progress_perc = round((self.emergency_fund_progress / self.emergency_fund_goal) * 100, 1)
@@ -31,112 +101,54 @@ class EmergencyFund():
     def savings_linear_graph(self, amount_saved_per_month : float):
         self.create_linear_graph(rate = amount_saved_per_month, goal = self.emergency_fund_goal)
 
+    def progress_gauge_figure(self):
+        """Figure dict of emergency_fund_progess_gauge, for batch export."""
+        progress_perc = round((self.emergency_fund_progress / self.emergency_fund_goal) * 100, 1)
+        return self.gauge_figure(progress_perc, 0, 100, title = 'Emergency Fund Progress')
+
+    def savings_progress_bar_figure(self):
+        """Figure dict of emergency_savings_progress_bar, for batch export."""
+        return self.progress_bar_figure(value = self.emergency_fund_progress, max_value = self.emergency_fund_goal, title = "Amount Saved vs Goal")
+
+    def savings_linear_graph_figure(self, amount_saved_per_month : float):
+        """Figure dict of savings_linear_graph, for batch export."""
+        return self.linear_graph_figure(rate = amount_saved_per_month, goal = self.emergency_fund_goal)
+
 
     ''' ====================================== GRAPHS ====================================== '''
-    def create_gauge(self, value : int = 0, min_value : int = 0, max_value :int = 10 , title : str = ""):
-        fig = go.Figure(go.Indicator(
-            mode="number+gauge",
-            value=value,
-            number={
-                'suffix': '%',
-                'font': {'size': 80, 'color': '#333333', 'family': 'Helvetica, Arial, sans-serif'},
-            },
-            gauge={
-                'shape': "angular",
-                'axis': {
-                    'range': [min_value, max_value],
-                    'tickwidth': 2,
-                    'tickcolor': "rgba(0,0,0,0.4)",
-                    'tickvals': [0, 20, 40, 60, 80, 100],
-                    'ticktext': ['0', '20', '40', '60', '80', '100'],
-                },
-                'bar': {
-                    'color': "#3b8eea",
-                    'thickness': 0.65  # Increased thickness for better visibility
-                },
-                'bgcolor': "#E5E5E5",
-                'steps': [
-                    {'range': [min_value, max_value], 'color': "#f5f5f5"},  # Lighter background
-                ],
-            },
-            domain={'x': [0, 1], 'y': [0, 1]}
-        ))
-
-        # Update layout for a refined appearance
-        fig.update_layout(
-            title={
-                'text': title,
-                'y': 0.85,
-                'x': 0.5,
-                'xanchor': 'center',
-                'yanchor': 'top',
-                'font': {'size': 22, 'color': '#555555', 'family': 'Helvetica, Arial, sans-serif'}
-            },
-            font={'family': "Helvetica, Arial, sans-serif"},
-            paper_bgcolor="white",
-            plot_bgcolor="white",
-            width=700,
-            height=500,
-            margin={'t': 100, 'b': 0, 'l': 0, 'r': 0}
-        )
+    # Each chart's layout is built once per process as a template (see _figure_template);
+    # the *_figure methods only patch the per-user values into it, and create_* shows the result.
 
-        fig.show()
+    def gauge_figure(self, value : int = 0, min_value : int = 0, max_value : int = 10, title : str = ""):
+        """Plotly figure dict of the gauge chart."""
+        return _patched(_figure_template('gauge'), {
+            ('data', 0, 'value'): value,
+            ('data', 0, 'gauge', 'axis', 'range'): [min_value, max_value],
+            ('data', 0, 'gauge', 'steps', 0, 'range'): [min_value, max_value],
+            ('layout', 'title', 'text'): title,
+        })
+
+    def create_gauge(self, value : int = 0, min_value : int = 0, max_value :int = 10 , title : str = ""):
+        pio.show(self.gauge_figure(value, min_value, max_value, title), validate=False)
         return 
     # ====================================================================================================
+
+    def progress_bar_figure(self, value: int, max_value: int = 100, title: str = 'Progress'):
+        """Plotly figure dict of the progress bar."""
+        return _patched(_figure_template('progress_bar'), {
+            ('data', 0, 'x'): [value],
+            ('data', 0, 'text'): f'{value}/{max_value}',
+            ('layout', 'title', 'text'): f'{title}: {value}/{max_value}',
+            ('layout', 'xaxis', 'range'): [0, max_value],  # Set the range from 0 to max_value
+        })
         
     def create_progress_bar(self, value: int, max_value: int = 100, title: str = 'Progress'):
-        # Create a bar chart with a single bar representing the progress
-        fig = go.Figure()
-
-        # Add the actual progress bar in blue
-        fig.add_trace(go.Bar(
-            x=[value],
-            y=[''],
-            orientation='h',
-            marker=dict(
-                color="#3b8eea",  # Blue color for the progress
-                line=dict(color='#3b8eea', width=0)
-            ),
-            width=0.5,
-            text=f'{value}/{max_value}',
-            textposition='inside',  # Show text inside the bar for clarity
-            insidetextanchor='middle',
-            textfont=dict(color='white', size = 14),  # Increase font size for better visibility
-            showlegend=False
-        ))
-
-        # Add a layout for the chart
-        fig.update_layout(
-            title={
-                'text': f'{title}: {value}/{max_value}',
-                'x': 0.5,
-                'y': 0.85,
-                'xanchor': 'center',
-                'yanchor': 'top',
-                'font': {'size': 22, 'family': 'Roboto, sans-serif'}
-            },
-            xaxis=dict(
-                range=[0, max_value],  # Set the range from 0 to max_value
-                showgrid=False,
-                zeroline=False,
-                showticklabels=False,  # Hide tick labels for a cleaner look
-                visible=False  # Hide axis lines and labels
-            ),
-            yaxis=dict(
-                showticklabels=False,
-                visible=False
-            ),
-            plot_bgcolor='#f5f5f5',
-            paper_bgcolor='white',
-            height=150,  # Increase height for a thicker bar
-            margin=dict(t=60, b=20, l=20, r=20)
-        )
-
-        fig.show()
+        pio.show(self.progress_bar_figure(value, max_value, title), validate=False)
         return 
 
     # ==================================================================================================== #
-    def create_linear_graph(self, rate : float, goal : float):
+    def linear_graph_figure(self, rate : float, goal : float):
+        """Plotly figure dict of the savings projection line graph."""
         # Calculate time to save in months
         time_to_save = goal / rate
         
@@ -144,58 +156,228 @@ class EmergencyFund():
         months = np.arange(0, time_to_save + 1)
         cumulative_savings = rate * months
 
-        # Create a line graph with plotly
-        fig = go.Figure(go.Scatter(
-            x=months,
-            y=cumulative_savings,
-            mode='lines',
-            line=dict(color='#3b8eea', width=4),
-            name='Cumulative Savings'
-        ))
-
-        # Add a line for the goal amount for visual reference
-        fig.add_hline(y=goal, line=dict(color='red', dash='dash'), annotation_text='Goal Amount', annotation_position='top right')
-
-        # Update layout for better presentation
-        fig.update_layout(
-            title='Projection: Time to Reach Emergency Savings Goal',
-            xaxis_title='Months',
-            yaxis_title='Cumulative Savings ($)',
-            font=dict(family='Roboto, sans-serif', size=14, color='#333333'),
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            width=800,
-            height=500,
-            margin=dict(t=80, b=60, l=60, r=40),
-            xaxis=dict(
-                showgrid=True,
-                gridcolor='lightgray',
-                range=[0, time_to_save],
-                linecolor='black',
-                linewidth=2,
-                showline=True,
-                tickmode='linear',
-                tick0=0,
-                dtick=5,
-            ),
-            yaxis=dict(
-                showgrid=True,
-                gridcolor='lightgray',
-                range=[0, goal],
-                linecolor='black',
-                linewidth=2,
-                showline=True,
-                tickmode='linear',
-                tick0=0,
-                dtick=1000,
-                showticklabels=True,  # Show tick labels for the y-axis
-            )
+        return _patched(_figure_template('linear_graph'), {
+            ('data', 0, 'x'): months,
+            ('data', 0, 'y'): cumulative_savings,
+            ('layout', 'shapes', 0, 'y0'): goal,  # Goal reference line
+            ('layout', 'shapes', 0, 'y1'): goal,
+            ('layout', 'annotations', 0, 'y'): goal,
+            ('layout', 'xaxis', 'range'): [0, time_to_save],
+            ('layout', 'yaxis', 'range'): [0, goal],
+        })
+
+    def create_linear_graph(self, rate : float, goal : float):
+        pio.show(self.linear_graph_figure(rate, goal), validate=False)
+        return
+
+
+#------------------------------------------------------Figure Templates------------------------------------------------------------------------------
+
+def _build_gauge_template():
+    fig = go.Figure(go.Indicator(
+        mode="number+gauge",
+        value=0,
+        number={
+            'suffix': '%',
+            'font': {'size': 80, 'color': '#333333', 'family': 'Helvetica, Arial, sans-serif'},
+        },
+        gauge={
+            'shape': "angular",
+            'axis': {
+                'range': [0, 10],
+                'tickwidth': 2,
+                'tickcolor': "rgba(0,0,0,0.4)",
+                'tickvals': [0, 20, 40, 60, 80, 100],
+                'ticktext': ['0', '20', '40', '60', '80', '100'],
+            },
+            'bar': {
+                'color': "#3b8eea",
+                'thickness': 0.65  # Increased thickness for better visibility
+            },
+            'bgcolor': "#E5E5E5",
+            'steps': [
+                {'range': [0, 10], 'color': "#f5f5f5"},  # Lighter background
+            ],
+        },
+        domain={'x': [0, 1], 'y': [0, 1]}
+    ))
+
+    # Update layout for a refined appearance
+    fig.update_layout(
+        title={
+            'text': "",
+            'y': 0.85,
+            'x': 0.5,
+            'xanchor': 'center',
+            'yanchor': 'top',
+            'font': {'size': 22, 'color': '#555555', 'family': 'Helvetica, Arial, sans-serif'}
+        },
+        font={'family': "Helvetica, Arial, sans-serif"},
+        paper_bgcolor="white",
+        plot_bgcolor="white",
+        width=700,
+        height=500,
+        margin={'t': 100, 'b': 0, 'l': 0, 'r': 0}
+    )
+    return fig
+
+def _build_progress_bar_template():
+    # Create a bar chart with a single bar representing the progress
+    fig = go.Figure()
+
+    # Add the actual progress bar in blue
+    fig.add_trace(go.Bar(
+        x=[0],
+        y=[''],
+        orientation='h',
+        marker=dict(
+            color="#3b8eea",  # Blue color for the progress
+            line=dict(color='#3b8eea', width=0)
+        ),
+        width=0.5,
+        text='',
+        textposition='inside',  # Show text inside the bar for clarity
+        insidetextanchor='middle',
+        textfont=dict(color='white', size = 14),  # Increase font size for better visibility
+        showlegend=False
+    ))
+
+    # Add a layout for the chart
+    fig.update_layout(
+        title={
+            'text': '',
+            'x': 0.5,
+            'y': 0.85,
+            'xanchor': 'center',
+            'yanchor': 'top',
+            'font': {'size': 22, 'family': 'Roboto, sans-serif'}
+        },
+        xaxis=dict(
+            range=[0, 100],
+            showgrid=False,
+            zeroline=False,
+            showticklabels=False,  # Hide tick labels for a cleaner look
+            visible=False  # Hide axis lines and labels
+        ),
+        yaxis=dict(
+            showticklabels=False,
+            visible=False
+        ),
+        plot_bgcolor='#f5f5f5',
+        paper_bgcolor='white',
+        height=150,  # Increase height for a thicker bar
+        margin=dict(t=60, b=20, l=20, r=20)
+    )
+    return fig
+
+def _build_linear_graph_template():
+    # Create a line graph with plotly
+    fig = go.Figure(go.Scatter(
+        x=[],
+        y=[],
+        mode='lines',
+        line=dict(color='#3b8eea', width=4),
+        name='Cumulative Savings'
+    ))
+
+    # Add a line for the goal amount for visual reference
+    fig.add_hline(y=0, line=dict(color='red', dash='dash'), annotation_text='Goal Amount', annotation_position='top right')
+
+    # Update layout for better presentation
+    fig.update_layout(
+        title='Projection: Time to Reach Emergency Savings Goal',
+        xaxis_title='Months',
+        yaxis_title='Cumulative Savings ($)',
+        font=dict(family='Roboto, sans-serif', size=14, color='#333333'),
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        width=800,
+        height=500,
+        margin=dict(t=80, b=60, l=60, r=40),
+        xaxis=dict(
+            showgrid=True,
+            gridcolor='lightgray',
+            range=[0, 1],
+            linecolor='black',
+            linewidth=2,
+            showline=True,
+            tickmode='linear',
+            tick0=0,
+            dtick=5,
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridcolor='lightgray',
+            range=[0, 1],
+            linecolor='black',
+            linewidth=2,
+            showline=True,
+            tickmode='linear',
+            tick0=0,
+            dtick=1000,
+            showticklabels=True,  # Show tick labels for the y-axis
         )
+    )
 
-        # Adjust the zero label visibility
-        fig.update_xaxes(ticks="outside", tickangle=0, tickfont=dict(size=12))
-        fig.update_yaxes(ticks="outside", tickfont=dict(size=12))
+    # Adjust the zero label visibility
+    fig.update_xaxes(ticks="outside", tickangle=0, tickfont=dict(size=12))
+    fig.update_yaxes(ticks="outside", tickfont=dict(size=12))
+    return fig
 
-        fig.show()
-        return
+_TEMPLATE_BUILDERS = {
+    'gauge': _build_gauge_template,
+    'progress_bar': _build_progress_bar_template,
+    'linear_graph': _build_linear_graph_template,
+}
+_templates = {}
+
+def _figure_template(name):
+    """Returns the figure dict of a chart layout, building it on first use."""
+    template = _templates.get(name)
+    if template is None:
+        template = _templates[name] = _TEMPLATE_BUILDERS[name]().to_plotly_json()
+    return template
+
+def _patched(template, patches):
+    """
+    Returns a copy of a figure dict with the values at the given key paths replaced.
+    Only the containers along the patched paths are copied; the rest is shared with the
+    template, so the result must be treated as read-only.
+    """
+    figure = dict(template)
+    copied = {id(figure)}
+    for path, value in patches.items():
+        node = figure
+        for key in path[:-1]:
+            child = node[key]
+            if id(child) not in copied:
+                child = dict(child) if isinstance(child, dict) else list(child)
+                copied.add(id(child))
+                node[key] = child
+            node = child
+        node[path[-1]] = value
+    return figure
+
+#------------------------------------------------------Batch Export------------------------------------------------------------------------------
+
+EXPORT_FORMATS = ('json', 'html')
 
+def export_figures(figures, directory, fmt='json', include_plotlyjs='cdn'):
+    """
+    Writes (name, figure dict) pairs to `directory` as <name>.json figure JSON or <name>.html
+    static pages, without opening a browser. For HTML, `include_plotlyjs` is passed to plotly:
+    'cdn' links the library, 'directory' writes plotly.min.js once next to the pages.
+    Returns the written paths.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}. Use one of {EXPORT_FORMATS}.")
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for name, figure in figures:
+        path = os.path.join(directory, f"{name}.{fmt}")
+        if fmt == 'json':
+            pio.write_json(figure, path, validate=False)
+        else:
+            pio.write_html(figure, path, include_plotlyjs=include_plotlyjs, validate=False, auto_open=False)
+        paths.append(path)
+    return paths
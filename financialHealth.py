@@ -1,16 +1,56 @@
 # financial_health.py
-import matplotlib.pyplot as plt
-import pandas as pd
 import numpy as np
-from matplotlib.patches import Patch
+import utilities
+from typing import NamedTuple
 from budgetManagement import IncomeTracker  # Import the IncomeTracker class
 from emergencyFund import EmergencyFund
 from debtManagement import DebtManagement
+from timeSeries import TimeSeries
+
+# Plotting libraries are imported on first use, so compute-only callers never load them
+mpl = utilities.LazyModule("matplotlib")
+plt = utilities.LazyModule("matplotlib.pyplot")
+mpatches = utilities.LazyModule("matplotlib.patches")
+
+# Recommendation shown by display_financial_health_score for each status
+RECOMMENDATIONS = {
+    "Strong": "Keep up the good work! Consider diversifying your investments.",
+    "Stable": "Focus on increasing savings or paying down debt to improve your financial health.",
+    "At Risk": "Consider reducing monthly expenses and increasing savings to get back on track.",
+}
+
+
+class HealthScoreReport(NamedTuple):
+    """Result of FinancialHealth.display_financial_health_score."""
+    score: float
+    status: str
+    recommendation: str
+
+
+class BankAccount(NamedTuple):
+    """Result of FinancialHealth.add_bank_account."""
+    name: str
+    balance: float
+
+#-------------------------------------------------------Text Formatters------------------------------------------------------------------------------------------
+# Human-readable text for the records above, printed by the methods unless they are quiet
+
+
+def format_health_score_report(report):
+    """Formats a HealthScoreReport."""
+    return f"Financial Health Score: {report.score}\nStatus: {report.status}\nRecommendation: {report.recommendation}"
+
+
+def format_bank_account(account):
+    """Formats a BankAccount update."""
+    return f"Updated {account.name} account with balance: ${account.balance}"
+
 
 class FinancialHealth:
-    def __init__(self, income_tracker):
+    def __init__(self, income_tracker, history_capacity=None):
         """
         Initializes the FinancialHealth with a given IncomeTracker instance.
+        `history_capacity` bounds each stored history (None keeps all of it).
         """
         self.income_tracker = income_tracker
         self.debt_manager = DebtManagement()  # Instantiate DebtManagement
@@ -18,41 +58,51 @@ class FinancialHealth:
         self.liquid_assets = 0
         self.total_debts = 0
         self.bank_accounts = {}  # Store bank account balances
-        self.historical_scores = []  # To store historical scores for plotting
-        self.historical_savings = []  # Store historical savings for trend analysis
-        self.historical_debts = []  # Store historical debt data for trend analysis
+        self.historical_scores = TimeSeries(capacity=history_capacity)  # Recorded scores for plotting
+        self.historical_savings = TimeSeries(capacity=history_capacity)  # Store historical savings for trend analysis
+        self.historical_debts = TimeSeries(capacity=history_capacity)  # Store historical debt data for trend analysis
     
-    def update_savings(self, amount):
+    def update_savings(self, amount, timestamp=None):
         """Updates the user's total savings."""
         self.savings = amount
-        self.historical_savings.append(amount)
+        self.historical_savings.append(amount, timestamp)
 
     def update_liquid_assets(self, amount):
         """Updates the user's total liquid assets."""
         self.liquid_assets = amount
 
-    def update_total_debts(self, amount):
+    def update_total_debts(self, amount, timestamp=None):
         """Updates the user's total debt amount."""
         self.total_debts = amount
-        self.historical_debts.append(amount)
-
-    def get_monthly_income(self):
-        """Fetch the total monthly income using the IncomeTracker instance."""
-        daily_income_total = self.income_tracker.total_income  # Daily equivalent total income
-        monthly_income = daily_income_total * 30  # Approximate monthly income based on 30 days.
-        return monthly_income
-
-    def get_monthly_expenses(self):
-        """Fetch the total monthly expenses using the IncomeTracker instance."""
-        daily_expenses_total = self.income_tracker.total_expenses  # Daily equivalent total expenses
-        monthly_expenses = daily_expenses_total * 30  # Approximate monthly expenses based on 30 days.
+        self.historical_debts.append(amount, timestamp)
+
+    def get_monthly_income(self, year=None, month=None):
+        """Fetch the total income of a calendar month (default: an average month) using the IncomeTracker instance."""
+        return self.income_tracker.get_monthly_income(year, month)
+
+    def get_monthly_expenses(self, year=None, month=None):
+        """Fetch the total expenses of a calendar month (default: an average month) using the IncomeTracker instance."""
+        monthly_expenses = self.income_tracker.get_monthly_expenses(year, month)
         return max(monthly_expenses, 1)  # Default to 1 to avoid division by zero.
 
-    def calculate_financial_health_score(self):
-        """Calculates the user's financial health score."""
-        monthly_expenses = self.get_monthly_expenses()
-        score = (self.savings + self.liquid_assets - self.total_debts) / monthly_expenses
-        self.historical_scores.append(score)
+    def calculate_financial_health_score(self, year=None, month=None):
+        """
+        Calculates the user's financial health score without recording it, against the
+        expenses of the given calendar month (default: an average month).
+        """
+        return round(self._financial_health_score(year, month), 2)
+
+    def _financial_health_score(self, year=None, month=None):
+        monthly_expenses = self.get_monthly_expenses(year, month)
+        return (self.savings + self.liquid_assets - self.total_debts) / monthly_expenses
+
+    def record_financial_health_score(self, timestamp=None, year=None, month=None):
+        """
+        Calculates the score for a calendar month (default: an average month), adds it to
+        historical_scores at `timestamp` (defaults to now) and returns it.
+        """
+        score = self._financial_health_score(year, month)
+        self.historical_scores.append(score, timestamp)
         return round(score, 2)
 
     def get_status_indicator(self, score):
@@ -64,19 +114,17 @@ class FinancialHealth:
         else:
             return "At Risk"
 
-    def display_financial_health_score(self):
-        """Calculates and displays the financial health score and status."""
-        score = self.calculate_financial_health_score()
+    def display_financial_health_score(self, quiet=None, year=None, month=None):
+        """
+        Calculates and displays the financial health score and status for a calendar month (default: an average month).
+        Returns a HealthScoreReport, printed unless quiet (see utilities.should_print).
+        """
+        score = self.calculate_financial_health_score(year, month)
         status = self.get_status_indicator(score)
-        print(f"Financial Health Score: {score}")
-        print(f"Status: {status}")
-
-        if status == "Strong":
-            print("Recommendation: Keep up the good work! Consider diversifying your investments.")
-        elif status == "Stable":
-            print("Recommendation: Focus on increasing savings or paying down debt to improve your financial health.")
-        else:
-            print("Recommendation: Consider reducing monthly expenses and increasing savings to get back on track.")
+        report = HealthScoreReport(score, status, RECOMMENDATIONS[status])
+        if utilities.should_print(quiet):
+            print(format_health_score_report(report))
+        return report
 
     def plot_score_evolution(self):
         """Displays a line graph of the evolution of the financial health score over time."""
@@ -84,52 +132,48 @@ class FinancialHealth:
             print("Not enough data to display score evolution.")
             return
 
-        # Create a DataFrame for plotting
-        df = pd.DataFrame({'Score': self.historical_scores})
-        df['Month'] = df.index + 1  # Assume each score represents a month.
+        fig = plt.figure(figsize=(10, 6))
+        self.draw_score_evolution(fig)
+        plt.show()
+
+    def draw_score_evolution(self, fig):
+        """Draws the financial health score evolution onto a matplotlib Figure."""
+        # Plot straight from the history buffer; each score represents a month
+        scores = self.historical_scores.values
+        months = np.arange(1, len(scores) + 1)
 
         # Plot the evolution of the score
-        plt.figure(figsize=(10, 6))
-        plt.plot(df['Month'], df['Score'], marker='o', linestyle='-', color='blue', label='Financial Health Score')
-        plt.axhline(y=1, color='orange', linestyle='--', label='Stable Threshold')
-        plt.axhline(y=1.5, color='green', linestyle='--', label='Strong Threshold')
-        plt.title('Financial Health Score Evolution Over Time', fontsize=14)
-        plt.xlabel('Month')
-        plt.ylabel('Score')
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+        ax = fig.add_subplot()
+        ax.plot(months, scores, marker='o', linestyle='-', color='blue', label='Financial Health Score')
+        ax.axhline(y=1, color='orange', linestyle='--', label='Stable Threshold')
+        ax.axhline(y=1.5, color='green', linestyle='--', label='Strong Threshold')
+        ax.set_title('Financial Health Score Evolution Over Time', fontsize=14)
+        ax.set_xlabel('Month')
+        ax.set_ylabel('Score')
+        ax.grid(True)
+        ax.legend()
+        fig.tight_layout()
 
     #--------------------------------------------- Section 1.2: Income and Expense Summary --------------------------------------------
-    def display_income_expense_summary(self):
-        """Displays a bar graph comparing income and expenses and provides status alerts."""
-        monthly_income = self.get_monthly_income()
-        monthly_expenses = self.get_monthly_expenses()
+    def display_income_expense_summary(self, year=None, month=None):
+        """Displays a bar graph comparing a month's income and expenses (default: an average month) and provides status alerts."""
+        monthly_income = self.get_monthly_income(year, month)
+        monthly_expenses = self.get_monthly_expenses(year, month)
 
-        # Create a bar chart for income vs expenses
-        categories = ['Monthly Income', 'Monthly Expenses']
-        amounts = [monthly_income, monthly_expenses]
-        
         # Determine the status based on the comparison
         if monthly_income > monthly_expenses:
             status = "On Track"
             message = "You're on track with a positive cash flow."
-            bar_colors = ['green', 'green']
         elif monthly_income == monthly_expenses:
             status = "Caution"
             message = "Your income matches your expenses, be mindful of unexpected expenses."
-            bar_colors = ['yellow', 'yellow']
         else:
             status = "Overspending"
             message = "You're overspending. Consider cutting back on expenses."
-            bar_colors = ['red', 'red']
         
         # Display the bar chart
-        plt.bar(categories, amounts, color=bar_colors)
-        plt.title('Monthly Income vs Expenses Comparison')
-        plt.ylabel('Amount ($)')
-        plt.tight_layout()
+        fig = plt.figure()
+        self.draw_income_expense_summary(fig, year, month)
         plt.show()
 
         # Display status and recommendation
@@ -143,11 +187,34 @@ class FinancialHealth:
         elif status == "On Track":
             print("Recommendation: Great job! You might consider increasing your savings or investing surplus funds.")
 
+    def draw_income_expense_summary(self, fig, year=None, month=None):
+        """Draws the monthly income vs expenses bars onto a matplotlib Figure."""
+        monthly_income = self.get_monthly_income(year, month)
+        monthly_expenses = self.get_monthly_expenses(year, month)
+
+        # Create a bar chart for income vs expenses
+        categories = ['Monthly Income', 'Monthly Expenses']
+        amounts = [monthly_income, monthly_expenses]
+        
+        # Green for a surplus, yellow for break-even, red for overspending
+        if monthly_income > monthly_expenses:
+            bar_colors = ['green', 'green']
+        elif monthly_income == monthly_expenses:
+            bar_colors = ['yellow', 'yellow']
+        else:
+            bar_colors = ['red', 'red']
+        
+        ax = fig.add_subplot()
+        ax.bar(categories, amounts, color=bar_colors)
+        ax.set_title('Monthly Income vs Expenses Comparison')
+        ax.set_ylabel('Amount ($)')
+        fig.tight_layout()
+
     #--------------------------------------------- Section 1.3: Savings Capacity Gauge --------------------------------------------
-    def display_savings_capacity_gauge(self):
-        """Displays a gauge chart showing the percentage of income saved."""
-        monthly_income = self.get_monthly_income()
-        monthly_expenses = self.get_monthly_expenses()
+    def display_savings_capacity_gauge(self, year=None, month=None):
+        """Displays a gauge chart showing the percentage of a month's income saved (default: an average month)."""
+        monthly_income = self.get_monthly_income(year, month)
+        monthly_expenses = self.get_monthly_expenses(year, month)
         
         if monthly_income == 0:
             print("Monthly income is zero. Cannot calculate savings capacity.")
@@ -160,16 +227,8 @@ class FinancialHealth:
         # Display the calculated savings capacity
         print(f"Savings Capacity: {savings_capacity:.2f}% of your income is being saved.")
 
-        # Create a gauge-like plot using a pie chart with a single segment
-        plt.figure(figsize=(6, 6))
-        plt.pie([savings_capacity, 100 - savings_capacity],
-                labels=[f'{savings_capacity:.1f}% Saved', f'{100 - savings_capacity:.1f}% Spent'],
-                startangle=90,
-                colors=['#66b3ff', '#ff9999'],
-                wedgeprops={'width': 0.3})
-        
-        plt.title('Savings Capacity Gauge', fontsize=14)
-        plt.tight_layout()
+        fig = plt.figure(figsize=(6, 6))
+        self.draw_savings_capacity_gauge(fig, savings_capacity)
         plt.show()
 
         # Display recommendations based on the savings capacity
@@ -180,22 +239,35 @@ class FinancialHealth:
         else:
             print("Recommendation: You're doing well with saving. Consider exploring investment options for better growth.")
 
+    def draw_savings_capacity_gauge(self, fig, savings_capacity=None, year=None, month=None):
+        """Draws the savings capacity gauge onto a matplotlib Figure."""
+        if savings_capacity is None:
+            monthly_income = self.get_monthly_income(year, month)
+            if monthly_income == 0:
+                raise ValueError("Monthly income is zero. Cannot calculate savings capacity.")
+            savings_capacity = ((monthly_income - self.get_monthly_expenses(year, month)) / monthly_income) * 100
+            savings_capacity = max(0, savings_capacity)
+
+        # Create a gauge-like plot using a pie chart with a single segment
+        ax = fig.add_subplot()
+        ax.pie([savings_capacity, 100 - savings_capacity],
+               labels=[f'{savings_capacity:.1f}% Saved', f'{100 - savings_capacity:.1f}% Spent'],
+               startangle=90,
+               colors=['#66b3ff', '#ff9999'],
+               wedgeprops={'width': 0.3})
+        
+        ax.set_title('Savings Capacity Gauge', fontsize=14)
+        fig.tight_layout()
+
     #--------------------------------------------- Section 1.4: Debt vs. Savings/Assets Balance --------------------------------------------
     def display_debt_vs_savings_balance(self):
         """Displays a bar graph comparing total debts against savings and liquid assets."""
         total_savings_and_assets = self.savings + self.liquid_assets
         total_debts = self.total_debts
 
-        # Create a bar chart for savings and debts
-        categories = ['Total Debts', 'Total Savings & Assets']
-        amounts = [total_debts, total_savings_and_assets]
-        
         # Display the bar chart
-        bar_colors = ['red', 'green']
-        plt.bar(categories, amounts, color=bar_colors)
-        plt.title('Debt vs. Savings & Assets Balance')
-        plt.ylabel('Amount ($)')
-        plt.tight_layout()
+        fig = plt.figure()
+        self.draw_debt_vs_savings_balance(fig)
         plt.show()
 
         # Provide recommendations based on the comparison
@@ -209,40 +281,60 @@ class FinancialHealth:
         else:
             print("Recommendation: Great job maintaining a positive balance. Consider further investments or building an emergency fund.")
 
+    def draw_debt_vs_savings_balance(self, fig):
+        """Draws the total debts vs savings and assets bars onto a matplotlib Figure."""
+        # Create a bar chart for savings and debts
+        categories = ['Total Debts', 'Total Savings & Assets']
+        amounts = [self.total_debts, self.savings + self.liquid_assets]
+        
+        bar_colors = ['red', 'green']
+        ax = fig.add_subplot()
+        ax.bar(categories, amounts, color=bar_colors)
+        ax.set_title('Debt vs. Savings & Assets Balance')
+        ax.set_ylabel('Amount ($)')
+        fig.tight_layout()
+
     def plot_debt_savings_trend(self):
         """Plots the trend of savings and debt over time."""
         if len(self.historical_savings) < 2 or len(self.historical_debts) < 2:
             print("Not enough data to display trend evolution.")
             return
 
-        # Create a DataFrame for plotting
-        df = pd.DataFrame({
-            'Savings': self.historical_savings,
-            'Debts': self.historical_debts
-        })
-        df['Month'] = df.index + 1  # Assume each entry represents a month.
+        fig = plt.figure(figsize=(10, 6))
+        self.draw_debt_savings_trend(fig)
+        plt.show()
+
+    def draw_debt_savings_trend(self, fig):
+        """Draws the savings and debt trend onto a matplotlib Figure."""
+        # Plot straight from the history buffers; each entry represents a month
+        savings = self.historical_savings.values
+        debts = self.historical_debts.values
 
         # Plot the savings vs. debt trend over time
-        plt.figure(figsize=(10, 6))
-        plt.plot(df['Month'], df['Savings'], marker='o', linestyle='-', color='green', label='Savings')
-        plt.plot(df['Month'], df['Debts'], marker='x', linestyle='-', color='red', label='Debts')
-        plt.title('Savings and Debt Trend Over Time', fontsize=14)
-        plt.xlabel('Month')
-        plt.ylabel('Amount ($)')
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+        ax = fig.add_subplot()
+        ax.plot(np.arange(1, len(savings) + 1), savings, marker='o', linestyle='-', color='green', label='Savings')
+        ax.plot(np.arange(1, len(debts) + 1), debts, marker='x', linestyle='-', color='red', label='Debts')
+        ax.set_title('Savings and Debt Trend Over Time', fontsize=14)
+        ax.set_xlabel('Month')
+        ax.set_ylabel('Amount ($)')
+        ax.grid(True)
+        ax.legend()
+        fig.tight_layout()
     #--------------------------------------------- Section 1.5: Bank Account Tracker --------------------------------------------
 
-    def add_bank_account(self, account_name, balance):
+    def add_bank_account(self, account_name, balance, quiet=None):
         """
         Adds or updates a bank account balance.
         :param account_name: The name of the bank account (e.g., "Checking", "Savings").
         :param balance: The balance of the bank account.
+        :param quiet: Skip the confirmation message; None follows utilities.set_quiet.
+        :return: The updated BankAccount.
         """
         self.bank_accounts[account_name] = balance
-        print(f"Updated {account_name} account with balance: ${balance}")
+        account = BankAccount(account_name, balance)
+        if utilities.should_print(quiet):
+            print(format_bank_account(account))
+        return account
 
     def remove_bank_account(self, account_name):
         """
@@ -266,6 +358,14 @@ class FinancialHealth:
             print("No bank accounts or liquid assets to display.")
             return
 
+        fig = plt.figure(figsize=(8, 8))
+        self.draw_liquid_assets_pie_chart(fig)
+        
+        # Show the pie chart
+        plt.show()
+
+    def draw_liquid_assets_pie_chart(self, fig):
+        """Draws the liquid assets distribution pie onto a matplotlib Figure."""
         # Prepare data for the pie chart
         data = self.bank_accounts.copy()
         if self.liquid_assets > 0:
@@ -274,31 +374,55 @@ class FinancialHealth:
         # Extract data for the pie chart
         labels = list(data.keys())
         sizes = list(data.values())
-        colors = plt.cm.Paired(range(len(labels)))
+        colors = mpl.colormaps['Paired'](range(len(labels)))
 
         # Create the pie chart
-        plt.figure(figsize=(8, 8))
-        wedges, _, _ = plt.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors)
+        ax = fig.add_subplot()
+        wedges, _, _ = ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors)
         
         # Create custom legend patches to match the colors
-        legend_patches = [Patch(color=colors[i], label=labels[i]) for i in range(len(labels))]
+        legend_patches = [mpatches.Patch(color=colors[i], label=labels[i]) for i in range(len(labels))]
         
         # Add a legend with custom colored patches
-        plt.legend(handles=legend_patches, loc="center left", bbox_to_anchor=(1, 0.5), fontsize=12)
+        ax.legend(handles=legend_patches, loc="center left", bbox_to_anchor=(1, 0.5), fontsize=12)
         
         # Add the title
-        plt.title('Liquid Assets Distribution', fontsize=16)
+        ax.set_title('Liquid Assets Distribution', fontsize=16)
         
-        plt.axis('equal')  # Equal aspect ratio ensures the pie chart is circular.
-        
-        # Show the pie chart
-        plt.tight_layout()
-        plt.show()
+        ax.axis('equal')  # Equal aspect ratio ensures the pie chart is circular.
+        fig.tight_layout()
 
     def display_total_liquid_assets(self):
         """Displays the total value of liquid assets including all bank accounts."""
         total_liquid_assets = self.get_total_liquid_assets()
         print(f"Total Liquid Assets: ${total_liquid_assets}")
+#---------------------------------------------------Population Scoring---------------------------------------------------------------------------------------------
+
+# Status codes returned by calculate_financial_health_scores, indexing STATUS_NAMES
+STATUS_AT_RISK = 0
+STATUS_STABLE = 1
+STATUS_STRONG = 2
+STATUS_NAMES = ('At Risk', 'Stable', 'Strong')
+
+def calculate_financial_health_scores(savings, liquid_assets, total_debts, monthly_expenses):
+    """
+    Vectorized calculate_financial_health_score and get_status_indicator for N users.
+    Takes equal-length columns and returns (scores rounded to 2 decimals, status codes).
+    Monthly expenses are floored at 1 like get_monthly_expenses, and statuses are taken
+    from the rounded scores, as display_financial_health_score does.
+    """
+    monthly_expenses = np.maximum(np.asarray(monthly_expenses, dtype=np.float64), 1)
+    scores = np.array(savings, dtype=np.float64)
+    scores += liquid_assets
+    scores -= total_debts
+    scores /= monthly_expenses
+    np.round(scores, 2, out=scores)
+
+    statuses = np.full(scores.shape, STATUS_AT_RISK, dtype=np.int8)
+    statuses[scores >= 1] = STATUS_STABLE
+    statuses[scores > 1.5] = STATUS_STRONG
+    return scores, statuses
+
 #---------------------------------------------------Example Usage---------------------------------------------------------------------------------------------------
 # # Example: Using the IncomeTracker with FinancialHealth
 
@@ -319,28 +443,34 @@ class FinancialHealth:
 # financial_health.update_savings(10000)
 # financial_health.update_liquid_assets(5000)
 # financial_health.update_total_debts(3000)
+# financial_health.record_financial_health_score()  # Add this month to the score history
 # financial_health.display_financial_health_score()
 
 # # Update data for the next month with a slight increase in savings and decrease in debts
 # financial_health.update_savings(10500)  # Increased savings
 # financial_health.update_total_debts(2800)  # Decreased debts
+# financial_health.record_financial_health_score()
 # financial_health.display_financial_health_score()
 
 # # Update data for another month with increased expenses
 # income_tracker.add_expense_source("Vacation", 500, 'M')  # Adding a new expense in IncomeTracker
+# financial_health.record_financial_health_score()
 # financial_health.display_financial_health_score()
 
 # # Update data for month 4 with more liquid assets
 # financial_health.update_liquid_assets(5500)
+# financial_health.record_financial_health_score()
 # financial_health.display_financial_health_score()
 
 # # Update data for month 5 with decreased savings and increased debts
 # financial_health.update_savings(10000)  # Savings back to original
 # financial_health.update_total_debts(3500)  # Slight increase in debt
+# financial_health.record_financial_health_score()
 # financial_health.display_financial_health_score()
 
 # # Update data for month 6 with a significant debt reduction
 # financial_health.update_total_debts(2000)
+# financial_health.record_financial_health_score()
 # financial_health.display_financial_health_score()
 
 # # Now plot the evolution of the financial health score over these months
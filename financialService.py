@@ -0,0 +1,209 @@
+# financial_service.py
+import asyncio
+import copy
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import forecastEngine
+import headlessCharts
+from debtManagement import AVALANCHE
+
+# Which object each headlessCharts function draws from: an attribute of FinancialHealth, or the object itself
+CHART_OWNERS = {
+    'pie_chart_distribution': 'income_tracker',
+    'bar_graph_income_vs_expenses1': 'income_tracker',
+    'bar_graph_income_vs_expenses2': 'income_tracker',
+    'budget_progress_bar': 'income_tracker',
+    'real_time_budget_comparison': 'income_tracker',
+    'disposable_income_summary': 'income_tracker',
+    'plot_forecast': 'income_tracker',
+    'plot_debt_progress': 'debt_manager',
+    'plot_debt_progress_line': 'debt_manager',
+    'plot_score_evolution': None,
+    'display_income_expense_summary': None,
+    'display_savings_capacity_gauge': None,
+    'display_debt_vs_savings_balance': None,
+    'plot_debt_savings_trend': None,
+    'display_liquid_assets_pie_chart': None,
+}
+
+
+def _call_method(owner, method, args, kwargs):
+    """Runs in a worker: calls a method on the worker's own copy of an object."""
+    return getattr(owner, method)(*args, **kwargs)
+
+
+def _render_chart(chart, owner, args, options):
+    """Runs in a worker: renders a headlessCharts chart of the worker's own copy of an object."""
+    return getattr(headlessCharts, chart)(owner, *args, **options)
+
+
+class FinancialService:
+    """
+    Asyncio front end over a registry of per-user FinancialHealth objects (each with its
+    income_tracker and debt_manager).
+
+    Cheap reads of running totals and cached state run inline on the event loop. Heavy calls
+    (forecasts, payoff simulations, chart renders) run on a bounded thread or process pool on a deep copy
+    of the user's objects, so later writes never race with them. At most `max_pending` heavy
+    calls are submitted at a time; further callers wait on a semaphore instead of piling up
+    in the pool's queue.
+    """
+
+    def __init__(self, max_workers=None, max_pending=None, use_processes=False, executor=None):
+        if executor is None:
+            max_workers = max_workers or os.cpu_count() or 1
+            pool = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+            executor = pool(max_workers=max_workers)
+            self._owns_executor = True
+        else:
+            max_workers = max_workers or getattr(executor, '_max_workers', 1)
+            self._owns_executor = False
+        self._executor = executor
+        self.max_pending = max_pending or 2 * max_workers
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self.in_flight = 0  # Heavy calls currently submitted to the pool
+        self._users = {}
+
+#-------------------------------------------------------Registry-------------------------------------------------------------------------------------------------
+
+    def register(self, user_id, health):
+        """Adds or replaces the FinancialHealth object of a user."""
+        self._users[user_id] = health
+
+    def unregister(self, user_id):
+        """Removes a user from the registry."""
+        del self._users[user_id]
+
+    def health(self, user_id):
+        """Returns a user's FinancialHealth; raises KeyError for unknown users."""
+        return self._users[user_id]
+
+    def __len__(self):
+        return len(self._users)
+
+    def __contains__(self, user_id):
+        return user_id in self._users
+
+#-------------------------------------------------------Cheap Reads (inline)-------------------------------------------------------------------------------------
+
+    async def totals(self, user_id):
+        """Daily income, expenses and disposable income, read from the running totals."""
+        tracker = self.health(user_id).income_tracker
+        return {
+            'total_income': tracker.total_income,
+            'total_expenses': tracker.total_expenses,
+            'disposable_income': tracker.calculate_disposable_income(),
+        }
+
+    async def score(self, user_id, year=None, month=None):
+        """Returns (financial health score, status) for a calendar month (default: an average month) without recording the score."""
+        health = self.health(user_id)
+        score = health.calculate_financial_health_score(year, month)
+        return score, health.get_status_indicator(score)
+
+#-------------------------------------------------------Heavy Calls (pool)---------------------------------------------------------------------------------------
+
+    async def _offload(self, function, *args):
+        async with self._slots:
+            self.in_flight += 1
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._executor, function, *args)
+            finally:
+                self.in_flight -= 1
+
+    async def forecast(self, user_id, months=6, model=forecastEngine.MEAN):
+        """IncomeTracker.forecast_income_expenses of a user, run on the pool; returns (projected income, projected expenses)."""
+        income_tracker = copy.deepcopy(self.health(user_id).income_tracker)
+        return await self._offload(_call_method, income_tracker, 'forecast_income_expenses', (months, model), {})
+
+    async def simulate_payoff(self, user_id, monthly_budget, strategy=AVALANCHE, minimum_payments=None, max_months=360):
+        """DebtManagement.simulate_payoff of a user, run on the pool; returns (debt names, PayoffSimulation)."""
+        debt_manager = copy.deepcopy(self.health(user_id).debt_manager)
+        return await self._offload(_call_method, debt_manager, 'simulate_payoff',
+                                   (monthly_budget, strategy, minimum_payments, max_months), {})
+
+    async def render_chart(self, user_id, chart, *args, **options):
+        """
+        Renders one of the headlessCharts functions (a key of CHART_OWNERS) for a user on the pool
+        and returns the image bytes; `options` are passed on (fmt, figsize, dpi, ...).
+        """
+        if chart not in CHART_OWNERS:
+            raise ValueError(f"Unknown chart: {chart}")
+        owner = self.health(user_id)
+        if CHART_OWNERS[chart] is not None:
+            owner = getattr(owner, CHART_OWNERS[chart])
+        return await self._offload(_render_chart, chart, copy.deepcopy(owner), args, options)
+
+    def close(self):
+        """Shuts down the pool if the service created it."""
+        if self._owns_executor:
+            self._executor.shutdown()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+
+class Response:
+    """Result of a LocalServer request."""
+
+    def __init__(self, status, body, latency):
+        self.status = status  # HTTP-style status code
+        self.body = body  # Return value, or the error message
+        self.latency = latency  # Seconds spent handling the request
+
+    def __repr__(self):
+        return f"Response(status={self.status}, latency={self.latency * 1000:.2f} ms)"
+
+
+class LocalServer:
+    """
+    In-process stand-in for the HTTP front end: routes requests to a FinancialService and
+    maps errors to status codes the way a handler would, without any networking.
+    """
+
+    ROUTES = {
+        'totals': 'totals',
+        'score': 'score',
+        'forecast': 'forecast',
+        'payoff': 'simulate_payoff',
+        'chart': 'render_chart',
+    }
+
+    def __init__(self, service):
+        self.service = service
+
+    async def handle(self, route, user_id, **params):
+        """
+        Serves one request and returns a Response: 404 for an unknown route or user, 400 for
+        invalid parameters, and 500 for any other error (including a KeyError raised by the call).
+        """
+        start = time.perf_counter()
+        if route not in self.ROUTES:
+            return Response(404, f"Unknown route: {route}", time.perf_counter() - start)
+        if user_id not in self.service:
+            return Response(404, f"Unknown user: {user_id}", time.perf_counter() - start)
+        try:
+            body = await getattr(self.service, self.ROUTES[route])(user_id, **params)
+            status = 200
+        except (TypeError, ValueError) as error:
+            status, body = 400, str(error)
+        except Exception as error:
+            status, body = 500, f"Internal error: {error!r}"
+        return Response(status, body, time.perf_counter() - start)
+
+#---------------------------------------------------Example Usage---------------------------------------------------------------------------------------------------
+
+# async def main():
+#     async with FinancialService(max_workers=4) as service:
+#         service.register(1, FinancialHealth(IncomeTracker()))
+#         server = LocalServer(service)
+#         print(await server.handle('score', 1))
+#         response = await server.handle('chart', 1, chart='plot_debt_progress', fmt='svg')
+#
+# asyncio.run(main())
@@ -0,0 +1,160 @@
+# forecast_engine.py
+from collections import deque
+
+import numpy as np
+
+# Forecast models understood by StreamingForecaster.forecast and forecast_population
+MEAN = 'mean'  # Flat average of the whole history
+SES = 'ses'  # Simple exponential smoothing: flat forecast at the smoothed level
+LINEAR = 'linear'  # Least-squares linear trend over the whole history
+SEASONAL_NAIVE = 'seasonal_naive'  # Repeat the value from one season earlier
+MODELS = (MEAN, SES, LINEAR, SEASONAL_NAIVE)
+
+# Layout of the array returned by StreamingForecaster.get_state
+STATE_FIELDS = ('alpha', 'season_length', 'count', 'sum', 'welford_mean', 'm2', 'sum_ty', 'level')
+
+
+class StreamingForecaster:
+    """
+    Running statistics of one monthly series, updated in O(1) per new value,
+    from which every model forecasts without rescanning the history.
+    """
+
+    def __init__(self, alpha=0.3, season_length=12):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1].")
+        self.alpha = alpha
+        self.season_length = season_length
+        self.count = 0
+        self._sum = 0.0
+        self._welford_mean = 0.0
+        self._m2 = 0.0  # Sum of squared deviations from the mean (Welford)
+        self._sum_ty = 0.0  # Sum of t * y with t = 0, 1, 2, ... for the linear trend
+        self.level = np.nan  # Exponentially smoothed level
+        self._last_season = deque(maxlen=season_length)
+
+    def update(self, value):
+        """Adds the next value of the series."""
+        value = float(value)
+        if self.count == 0:
+            self.level = value
+        else:
+            self.level += self.alpha * (value - self.level)
+        delta = value - self._welford_mean
+        self._welford_mean += delta / (self.count + 1)
+        self._m2 += delta * (value - self._welford_mean)
+        self._sum += value
+        self._sum_ty += self.count * value
+        self.count += 1
+        self._last_season.append(value)
+
+    def evict(self, value, next_value):
+        """
+        Removes the oldest value of the series, so the statistics cover a sliding window.
+        `next_value` is the value that becomes the oldest one (the smoothed level restarts from it).
+        """
+        value = float(value)
+        if self.count <= 1:
+            self.__init__(self.alpha, self.season_length)
+            return
+        n = self.count
+        self.level += (1 - self.alpha) ** (n - 1) * (float(next_value) - value)
+        mean = self._welford_mean
+        self._welford_mean = (n * mean - value) / (n - 1)
+        self._m2 = max(self._m2 - (value - mean) * (value - self._welford_mean), 0.0)
+        self._sum -= value
+        self._sum_ty -= self._sum  # Every remaining value moves from t to t - 1
+        self.count -= 1
+        if len(self._last_season) > self.count:
+            self._last_season.popleft()
+
+    def get_state(self):
+        """Returns (state, last_season): a float64 array laid out as STATE_FIELDS and the retained season values."""
+        state = np.array([self.alpha, self.season_length, self.count, self._sum, self._welford_mean,
+                          self._m2, self._sum_ty, self.level], dtype=np.float64)
+        return state, np.array(self._last_season, dtype=np.float64)
+
+    @classmethod
+    def from_state(cls, state, last_season):
+        """Rebuilds a forecaster from the output of get_state."""
+        alpha, season_length, count, total, welford_mean, m2, sum_ty, level = np.asarray(state).tolist()
+        forecaster = cls(alpha, int(season_length))
+        forecaster.count = int(count)
+        forecaster._sum = total
+        forecaster._welford_mean = welford_mean
+        forecaster._m2 = m2
+        forecaster._sum_ty = sum_ty
+        forecaster.level = level
+        forecaster._last_season.extend(np.asarray(last_season).tolist())
+        return forecaster
+
+    @property
+    def mean(self):
+        """Average of the series (nan while empty)."""
+        return self._sum / self.count if self.count else np.nan
+
+    @property
+    def variance(self):
+        """Sample variance of the series (nan with fewer than two values)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    def trend(self):
+        """Returns (intercept, slope) of the least-squares line through (t, value), t = 0..count-1."""
+        n = self.count
+        if n < 2:
+            return self.mean, 0.0
+        sum_t = n * (n - 1) / 2
+        sum_tt = (n - 1) * n * (2 * n - 1) / 6
+        slope = (n * self._sum_ty - sum_t * self._sum) / (n * sum_tt - sum_t * sum_t)
+        intercept = (self._sum - slope * sum_t) / n
+        return intercept, slope
+
+    def forecast(self, months, model=MEAN):
+        """Forecasts the next `months` values with one of MODELS."""
+        if model == MEAN:
+            return np.full(months, self.mean)
+        if model == SES:
+            return np.full(months, self.level)
+        if model == LINEAR:
+            intercept, slope = self.trend()
+            return intercept + slope * np.arange(self.count, self.count + months)
+        if model == SEASONAL_NAIVE:
+            if self.count < self.season_length:
+                raise ValueError(f"Seasonal forecasts need at least {self.season_length} values.")
+            season = np.array(self._last_season)
+            return season[np.arange(months) % self.season_length]
+        raise ValueError(f"Unknown forecast model: {model}")
+
+
+def forecast_population(history, months, model=MEAN, alpha=0.3, season_length=12):
+    """
+    Forecasts many series at once. `history` is a users x months matrix (oldest month first);
+    returns a users x `months` matrix, computed with the same models as StreamingForecaster.
+    """
+    history = np.asarray(history, dtype=np.float64)
+    if history.size == 0 and history.ndim == 1:
+        history = history.reshape(0, 0)  # No users at all
+    users, length = history.shape
+    if length == 0 and model in (MEAN, SES, LINEAR):
+        return np.full((users, months), np.nan)  # Like a StreamingForecaster with no values yet
+    if model == MEAN:
+        return np.repeat(history.mean(axis=1)[:, None], months, axis=1)
+    if model == SES:
+        level = history[:, 0].copy()
+        for t in range(1, length):
+            level += alpha * (history[:, t] - level)
+        return np.repeat(level[:, None], months, axis=1)
+    if model == LINEAR:
+        t = np.arange(length, dtype=np.float64)
+        t_centered = t - t.mean()
+        denominator = (t_centered ** 2).sum()
+        mean = history.mean(axis=1)
+        slope = history @ t_centered / denominator if denominator else np.zeros(users)
+        intercept = mean - slope * t.mean()
+        steps = np.arange(length, length + months, dtype=np.float64)
+        return intercept[:, None] + slope[:, None] * steps[None, :]
+    if model == SEASONAL_NAIVE:
+        if length < season_length:
+            raise ValueError(f"Seasonal forecasts need at least {season_length} months of history.")
+        return history[:, length - season_length + np.arange(months) % season_length]
+    raise ValueError(f"Unknown forecast model: {model}")
@@ -0,0 +1,131 @@
+# frequency_engine.py
+import calendar
+import operator
+
+import numpy as np
+
+# Frequency codes, indexed by frequency id. 'O' (one-time) amounts are not recurring
+# and convert to 0; any unknown code is treated the same way, as in Utilities.
+FREQUENCIES = ('D', 'W', 'B', 'M', 'Q', 'Y', 'O')  # Daily, weekly, bi-weekly, monthly, quarterly, yearly, one-time
+FREQUENCY_IDS = {code: frequency_id for frequency_id, code in enumerate(FREQUENCIES)}
+ONE_TIME = FREQUENCY_IDS['O']
+
+#-------------------------------------------------------Conversion Tables----------------------------------------------------------------------------------------
+# A recurring amount is spread evenly over the days of its period: a monthly amount over
+# the days of its calendar month, a quarterly one over its calendar quarter, a yearly one
+# over its calendar year. Tables are indexed by [leap year, month - 1, frequency id].
+
+DAYS_IN_MONTH = np.array([
+    [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+    [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+], dtype=np.float64)
+DAYS_IN_QUARTER = np.repeat(DAYS_IN_MONTH.reshape(2, 4, 3).sum(axis=2), 3, axis=1)
+DAYS_IN_YEAR = DAYS_IN_MONTH.sum(axis=1)
+
+PERIOD_DAYS = np.empty((2, 12, len(FREQUENCIES)))
+PERIOD_DAYS[..., FREQUENCY_IDS['D']] = 1
+PERIOD_DAYS[..., FREQUENCY_IDS['W']] = 7
+PERIOD_DAYS[..., FREQUENCY_IDS['B']] = 14
+PERIOD_DAYS[..., FREQUENCY_IDS['M']] = DAYS_IN_MONTH
+PERIOD_DAYS[..., FREQUENCY_IDS['Q']] = DAYS_IN_QUARTER
+PERIOD_DAYS[..., FREQUENCY_IDS['Y']] = DAYS_IN_YEAR[:, None]
+PERIOD_DAYS[..., ONE_TIME] = np.inf
+
+DAILY_FACTORS = 1 / PERIOD_DAYS  # Daily amount per unit amount, for a day of the given month
+MONTHLY_FACTORS = DAILY_FACTORS * DAYS_IN_MONTH[..., None]  # Total over the given month
+ANNUAL_FACTORS = MONTHLY_FACTORS.sum(axis=1)  # Total over the year, indexed by [leap year, frequency id]
+
+# Without a year and month, amounts are converted over an average Gregorian month or year
+# (365.2425 days a year), so results never depend on today's date.
+AVERAGE_YEAR_DAYS = 365.2425
+AVERAGE_MONTH_DAYS = AVERAGE_YEAR_DAYS / 12
+
+AVERAGE_PERIOD_DAYS = np.array([1, 7, 14, AVERAGE_MONTH_DAYS, AVERAGE_YEAR_DAYS / 4, AVERAGE_YEAR_DAYS, np.inf])
+AVERAGE_DAILY_FACTORS = 1 / AVERAGE_PERIOD_DAYS
+AVERAGE_MONTHLY_FACTORS = AVERAGE_DAILY_FACTORS * AVERAGE_MONTH_DAYS
+AVERAGE_ANNUAL_FACTORS = AVERAGE_DAILY_FACTORS * AVERAGE_YEAR_DAYS
+
+# MONTHLY_FACTORS rows as plain tuples keyed by (leap, month - 1), and the average month, for scalar roll-ups
+_MONTHLY_ROWS = {(leap, month): tuple(MONTHLY_FACTORS[leap, month].tolist()) for leap in (0, 1) for month in range(12)}
+_AVERAGE_MONTHLY_ROW = tuple(AVERAGE_MONTHLY_FACTORS.tolist())
+
+
+def is_leap_year(year):
+    """Vectorized Gregorian leap year test; returns 0/1 like the tables' first index."""
+    year = np.asarray(year)
+    return ((year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))).astype(np.intp)
+
+
+def _is_average(year, month):
+    """Whether a conversion uses the average month: neither year nor month given (both or neither are required)."""
+    if (year is None) != (month is None):
+        raise ValueError("Give both year and month, or neither for an average month.")
+    return year is None
+
+
+def frequency_ids(frequencies):
+    """Converts frequency codes to frequency ids (unknown codes map to ONE_TIME); ids pass through."""
+    frequencies = np.asarray(frequencies)
+    if np.issubdtype(frequencies.dtype, np.integer):
+        return frequencies
+    ids = np.full(frequencies.shape, ONE_TIME, dtype=np.int8)
+    for code, frequency_id in FREQUENCY_IDS.items():
+        ids[frequencies == code] = frequency_id
+    return ids
+
+
+def frequency_id(frequency):
+    """Scalar frequency_ids."""
+    return FREQUENCY_IDS.get(frequency, ONE_TIME)
+
+
+def _convert(table, average_table, amounts, frequencies, year, month):
+    if _is_average(year, month):
+        factors = average_table[frequency_ids(frequencies)]
+    else:
+        factors = table[is_leap_year(year), np.asarray(month, dtype=np.intp) - 1, frequency_ids(frequencies)]
+    converted = np.asarray(amounts, dtype=np.float64) * factors
+    return float(converted) if converted.ndim == 0 else converted
+
+
+def to_daily(amounts, frequencies, year=None, month=None):
+    """
+    Daily equivalents of recurring amounts on a day of the given month (default: an average month).
+    All arguments broadcast against each other, so year and month can be per-amount arrays.
+    """
+    return _convert(DAILY_FACTORS, AVERAGE_DAILY_FACTORS, amounts, frequencies, year, month)
+
+
+def to_monthly(amounts, frequencies, year=None, month=None):
+    """Totals of recurring amounts over the given calendar month (default: an average month)."""
+    return _convert(MONTHLY_FACTORS, AVERAGE_MONTHLY_FACTORS, amounts, frequencies, year, month)
+
+
+def to_annual(amounts, frequencies, year=None):
+    """Totals of recurring amounts over the given calendar year (default: an average year)."""
+    if year is None:
+        factors = AVERAGE_ANNUAL_FACTORS[frequency_ids(frequencies)]
+    else:
+        factors = ANNUAL_FACTORS[is_leap_year(year), frequency_ids(frequencies)]
+    converted = np.asarray(amounts, dtype=np.float64) * factors
+    return float(converted) if converted.ndim == 0 else converted
+
+
+def monthly_total(amounts_by_frequency, year=None, month=None):
+    """
+    Total over a calendar month (default: an average month) of amounts already summed per
+    frequency id (a sequence of len(FREQUENCIES) floats, as kept by IncomeTracker).
+    Costs one table row lookup.
+    """
+    if _is_average(year, month):
+        row = _AVERAGE_MONTHLY_ROW
+    else:
+        row = _MONTHLY_ROWS[int(calendar.isleap(year)), month - 1]
+    return sum(map(operator.mul, amounts_by_frequency, row))
+
+#---------------------------------------------------Example Usage---------------------------------------------------------------------------------------------------
+
+# to_monthly([1000, 50, 1200], ['M', 'W', 'Y'], 2024, 2)   # [1000, 207.14, 95.08]: 29 of 2024's 366 days
+# to_daily(1500, 'M', 2023, [1, 2])                        # Rent per day in January and February 2023
+# to_annual([500, 300], ['Q', 'O'])                        # [2000, 0]
+# to_monthly(100, 'W')                                     # 434.82: an average month of 30.44 days
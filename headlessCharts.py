@@ -0,0 +1,157 @@
+# headless_charts.py
+from io import BytesIO
+
+import utilities
+
+# Figures are built directly from matplotlib.figure and rendered by their own Agg canvas,
+# so nothing here touches the global pyplot state or needs an interactive backend.
+mpl = utilities.LazyModule("matplotlib")
+mfigure = utilities.LazyModule("matplotlib.figure")
+
+FORMATS = ('png', 'svg')
+DEFAULT_DPI = 100
+
+# Sizes used by the interactive versions of each chart (None keeps matplotlib's default)
+WIDE = (10, 6)
+SQUARE = (6, 6)
+LARGE_SQUARE = (8, 8)
+
+_SUBPLOT_PARAMS = ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')
+
+
+class FigurePool:
+    """
+    Keeps one Figure per layout (figsize, dpi) so repeated renders of the same chart
+    reuse it instead of allocating a new one. A pool is not thread-safe: use one per worker.
+    """
+
+    def __init__(self):
+        self._figures = {}
+
+    def acquire(self, figsize=None, dpi=DEFAULT_DPI):
+        """Returns the empty Figure for this layout, creating it on first use."""
+        key = (tuple(figsize) if figsize is not None else None, dpi)
+        fig = self._figures.get(key)
+        if fig is None:
+            fig = mfigure.Figure(figsize=figsize, dpi=dpi)
+            self._figures[key] = fig
+        return fig
+
+    def clear(self):
+        """Drops every pooled Figure."""
+        self._figures.clear()
+
+    def __len__(self):
+        return len(self._figures)
+
+
+def _reset(fig):
+    """Empties a Figure and restores the subplot margins a draw may have adjusted."""
+    fig.clear()
+    fig.subplots_adjust(**{name: mpl.rcParams[f'figure.subplot.{name}'] for name in _SUBPLOT_PARAMS})
+
+
+def render(draw, *args, fmt='png', figsize=None, dpi=DEFAULT_DPI, pool=None, buffer=None, **kwargs):
+    """
+    Calls draw(fig, *args, **kwargs) on a fresh (or pooled) Figure and saves it as `fmt`.
+    Returns the image bytes, or `buffer` itself when a writable buffer is given.
+    The Figure is always cleared afterwards, even if drawing fails.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}. Use one of {FORMATS}.")
+    if pool is not None:
+        fig = pool.acquire(figsize, dpi)
+    else:
+        fig = mfigure.Figure(figsize=figsize, dpi=dpi)
+
+    out = BytesIO() if buffer is None else buffer
+    try:
+        draw(fig, *args, **kwargs)
+        fig.savefig(out, format=fmt)
+    finally:
+        _reset(fig)
+    return out.getvalue() if buffer is None else buffer
+
+#------------------------------------------------------Budget Charts------------------------------------------------------------------------------
+# The first three charts accept either tracker: budgetManagement.IncomeTracker or incomeTracker.IncomeTracker
+
+def pie_chart_distribution(tracker, isIncome, **options):
+    """Renders IncomeTracker.pie_chart_distribution."""
+    return render(tracker.draw_pie_chart_distribution, isIncome, **options)
+
+def bar_graph_income_vs_expenses1(tracker, **options):
+    """Renders IncomeTracker.bar_graph_income_vs_expenses1."""
+    options.setdefault('figsize', WIDE)
+    return render(tracker.draw_bar_graph_income_vs_expenses1, **options)
+
+def bar_graph_income_vs_expenses2(tracker, **options):
+    """Renders IncomeTracker.bar_graph_income_vs_expenses2."""
+    return render(tracker.draw_bar_graph_income_vs_expenses2, **options)
+
+def budget_progress_bar(tracker, **options):
+    """Renders IncomeTracker.budget_progress_bar."""
+    return render(tracker.draw_budget_progress_bar, **options)
+
+def real_time_budget_comparison(tracker, **options):
+    """Renders IncomeTracker.real_time_budget_comparison."""
+    return render(tracker.draw_real_time_budget_comparison, **options)
+
+def disposable_income_summary(tracker, **options):
+    """Renders IncomeTracker.disposable_income_summary."""
+    return render(tracker.draw_disposable_income_summary, **options)
+
+def plot_forecast(tracker, *args, **options):
+    """Renders IncomeTracker.plot_forecast; extra arguments are (months, planned_expenses, model)."""
+    options.setdefault('figsize', WIDE)
+    return render(tracker.draw_forecast, *args, **options)
+
+#------------------------------------------------------Debt Charts--------------------------------------------------------------------------------
+
+def plot_debt_progress(debt_manager, **options):
+    """Renders DebtManagement.plot_debt_progress."""
+    options.setdefault('figsize', WIDE)
+    return render(debt_manager.draw_debt_progress, **options)
+
+def plot_debt_progress_line(debt_manager, **options):
+    """Renders DebtManagement.plot_debt_progress_line."""
+    options.setdefault('figsize', WIDE)
+    return render(debt_manager.draw_debt_progress_line, **options)
+
+#------------------------------------------------------Financial Health Charts--------------------------------------------------------------------
+
+def plot_score_evolution(health, **options):
+    """Renders FinancialHealth.plot_score_evolution."""
+    options.setdefault('figsize', WIDE)
+    return render(health.draw_score_evolution, **options)
+
+def display_income_expense_summary(health, **options):
+    """Renders FinancialHealth.display_income_expense_summary."""
+    return render(health.draw_income_expense_summary, **options)
+
+def display_savings_capacity_gauge(health, **options):
+    """Renders FinancialHealth.display_savings_capacity_gauge."""
+    options.setdefault('figsize', SQUARE)
+    return render(health.draw_savings_capacity_gauge, **options)
+
+def display_debt_vs_savings_balance(health, **options):
+    """Renders FinancialHealth.display_debt_vs_savings_balance."""
+    return render(health.draw_debt_vs_savings_balance, **options)
+
+def plot_debt_savings_trend(health, **options):
+    """Renders FinancialHealth.plot_debt_savings_trend."""
+    options.setdefault('figsize', WIDE)
+    return render(health.draw_debt_savings_trend, **options)
+
+def display_liquid_assets_pie_chart(health, **options):
+    """Renders FinancialHealth.display_liquid_assets_pie_chart."""
+    options.setdefault('figsize', LARGE_SQUARE)
+    return render(health.draw_liquid_assets_pie_chart, **options)
+
+#---------------------------------------------------Example Usage---------------------------------------------------------------------------------------------------
+
+# tracker = IncomeTracker()
+# tracker.add_income_source("Salary", 3000, 'M')
+# tracker.add_expense_source("Rent", 1000, 'M')
+# png = pie_chart_distribution(tracker, True)
+# pool = FigurePool()
+# svgs = [budget_progress_bar(tracker, fmt='svg', pool=pool) for _ in range(3)]
@@ -1,29 +1,97 @@
 # income_tracker.py
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.patches import Patch
+import numpy as np
+import frequencyEngine
 import utilities
+from records import SourceEntry
+
+# Plotting libraries are imported on first use, so compute-only callers never load them
+mpl = utilities.LazyModule("matplotlib")
+plt = utilities.LazyModule("matplotlib.pyplot")
+mpatches = utilities.LazyModule("matplotlib.patches")
 
 
 class IncomeTracker:
     def __init__(self):
         self.utilities = utilities.Utilities()
-        self.income_sources = {}  # {source: (amount, frequency, daily_amount)}
-        self.expenses_sources = {}  # {source: (amount, frequency, daily_amount)}
+        self.income_sources = {}  # {source: SourceEntry(amount, frequency, daily_amount)}
+        self.expenses_sources = {}  # {source: SourceEntry(amount, frequency, daily_amount)}
         self.total_income = 0
         self.total_expenses = 0
+        # Running sums of the raw amounts per frequencyEngine frequency id, for exact monthly roll-ups
+        self.income_by_frequency = [0.0] * len(frequencyEngine.FREQUENCIES)
+        self.expenses_by_frequency = [0.0] * len(frequencyEngine.FREQUENCIES)
+
+    def _set_income_source(self, source, entry):
+        """Stores an income entry, replacing any previous one without double counting it."""
+        previous = self.income_sources.get(source)
+        if previous is not None:
+            previous = SourceEntry.coerce(previous)  # Entries written directly may be plain tuples
+            self.total_income -= previous.daily_amount
+            self.income_by_frequency[frequencyEngine.frequency_id(previous.frequency)] -= previous.amount
+        self.income_sources[source] = entry
+        self.total_income += entry.daily_amount
+        self.income_by_frequency[frequencyEngine.frequency_id(entry.frequency)] += entry.amount
+
+    def _set_expense_source(self, source, entry):
+        """Stores an expense entry, replacing any previous one without double counting it."""
+        previous = self.expenses_sources.get(source)
+        if previous is not None:
+            previous = SourceEntry.coerce(previous)
+            self.total_expenses -= previous.daily_amount
+            self.expenses_by_frequency[frequencyEngine.frequency_id(previous.frequency)] -= previous.amount
+        self.expenses_sources[source] = entry
+        self.total_expenses += entry.daily_amount
+        self.expenses_by_frequency[frequencyEngine.frequency_id(entry.frequency)] += entry.amount
 
     def add_income_source(self, source, amount, frequency):
-        """Add an income source with the specified frequency."""
+        """Add an income source with the specified frequency, replacing it if it already exists."""
         daily_amount = self.utilities.calculate_daily_amount(amount, frequency)
-        self.income_sources[source] = (amount, frequency, daily_amount)
-        self.total_income += daily_amount
+        self._set_income_source(source, SourceEntry(amount, frequency, daily_amount))
 
     def add_expense_source(self, source, amount, frequency):
-        """Add an expense source with the specified frequency."""
+        """Add an expense source with the specified frequency, replacing it if it already exists."""
         daily_amount = self.utilities.calculate_daily_amount(amount, frequency)
-        self.expenses_sources[source] = (amount, frequency, daily_amount)
-        self.total_expenses += daily_amount
+        self._set_expense_source(source, SourceEntry(amount, frequency, daily_amount))
+
+    def add_income_sources(self, sources, amounts, frequencies):
+        """Add several income sources at once, converting all frequencies in one vectorized pass."""
+        daily_amounts = self.utilities.calculate_daily_amounts(amounts, frequencies)
+        for source, amount, frequency, daily_amount in zip(
+            sources, np.asarray(amounts).tolist(), np.asarray(frequencies).tolist(), daily_amounts.tolist()
+        ):
+            self._set_income_source(source, SourceEntry(amount, frequency, daily_amount))
+
+    def add_expense_sources(self, sources, amounts, frequencies):
+        """Add several expense sources at once, converting all frequencies in one vectorized pass."""
+        daily_amounts = self.utilities.calculate_daily_amounts(amounts, frequencies)
+        for source, amount, frequency, daily_amount in zip(
+            sources, np.asarray(amounts).tolist(), np.asarray(frequencies).tolist(), daily_amounts.tolist()
+        ):
+            self._set_expense_source(source, SourceEntry(amount, frequency, daily_amount))
+
+    def remove_income_source(self, source):
+        """Remove an income source and take it out of the running total."""
+        if source not in self.income_sources:
+            print(f"Income source {source} not found.")
+            return
+        amount, frequency, daily_amount = self.income_sources.pop(source)
+        self.total_income -= daily_amount
+        self.income_by_frequency[frequencyEngine.frequency_id(frequency)] -= amount
+        if not self.income_sources:
+            self.total_income = 0  # Drop accumulated rounding error
+            self.income_by_frequency = [0.0] * len(frequencyEngine.FREQUENCIES)
+
+    def remove_expense_source(self, source):
+        """Remove an expense source and take it out of the running total."""
+        if source not in self.expenses_sources:
+            print(f"Expense source {source} not found.")
+            return
+        amount, frequency, daily_amount = self.expenses_sources.pop(source)
+        self.total_expenses -= daily_amount
+        self.expenses_by_frequency[frequencyEngine.frequency_id(frequency)] -= amount
+        if not self.expenses_sources:
+            self.total_expenses = 0  # Drop accumulated rounding error
+            self.expenses_by_frequency = [0.0] * len(frequencyEngine.FREQUENCIES)
 
     def get_total_income(self):
         """Returns the total daily equivalent income."""
@@ -33,8 +101,30 @@ class IncomeTracker:
         """Returns the total daily equivalent expenses."""
         return self.total_expenses
 
+    def get_monthly_income(self, year=None, month=None):
+        """Total recurring income over a calendar month (default: an average month), see frequencyEngine."""
+        return frequencyEngine.monthly_total(self.income_by_frequency, year, month)
+
+    def get_monthly_expenses(self, year=None, month=None):
+        """Total recurring expenses over a calendar month (default: an average month), see frequencyEngine."""
+        return frequencyEngine.monthly_total(self.expenses_by_frequency, year, month)
+
     def pie_chart_distribution(self, is_income=True):
         """Generates a pie chart for income or expenses distribution."""
+        total = self.total_income if is_income else self.total_expenses
+        if total == 0:
+            title = "Monthly Income Distribution" if is_income else "Monthly Expenses Distribution"
+            print(f"No data to display for {title.lower()}.")
+            return
+
+        fig = plt.figure()
+        self.draw_pie_chart_distribution(fig, is_income)
+
+        # Show the pie chart
+        plt.show()
+
+    def draw_pie_chart_distribution(self, fig, is_income=True):
+        """Draws the income or expenses distribution pie chart onto a matplotlib Figure."""
         if is_income:
             total = self.total_income
             title = "Monthly Income Distribution"
@@ -45,14 +135,15 @@ class IncomeTracker:
             hash_map = self.expenses_sources
 
         if total == 0:
-            print(f"No data to display for {title.lower()}.")
-            return
+            raise ValueError(f"No data to display for {title.lower()}.")
+
+        ax = fig.add_subplot()
 
         # Convert hash_map to a list for indexing
         hash_items = list(hash_map.items())
 
         # Define colors for the pie chart slices
-        colors = plt.cm.Paired(range(len(hash_items)))
+        colors = mpl.colormaps["Paired"](range(len(hash_items)))
 
         # Calculate the percentage of each source along with its assigned color
         percentages = {
@@ -72,15 +163,15 @@ class IncomeTracker:
         pie_colors = [color for value, color in filtered_percentages.values()]
 
         # Create the pie chart with non-zero values
-        wedges, _, _ = plt.pie(pie_values, autopct="%1.1f%%", colors=pie_colors)
+        wedges, _, _ = ax.pie(pie_values, autopct="%1.1f%%", colors=pie_colors)
 
         # Create custom legend patches to match the colors
         legend_patches = [
-            Patch(color=percentages[key][1], label=key) for key in percentages.keys()
+            mpatches.Patch(color=percentages[key][1], label=key) for key in percentages.keys()
         ]
 
         # Add a legend with custom colored patches
-        plt.legend(
+        ax.legend(
             handles=legend_patches,
             loc="center left",
             bbox_to_anchor=(0.9, 0.5),
@@ -88,14 +179,21 @@ class IncomeTracker:
         )
 
         # Enlarge the title of the chart
-        plt.title(title, fontsize=18)
+        ax.set_title(title, fontsize=18)
 
-        plt.axis("equal")  # Equal aspect ratio ensures that pie is drawn as a circle
+        ax.axis("equal")  # Equal aspect ratio ensures that pie is drawn as a circle
 
-        # Show the pie chart
+    def bar_graph_income_vs_expenses1(self):
+        fig = plt.figure(figsize=(10, 6))
+        self.draw_bar_graph_income_vs_expenses1(fig)
+
+        # Display the bar graph
         plt.show()
 
-    def bar_graph_income_vs_expenses1(self):
+    def draw_bar_graph_income_vs_expenses1(self, fig):
+        """Draws the segmented income vs expenses bar graph onto a matplotlib Figure."""
+        ax = fig.add_subplot()
+
         # Get income and expense sources separately
         income_sources = {key: value[2] for key, value in self.income_sources.items()}
         expense_sources = {key: value[2] for key, value in self.expenses_sources.items()}
@@ -109,36 +207,42 @@ class IncomeTracker:
         # Combine sorted income and expenses
         all_sorted_categories = [item[0] for item in sorted_income] + [item[0] for item in sorted_expenses]
         
-        # Create a DataFrame for the bar graph, ensuring alignment of categories
-        data = {
-            'Income': [income_sources.get(category, 0) for category in all_sorted_categories],
-            'Expenses': [-expense_sources.get(category, 0) for category in all_sorted_categories]  # Negative for expenses
-        }
-        
-        # Create a DataFrame with the correct order
-        df = pd.DataFrame(data, index=all_sorted_categories)
-
-        # Plot the bar graph
-        ax = df.plot(kind='bar', stacked=True, figsize=(10, 6), color=['green', 'red'])
+        # Income and expense amounts aligned on the combined categories
+        income = [income_sources.get(category, 0) for category in all_sorted_categories]
+        expenses = [-expense_sources.get(category, 0) for category in all_sorted_categories]  # Negative for expenses
+
+        # Plot the bar graph (income above the axis, expenses below), drawn on the axes directly
+        # rather than through DataFrame.plot, which would load pyplot
+        positions = np.arange(len(all_sorted_categories))
+        ax.bar(positions, income, width=0.5, color='green')
+        ax.bar(positions, expenses, width=0.5, color='red')
+        ax.set_xticks(positions)
+        ax.set_xticklabels(all_sorted_categories, rotation=90)
 
         # Add legends for income and expenses
-        income_legend = [Patch(color='green', label=key) for key, _ in sorted_income]
-        expense_legend = [Patch(color='red', label=key) for key, _ in sorted_expenses]
+        income_legend = [mpatches.Patch(color='green', label=key) for key, _ in sorted_income]
+        expense_legend = [mpatches.Patch(color='red', label=key) for key, _ in sorted_expenses]
 
         # Add separate legend boxes
-        income_legend_box = plt.legend(handles=income_legend, loc="upper left", title="Income", bbox_to_anchor=(0.75, 1), fontsize=10)
-        plt.gca().add_artist(income_legend_box)  # To keep both legends
-        plt.legend(handles=expense_legend, loc="upper right", title="Expenses", bbox_to_anchor=(0.25, 0.5), fontsize=10)
+        income_legend_box = ax.legend(handles=income_legend, loc="upper left", title="Income", bbox_to_anchor=(0.75, 1), fontsize=10)
+        ax.add_artist(income_legend_box)  # To keep both legends
+        ax.legend(handles=expense_legend, loc="upper right", title="Expenses", bbox_to_anchor=(0.25, 0.5), fontsize=10)
 
         # Add labels and title
-        plt.xlabel('Categories')
-        plt.ylabel('Amount (Daily Equivalent)')
-        plt.title('Segmented Income vs Expenses')
+        ax.set_xlabel('Categories')
+        ax.set_ylabel('Amount (Daily Equivalent)')
+        ax.set_title('Segmented Income vs Expenses')
+        fig.tight_layout()
 
-        # Display the bar graph
+    def bar_graph_income_vs_expenses2(self):
+        fig = plt.figure()
+        self.draw_bar_graph_income_vs_expenses2(fig)
+
+        # Show the plot
         plt.show()
 
-    def bar_graph_income_vs_expenses2(self):
+    def draw_bar_graph_income_vs_expenses2(self, fig):
+        """Draws the stacked income and expenses breakdown onto a matplotlib Figure."""
         # Get income and expense sources separately
         income_sources = {key: value[2] for key, value in self.income_sources.items()}
         expense_sources = {key: value[2] for key, value in self.expenses_sources.items()}
@@ -157,8 +261,8 @@ class IncomeTracker:
         income_colors = ['#ff9999','#66b3ff','#99ff99', '#ffcc99']
         expense_colors = ['#c2c2f0','#ffb3e6','#c4e17f', '#ff9999']
 
-        # Create figure and axis
-        fig, ax = plt.subplots()
+        # Create the axis
+        ax = fig.add_subplot()
 
         # Plot the stacked bar for income categories
         income_bottom = 0
@@ -179,44 +283,42 @@ class IncomeTracker:
         # Display legend
         ax.legend(loc='upper right', bbox_to_anchor=(1.15, 1))
 
-        # Show the plot
-        plt.tight_layout()
-        plt.show()
+        fig.tight_layout()
 
 #---------------------------------------------------Example Usage---------------------------------------------------------------------------------------------------
-incomeTrack = IncomeTracker()
-
-# We can take user input for income and expenses or use sample data
-
-# salary = int(input("Enter your salary: "))
-# salary_frequency = input("Enter your salary frequency (input D for daily, W for weekly, M for monthly, or O for one-time): ")
-# passive_income = int(input("Enter your passive income: "))
-# passive_income_frequency = input("Enter your passive income frequency (input D for daily, W for weekly, M for monthly, or O for one-time): ")
-# extra_income = int(input("Enter your extra income: "))
-# extra_income_frequency = input("Enter your extra income frequency (input D for daily, W for weekly, M for monthly, or O for one-time): ")
-
-# sample data
-salary = 1000
-salary_frequency = 'M'
-passive_income = 500
-passive_income_frequency = 'M'
-extra_income = 200
-extra_income_frequency = 'M'
-
-# Adding income sources
-incomeTrack.add_income_source("Salary", salary, salary_frequency)
-incomeTrack.add_income_source("Passive Income", passive_income, passive_income_frequency)
-incomeTrack.add_income_source("Extra Income", extra_income, extra_income_frequency)
-
-# Adding example expenses
-incomeTrack.add_expense_source("Rent", 1500, 'M')
-incomeTrack.add_expense_source("Food", 500, 'M')
-incomeTrack.add_expense_source("Entertainment", 200, 'M')
-
-# Generate Pie Chart for Income Distribution
-incomeTrack.pie_chart_distribution(is_income=True) 
-incomeTrack.pie_chart_distribution(is_income=False) # expenses
-
-# Generate Bar Graph for Total Income vs Total Expense
-incomeTrack.bar_graph_income_vs_expenses1()
-incomeTrack.bar_graph_income_vs_expenses2()
\ No newline at end of file
+# incomeTrack = IncomeTracker()
+
+# # We can take user input for income and expenses or use sample data
+
+# # salary = int(input("Enter your salary: "))
+# # salary_frequency = input("Enter your salary frequency (input D for daily, W for weekly, M for monthly, or O for one-time): ")
+# # passive_income = int(input("Enter your passive income: "))
+# # passive_income_frequency = input("Enter your passive income frequency (input D for daily, W for weekly, M for monthly, or O for one-time): ")
+# # extra_income = int(input("Enter your extra income: "))
+# # extra_income_frequency = input("Enter your extra income frequency (input D for daily, W for weekly, M for monthly, or O for one-time): ")
+
+# # sample data
+# salary = 1000
+# salary_frequency = 'M'
+# passive_income = 500
+# passive_income_frequency = 'M'
+# extra_income = 200
+# extra_income_frequency = 'M'
+
+# # Adding income sources
+# incomeTrack.add_income_source("Salary", salary, salary_frequency)
+# incomeTrack.add_income_source("Passive Income", passive_income, passive_income_frequency)
+# incomeTrack.add_income_source("Extra Income", extra_income, extra_income_frequency)
+
+# # Adding example expenses
+# incomeTrack.add_expense_source("Rent", 1500, 'M')
+# incomeTrack.add_expense_source("Food", 500, 'M')
+# incomeTrack.add_expense_source("Entertainment", 200, 'M')
+
+# # Generate Pie Chart for Income Distribution
+# incomeTrack.pie_chart_distribution(is_income=True) 
+# incomeTrack.pie_chart_distribution(is_income=False) # expenses
+
+# # Generate Bar Graph for Total Income vs Total Expense
+# incomeTrack.bar_graph_income_vs_expenses1()
+# incomeTrack.bar_graph_income_vs_expenses2()
\ No newline at end of file
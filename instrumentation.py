@@ -0,0 +1,217 @@
+# instrumentation.py
+import functools
+import inspect
+import json
+import random
+import threading
+import time
+
+import numpy as np
+
+
+def default_targets():
+    """The classes instrumented when a Profiler is given no targets."""
+    from budgetManagement import IncomeTracker
+    from debtManagement import DebtManagement
+    from emergencyFund import EmergencyFund
+    from financialHealth import FinancialHealth
+    return [IncomeTracker, DebtManagement, EmergencyFund, FinancialHealth]
+
+
+def count_items(args, kwargs):
+    """
+    Default item count of a call (args[0] is self): the length of the first sized argument
+    (a list, array or mapping of sources, debts, ...), or 1 for calls on scalar arguments.
+    """
+    for value in (*args[1:], *kwargs.values()):
+        if isinstance(value, (str, bytes)):
+            continue
+        try:
+            return len(value)
+        except TypeError:
+            continue
+    return 1
+
+
+class MethodStats:
+    """Timings of one instrumented method. Durations are kept as a bounded reservoir sample."""
+
+    def __init__(self, max_samples, rng):
+        self.calls = 0
+        self.items = 0
+        self.total_ns = 0
+        self._samples = []
+        self._max_samples = max_samples
+        self._rng = rng
+
+    def clear(self):
+        """Forgets every recorded call."""
+        self.calls = 0
+        self.items = 0
+        self.total_ns = 0
+        self._samples = []
+
+    def record(self, duration_ns, items):
+        self.calls += 1
+        self.items += items
+        self.total_ns += duration_ns
+        if len(self._samples) < self._max_samples:
+            self._samples.append(duration_ns)
+        else:
+            # Reservoir sampling: every call so far has the same chance of being kept
+            slot = self._rng.randrange(self.calls)
+            if slot < self._max_samples:
+                self._samples[slot] = duration_ns
+
+    def as_dict(self):
+        samples = np.array(self._samples, dtype=np.float64) / 1e6
+        total_s = self.total_ns / 1e9
+        return {
+            'calls': self.calls,
+            'items': self.items,
+            'total_s': total_s,
+            'mean_ms': total_s * 1000 / self.calls if self.calls else None,
+            'p50_ms': float(np.percentile(samples, 50)) if len(samples) else None,
+            'p99_ms': float(np.percentile(samples, 99)) if len(samples) else None,
+            'items_per_second': self.items / total_s if total_s else None,
+        }
+
+
+# Methods currently wrapped, shared by all active profilers: (class, name) -> _Patch.
+# Patching is process-wide, so each method is wrapped once however many profilers overlap.
+_patches = {}
+_patches_lock = threading.Lock()
+
+
+class _Patch:
+    """The one wrapper installed on a method, dispatching every call to the profilers recording it."""
+
+    def __init__(self, cls, name, original):
+        self.cls = cls
+        self.name = name
+        self.original = original
+        self.label = f'{cls.__name__}.{name}'
+        self.profilers = ()  # Replaced, never mutated, so calls read it without locking
+        patch = self
+
+        @functools.wraps(original)
+        def instrumented(*args, **kwargs):
+            profilers = patch.profilers
+            if not profilers:
+                return original(*args, **kwargs)  # Called through a reference taken while patched
+            items = [profiler._count(patch.label, args, kwargs) for profiler in profilers]
+            start = time.perf_counter_ns()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                duration = time.perf_counter_ns() - start
+                for profiler, count in zip(profilers, items):
+                    profiler._record(patch.label, duration, count)
+        self.wrapper = instrumented
+
+
+class Profiler:
+    """
+    Opt-in instrumentation of the public methods of a set of classes.
+
+    Inside `with Profiler() as profiler:` every public method (name not starting with '_')
+    defined on the target classes is wrapped to record its call count, cumulative and
+    p50/p99 wall time and items processed.
+
+    The scope is process-wide, not per thread: while a profiler is active the methods are
+    patched on the classes themselves, and calls from every thread are recorded. Profilers
+    may overlap and exit in any order; each method is wrapped once, every call is recorded
+    by the profilers active at that moment, and the original method is restored when the
+    last profiler using it exits, so code pays nothing once no profiler is active.
+
+    Times are inclusive: a method calling another instrumented method counts the inner call
+    in its own time too. `item_counters` maps "Class.method" to a function of
+    (args, kwargs), args starting with self, returning the number of items a call
+    processes (default: count_items).
+    """
+
+    def __init__(self, targets=None, max_samples=4096, item_counters=None, seed=None):
+        self.targets = default_targets() if targets is None else list(targets)
+        self.max_samples = max_samples
+        self.item_counters = item_counters or {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._patches = []  # _Patch of every method this profiler records while active
+        self.started = None
+        self.seconds = 0.0
+
+    def _count(self, label, args, kwargs):
+        return self.item_counters.get(label, count_items)(args, kwargs)
+
+    def _record(self, label, duration_ns, items):
+        with self._lock:
+            self._stats[label].record(duration_ns, items)
+
+    def __enter__(self):
+        if self._patches:
+            raise RuntimeError("This profiler is already active.")
+        with _patches_lock:
+            for cls in self.targets:
+                for name, attribute in list(vars(cls).items()):
+                    if name.startswith('_'):
+                        continue
+                    patch = _patches.get((cls, name))
+                    if patch is None:
+                        if not inspect.isfunction(attribute):
+                            continue
+                        patch = _patches[cls, name] = _Patch(cls, name, attribute)
+                        setattr(cls, name, patch.wrapper)
+                    if self in patch.profilers:
+                        continue  # Class listed twice in targets
+                    self._stats.setdefault(patch.label, MethodStats(self.max_samples, self._rng))
+                    patch.profilers += (self,)
+                    self._patches.append(patch)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        with _patches_lock:
+            for patch in self._patches:
+                patch.profilers = tuple(profiler for profiler in patch.profilers if profiler is not self)
+                if not patch.profilers:
+                    setattr(patch.cls, patch.name, patch.original)
+                    del _patches[patch.cls, patch.name]
+        self._patches = []
+        self.seconds += time.perf_counter() - self.started
+
+    def snapshot(self, include_uncalled=False):
+        """Returns {"Class.method": stats} for the methods called so far, slowest total first."""
+        with self._lock:
+            methods = {name: stats.as_dict() for name, stats in self._stats.items()
+                       if include_uncalled or stats.calls}
+        ordered = sorted(methods.items(), key=lambda item: -item[1]['total_s'])
+        return {'seconds': self.seconds, 'methods': dict(ordered)}
+
+    def to_json(self, path=None, **snapshot_options):
+        """Returns the snapshot as JSON text, also writing it to `path` if given."""
+        text = json.dumps(self.snapshot(**snapshot_options), indent=2)
+        if path is not None:
+            with open(path, 'w') as file:
+                file.write(text)
+        return text
+
+    def reset(self):
+        """Clears all recorded statistics; safe while the profiler is active."""
+        with self._lock:
+            for stats in self._stats.values():
+                stats.clear()  # In place: active wrappers keep recording into the same objects
+            self.seconds = 0.0
+            if self._patches:
+                self.started = time.perf_counter()
+
+#---------------------------------------------------Example Usage---------------------------------------------------------------------------------------------------
+
+# with Profiler() as profiler:
+#     generate_monthly_batch()
+# print(profiler.to_json())
+#
+# # Only the debt code, counting the debts a simulation works through
+# with Profiler([DebtManagement], item_counters={
+#     'DebtManagement.simulate_payoff': lambda args, kwargs: len(args[0].debts)}) as profiler:
+#     ...
@@ -0,0 +1,423 @@
+# population_ledger.py
+from collections.abc import MutableMapping
+
+import numpy as np
+
+import frequencyEngine
+import utilities
+from budgetManagement import IncomeTracker
+from records import SourceEntry
+
+# Rows are looked up by a combined (user_id, category_id) key packed into one int64.
+KEY_SHIFT = 32
+MAX_USER_ID = 2**31 - 1
+
+# Rows appended since the last index rebuild are scanned directly until the tail grows past this.
+_MIN_TAIL = 4096
+
+
+class Interner:
+    """Maps labels (category names, frequency codes) to dense integer ids."""
+
+    def __init__(self):
+        self.labels = []
+        self.ids = {}
+
+    def __len__(self):
+        return len(self.labels)
+
+    def intern(self, label):
+        """Returns the id of a label, assigning a new one if it has not been seen."""
+        label_id = self.ids.get(label)
+        if label_id is None:
+            label_id = len(self.labels)
+            self.ids[label] = label_id
+            self.labels.append(label)
+        return label_id
+
+    def intern_many(self, labels):
+        """Vectorized intern: only the distinct labels go through the dictionary."""
+        labels = np.asarray(labels)
+        if len(labels) == 0:
+            return np.empty(0, dtype=np.int64)
+        uniques, inverse = np.unique(labels, return_inverse=True)
+        ids = np.array([self.intern(label) for label in uniques.tolist()], dtype=np.int64)
+        return ids[inverse.reshape(-1)]
+
+    def lookup(self, label):
+        """Returns the id of a label, or -1 if it has never been interned."""
+        return self.ids.get(label, -1)
+
+    def lookup_many(self, labels):
+        """Vectorized lookup; labels that have never been interned give -1."""
+        labels = np.asarray(labels)
+        if len(labels) == 0:
+            return np.empty(0, dtype=np.int64)
+        uniques, inverse = np.unique(labels, return_inverse=True)
+        ids = np.array([self.lookup(label) for label in uniques.tolist()], dtype=np.int64)
+        return ids[inverse.reshape(-1)]
+
+
+class SourceLedger:
+    """
+    Columnar table of income or expense sources for a whole population.
+    Each row holds user id, category id, amount, frequency id and daily amount;
+    a (user, category) pair appears at most once, like a key of IncomeTracker.income_sources.
+    """
+
+    _COLUMNS = ('_user_id', '_category_id', '_amount', '_frequency_id', '_daily_amount', '_live')
+
+    def __init__(self, categories, frequencies, capacity=1024):
+        self.utilities = utilities.Utilities()
+        self.categories = categories  # Interner shared with the other ledger
+        self.frequencies = frequencies
+        self._user_id = np.empty(capacity, dtype=np.int64)
+        self._category_id = np.empty(capacity, dtype=np.int32)
+        self._amount = np.empty(capacity, dtype=np.float64)
+        self._frequency_id = np.empty(capacity, dtype=np.int16)
+        self._daily_amount = np.empty(capacity, dtype=np.float64)
+        self._live = np.zeros(capacity, dtype=bool)  # False marks a deleted row
+        self._size = 0  # Rows in use, including deleted ones
+        self._num_live = 0
+        # Sorted keys of the rows below self._indexed, with their row positions
+        self._index_keys = np.empty(0, dtype=np.int64)
+        self._index_rows = np.empty(0, dtype=np.int64)
+        self._indexed = 0
+
+    def __len__(self):
+        return self._num_live
+
+#-------------------------------------------------------Storage & Index--------------------------------------------------------------------------------------------
+
+    def _reserve(self, extra):
+        """Grows every column so that `extra` more rows fit (amortized doubling)."""
+        needed = self._size + extra
+        capacity = len(self._user_id)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, 2 * capacity)
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def _keys(self, start=0, stop=None):
+        stop = self._size if stop is None else stop
+        return (self._user_id[start:stop] << KEY_SHIFT) | self._category_id[start:stop]
+
+    def _compact(self):
+        """Drops deleted rows, keeping the insertion order of the live ones."""
+        live = self._live[:self._size]
+        keep = np.flatnonzero(live)
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            column[:len(keep)] = column[keep]
+        self._live[len(keep):self._size] = False
+        self._size = len(keep)
+        self._index_keys = np.empty(0, dtype=np.int64)
+        self._index_rows = np.empty(0, dtype=np.int64)
+        self._indexed = 0
+
+    def _refresh_index(self, force=False):
+        """Rebuilds the sorted key index once the unindexed tail is large enough."""
+        dead = self._size - self._num_live
+        if dead > self._num_live:
+            self._compact()
+            force = True
+        tail = self._size - self._indexed
+        if tail == 0 or (not force and tail <= max(_MIN_TAIL, self._indexed >> 4)):
+            return
+        rows = np.flatnonzero(self._live[:self._size])
+        keys = self._keys()[rows]
+        order = np.argsort(keys, kind='stable')
+        self._index_keys = keys[order]
+        self._index_rows = rows[order]
+        self._indexed = self._size
+
+    def _lookup(self, keys):
+        """Row positions of the live rows holding `keys`, or -1 where absent."""
+        self._refresh_index()
+        keys = np.asarray(keys, dtype=np.int64)
+        rows = np.full(len(keys), -1, dtype=np.int64)
+        if len(self._index_keys):
+            pos = np.minimum(np.searchsorted(self._index_keys, keys), len(self._index_keys) - 1)
+            hit = self._index_keys[pos] == keys
+            rows[hit] = self._index_rows[pos[hit]]
+        if self._size > self._indexed:
+            # A key appended after the index was built overrides it; only its newest row can be live
+            tail_keys = self._keys(self._indexed)
+            order = np.argsort(tail_keys, kind='stable')
+            sorted_tail = tail_keys[order]
+            pos = np.searchsorted(sorted_tail, keys, side='right') - 1
+            hit = (pos >= 0) & (sorted_tail[np.maximum(pos, 0)] == keys)
+            rows[hit] = self._indexed + order[pos[hit]]
+        found = rows >= 0
+        rows[found & ~self._live[np.maximum(rows, 0)]] = -1
+        return rows
+
+    def _user_rows(self, user_id):
+        """Live row positions of one user, in insertion order."""
+        self._refresh_index()
+        lo = np.searchsorted(self._index_keys, user_id << KEY_SHIFT)
+        hi = np.searchsorted(self._index_keys, (user_id + 1) << KEY_SHIFT)
+        rows = self._index_rows[lo:hi]
+        if self._size > self._indexed:
+            tail = self._indexed + np.flatnonzero(self._user_id[self._indexed:self._size] == user_id)
+            rows = np.concatenate([rows, tail])
+        rows = rows[self._live[rows]]
+        rows.sort()
+        return rows
+
+    def _daily_amounts(self, amounts, frequency_ids):
+        codes = np.asarray(self.frequencies.labels, dtype=object)[frequency_ids]
+        return self.utilities.calculate_daily_amounts(amounts, codes)
+
+    def _check_user_ids(self, user_ids):
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        if len(user_ids) and (user_ids.min() < 0 or user_ids.max() > MAX_USER_ID):
+            raise ValueError(f"User ids must be between 0 and {MAX_USER_ID}.")
+        return user_ids
+
+    def _category_keys(self, user_ids, categories, intern):
+        """Combined keys for (user, category) pairs; unknown categories give -1 unless interned."""
+        user_ids = self._check_user_ids(user_ids)
+        if intern:
+            category_ids = self.categories.intern_many(categories)
+        else:
+            category_ids = self.categories.lookup_many(categories)
+        keys = (user_ids << KEY_SHIFT) | category_ids
+        keys[category_ids < 0] = -1
+        return user_ids, category_ids, keys
+
+#-------------------------------------------------------Bulk Add / Update / Delete-----------------------------------------------------------------------------------
+
+    def add(self, user_ids, categories, amounts, frequencies, daily_amounts=None):
+        """
+        Adds or replaces sources in bulk, with the same semantics as assigning
+        `income_sources[category] = (amount, frequency, daily_amount)` row by row.
+        Daily amounts are derived from the frequencies unless given.
+        """
+        user_ids, category_ids, keys = self._category_keys(user_ids, categories, intern=True)
+        amounts = np.asarray(amounts, dtype=np.float64)
+        frequency_ids = self.frequencies.intern_many(frequencies)
+        if daily_amounts is None:
+            daily_amounts = self._daily_amounts(amounts, frequency_ids)
+        daily_amounts = np.asarray(daily_amounts, dtype=np.float64)
+        if not (len(keys) == len(amounts) == len(frequency_ids) == len(daily_amounts)):
+            raise ValueError("All columns must have the same length.")
+
+        # Repeated keys in one batch: position of the first occurrence, values of the last
+        uniques, first = np.unique(keys, return_index=True)
+        if len(uniques) < len(keys):
+            _, reversed_first = np.unique(keys[::-1], return_index=True)
+            last = len(keys) - 1 - reversed_first
+            order = np.argsort(first)
+            first, last = first[order], last[order]
+            user_ids, category_ids, keys = user_ids[first], category_ids[first], keys[first]
+            amounts, frequency_ids, daily_amounts = amounts[last], frequency_ids[last], daily_amounts[last]
+
+        rows = self._lookup(keys)
+        existing = rows >= 0
+        hit = rows[existing]
+        self._amount[hit] = amounts[existing]
+        self._frequency_id[hit] = frequency_ids[existing]
+        self._daily_amount[hit] = daily_amounts[existing]
+
+        new = ~existing
+        count = int(new.sum())
+        self._reserve(count)
+        stop = self._size + count
+        self._user_id[self._size:stop] = user_ids[new]
+        self._category_id[self._size:stop] = category_ids[new]
+        self._amount[self._size:stop] = amounts[new]
+        self._frequency_id[self._size:stop] = frequency_ids[new]
+        self._daily_amount[self._size:stop] = daily_amounts[new]
+        self._live[self._size:stop] = True
+        self._size = stop
+        self._num_live += count
+
+    def update(self, user_ids, categories, amounts=None, frequencies=None):
+        """
+        Updates the amount and/or frequency of existing sources in bulk and recomputes their daily amounts.
+        Raises KeyError, leaving the ledger unchanged, if any pair does not exist.
+        """
+        _, _, keys = self._category_keys(user_ids, categories, intern=False)
+        rows = self._lookup(keys)
+        if (rows < 0).any():
+            raise KeyError(f"{int((rows < 0).sum())} (user, category) pairs do not exist.")
+        if amounts is not None:
+            self._amount[rows] = np.asarray(amounts, dtype=np.float64)
+        if frequencies is not None:
+            self._frequency_id[rows] = self.frequencies.intern_many(frequencies)
+        self._daily_amount[rows] = self._daily_amounts(self._amount[rows], self._frequency_id[rows])
+
+    def delete(self, user_ids, categories, missing_ok=False):
+        """
+        Deletes sources in bulk. Raises KeyError, leaving the ledger unchanged,
+        if any pair does not exist unless `missing_ok` is set.
+        """
+        _, _, keys = self._category_keys(user_ids, categories, intern=False)
+        rows = self._lookup(np.unique(keys))
+        if not missing_ok and (rows < 0).any():
+            raise KeyError(f"{int((rows < 0).sum())} (user, category) pairs do not exist.")
+        rows = rows[rows >= 0]
+        self._live[rows] = False
+        self._num_live -= len(rows)
+
+    def get_amounts(self, user_ids, categories):
+        """
+        Looks up the amounts of (user, category) pairs in bulk.
+        Returns (category_ids, amounts); amounts are NaN where the pair does not exist.
+        """
+        _, category_ids, keys = self._category_keys(user_ids, categories, intern=False)
+        rows = self._lookup(keys)
+        amounts = np.where(rows >= 0, self._amount[np.maximum(rows, 0)], np.nan)
+        return category_ids, amounts
+
+#-------------------------------------------------------Per-User Totals--------------------------------------------------------------------------------------------
+
+    def columns(self):
+        """Returns the live rows as a dict of column arrays (views when no rows are deleted)."""
+        if self._num_live < self._size:
+            self._compact()
+        n = self._size
+        return {
+            'user_id': self._user_id[:n],
+            'category_id': self._category_id[:n],
+            'amount': self._amount[:n],
+            'frequency_id': self._frequency_id[:n],
+            'daily_amount': self._daily_amount[:n],
+        }
+
+    def totals_by_user(self):
+        """Returns (user_ids, totals): the sum of daily amounts of every user with at least one source."""
+        columns = self.columns()
+        user_ids, inverse = np.unique(columns['user_id'], return_inverse=True)
+        # bincount accumulates in row order, i.e. in the same order IncomeTracker adds to its totals
+        totals = np.bincount(inverse, weights=columns['daily_amount'], minlength=len(user_ids))
+        return user_ids, totals
+
+    def monthly_totals_by_user(self, year=None, month=None):
+        """
+        Returns (user_ids, totals): the exact total of every user's sources over a calendar
+        month (default: an average month), converted with frequencyEngine.
+        """
+        columns = self.columns()
+        user_ids, inverse = np.unique(columns['user_id'], return_inverse=True)
+        engine_ids = frequencyEngine.frequency_ids(np.asarray(self.frequencies.labels, dtype=object))
+        monthly = frequencyEngine.to_monthly(columns['amount'], engine_ids[columns['frequency_id']], year, month)
+        totals = np.bincount(inverse, weights=monthly, minlength=len(user_ids))
+        return user_ids, totals
+
+    def totals(self, user_ids):
+        """Sum of daily amounts for each requested user (0 for users without sources)."""
+        return _lookup_totals(user_ids, *self.totals_by_user())
+
+    def monthly_totals(self, user_ids, year=None, month=None):
+        """Calendar month totals (see monthly_totals_by_user) for each requested user (0 for users without sources)."""
+        return _lookup_totals(user_ids, *self.monthly_totals_by_user(year, month))
+
+    def user_total(self, user_id):
+        """Sum of daily amounts for a single user."""
+        total = 0
+        for daily_amount in self._daily_amount[self._user_rows(user_id)]:
+            total += daily_amount
+        return float(total)
+
+
+def _lookup_totals(user_ids, known, totals):
+    """Picks the totals of `user_ids` out of per-user totals keyed by the sorted ids `known`."""
+    user_ids = np.asarray(user_ids, dtype=np.int64)
+    if len(known) == 0:
+        return np.zeros(len(user_ids))
+    pos = np.minimum(np.searchsorted(known, user_ids), len(known) - 1)
+    return np.where(known[pos] == user_ids, totals[pos], 0.0)
+
+
+class SourcesView(MutableMapping):
+    """
+    Dict-like view of one user's rows in a SourceLedger, usable in place of
+    IncomeTracker.income_sources / expenses_sources. Values are
+    SourceEntry records, as in the tracker.
+    """
+
+    def __init__(self, ledger, user_id):
+        self.ledger = ledger
+        self.user_id = int(user_id)
+
+    def _row(self, source):
+        category_id = self.ledger.categories.lookup(source)
+        if category_id < 0:
+            return -1
+        return int(self.ledger._lookup([(self.user_id << KEY_SHIFT) | category_id])[0])
+
+    def __getitem__(self, source):
+        row = self._row(source)
+        if row < 0:
+            raise KeyError(source)
+        ledger = self.ledger
+        frequency = ledger.frequencies.labels[ledger._frequency_id[row]]
+        return SourceEntry(float(ledger._amount[row]), frequency, float(ledger._daily_amount[row]))
+
+    def __setitem__(self, source, value):
+        amount, frequency, daily_amount = value
+        self.ledger.add([self.user_id], [source], [amount], [frequency], daily_amounts=[daily_amount])
+
+    def __delitem__(self, source):
+        self.ledger.delete([self.user_id], [source])
+
+    def __iter__(self):
+        labels = self.ledger.categories.labels
+        for category_id in self.ledger._category_id[self.ledger._user_rows(self.user_id)]:
+            yield labels[category_id]
+
+    def __len__(self):
+        return len(self.ledger._user_rows(self.user_id))
+
+    def __repr__(self):
+        return f"SourcesView(user_id={self.user_id}, {dict(self.items())})"
+
+
+class PopulationLedger:
+    """
+    NumPy-backed income and expense ledgers for a whole population of users,
+    replacing one IncomeTracker dictionary pair per user.
+    """
+
+    def __init__(self, capacity=1024):
+        self.categories = Interner()
+        self.frequencies = Interner()
+        self.income = SourceLedger(self.categories, self.frequencies, capacity)
+        self.expenses = SourceLedger(self.categories, self.frequencies, capacity)
+
+    def get_total_income(self, user_ids):
+        """Returns the total daily equivalent income of each user."""
+        return self.income.totals(user_ids)
+
+    def get_total_expenses(self, user_ids):
+        """Returns the total daily equivalent expenses of each user."""
+        return self.expenses.totals(user_ids)
+
+    def get_monthly_income(self, user_ids, year=None, month=None):
+        """Returns each user's income over a calendar month (default: an average month)."""
+        return self.income.monthly_totals(user_ids, year, month)
+
+    def get_monthly_expenses(self, user_ids, year=None, month=None):
+        """Returns each user's expenses over a calendar month (default: an average month)."""
+        return self.expenses.monthly_totals(user_ids, year, month)
+
+    def category_name(self, category_id):
+        """Returns the category label for a category id."""
+        return self.categories.labels[category_id]
+
+    def tracker(self, user_id):
+        """
+        Returns an IncomeTracker whose income and expense sources are views onto
+        this user's rows, so single-user calls read and write the ledger directly.
+        """
+        tracker = IncomeTracker()
+        tracker.income_sources = SourcesView(self.income, user_id)
+        tracker.expenses_sources = SourcesView(self.expenses, user_id)
+        tracker.recalculate_totals()
+        return tracker
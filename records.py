@@ -0,0 +1,118 @@
+# records.py
+# Compact __slots__ records for the per-entry data of IncomeTracker and DebtManagement.
+# Slotted objects have no per-instance __dict__, so they are smaller than the tuples and
+# dicts they replace; benchmarks/recordMemory.py measures the difference.
+
+
+class SourceEntry:
+    """
+    An income or expense source: (amount, frequency, daily_amount).
+    Behaves like the 3-tuple it replaces: index access, unpacking, len() and
+    comparison with tuples all work, and it hashes like the equivalent tuple.
+    """
+    __slots__ = ('amount', 'frequency', 'daily_amount')
+
+    def __init__(self, amount, frequency, daily_amount):
+        self.amount = amount
+        self.frequency = frequency
+        self.daily_amount = daily_amount
+
+    @classmethod
+    def coerce(cls, entry):
+        """Returns `entry` if it is a SourceEntry, else a SourceEntry built from its 3 items."""
+        return entry if entry.__class__ is cls else cls(*entry)
+
+    def __getitem__(self, index):
+        return (self.amount, self.frequency, self.daily_amount)[index]
+
+    def __iter__(self):
+        return iter((self.amount, self.frequency, self.daily_amount))
+
+    def __len__(self):
+        return 3
+
+    def __eq__(self, other):
+        if isinstance(other, (SourceEntry, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __reduce__(self):
+        return SourceEntry, tuple(self)
+
+    def __repr__(self):
+        return f"SourceEntry(amount={self.amount!r}, frequency={self.frequency!r}, daily_amount={self.daily_amount!r})"
+
+
+class DebtRecord:
+    """
+    A debt: balance, interest rate (annual %) and urgency.
+    Keeps the key access of the dict it replaces (record['balance'], record['balance'] = x,
+    keys()/items(), dict(record)); unknown keys raise KeyError. A record stored in a
+    DebtManagement is linked to its priority index, and key writes re-rank it there.
+    """
+    _FIELDS = ('balance', 'interest_rate', 'urgency')
+    __slots__ = _FIELDS + ('_name', '_index')  # _name and _index: the priority index link, if stored
+
+    def __init__(self, balance, interest_rate, urgency=1):
+        self.balance = balance
+        self.interest_rate = interest_rate
+        self.urgency = urgency
+        self._name = None
+        self._index = None
+
+    @classmethod
+    def coerce(cls, debt):
+        """Returns `debt` if it is a DebtRecord, else a DebtRecord built from its keys."""
+        if isinstance(debt, cls):
+            return debt
+        return cls(debt['balance'], debt['interest_rate'], debt.get('urgency', 1))
+
+    def __getitem__(self, key):
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+        if self._index is not None:
+            self._index.update(self._name, self.balance, self.interest_rate, self.urgency)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._FIELDS else default
+
+    def keys(self):
+        return self._FIELDS
+
+    def values(self):
+        return (self.balance, self.interest_rate, self.urgency)
+
+    def items(self):
+        return tuple(zip(self._FIELDS, self.values()))
+
+    def __iter__(self):
+        return iter(self._FIELDS)
+
+    def __len__(self):
+        return len(self._FIELDS)
+
+    def __contains__(self, key):
+        return key in self._FIELDS
+
+    def __eq__(self, other):
+        if isinstance(other, (DebtRecord, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None  # Mutable, like the dict it replaces
+
+    def __reduce__(self):
+        # Copies are unlinked; DebtBook re-links the records it restores
+        return DebtRecord, self.values()
+
+    def __repr__(self):
+        return f"DebtRecord(balance={self.balance!r}, interest_rate={self.interest_rate!r}, urgency={self.urgency!r})"
@@ -0,0 +1,354 @@
+# snapshot.py
+import json
+import os
+
+import numpy as np
+import forecastEngine
+from budgetManagement import IncomeTracker
+from debtManagement import DebtManagement, PaymentHistory
+from financialHealth import FinancialHealth
+from records import DebtRecord, SourceEntry
+from timeSeries import TimeSeries
+
+FORMAT_NAME = 'invexor-snapshot'
+FORMAT_VERSION = 1
+MANIFEST = 'manifest.json'
+NPZ_MANIFEST = '__manifest__'  # Member holding the manifest inside an .npz snapshot
+NO_CAPACITY = -1  # Stored history capacity of unbounded series
+
+# Ragged per-user data is stored CSR-style: `<group>_offsets` has one entry per owner plus one,
+# and owner i's rows are [offsets[i], offsets[i + 1]) of every other `<group>_*` column.
+# Names (sources, frequencies, budgets, accounts, debts) are ids into the shared `labels` column.
+_SERIES = ('historical_income', 'historical_expenses', 'historical_scores', 'historical_savings', 'historical_debts')
+_FORECASTERS = ('income', 'expenses')
+
+_SCHEMA = {
+    'user_ids': np.int64,
+    # IncomeTracker
+    'tracker_history_capacity': np.int64,
+    'savings_contributions': np.float64,
+    'income_offsets': np.int64, 'income_label': np.int32, 'income_amount': np.float64,
+    'income_frequency': np.int32, 'income_daily': np.float64,
+    'expense_offsets': np.int64, 'expense_label': np.int32, 'expense_amount': np.float64,
+    'expense_frequency': np.int32, 'expense_daily': np.float64,
+    'budget_offsets': np.int64, 'budget_label': np.int32, 'budget_amount': np.float64,
+    # FinancialHealth
+    'health_history_capacity': np.int64,
+    'savings': np.float64, 'liquid_assets': np.float64, 'total_debts': np.float64,
+    'bank_offsets': np.int64, 'bank_label': np.int32, 'bank_balance': np.float64,
+    # DebtManagement (payments are ragged per debt, not per user)
+    'debt_offsets': np.int64, 'debt_label': np.int32, 'debt_balance': np.float64,
+    'debt_interest_rate': np.float64, 'debt_urgency': np.int64,
+    'payment_offsets': np.int64, 'payment_balances': np.float64, 'payment_timestamps': np.int64,
+}
+for _name in _SERIES:
+    _SCHEMA.update({f'{_name}_offsets': np.int64, f'{_name}_values': np.float64, f'{_name}_timestamps': np.int64})
+for _name in _FORECASTERS:
+    _SCHEMA.update({f'{_name}_forecaster_state': np.float64, f'{_name}_season_offsets': np.int64,
+                    f'{_name}_season_values': np.float64})
+
+
+class _ColumnWriter:
+    """Accumulates snapshot columns as Python lists before they are converted to arrays."""
+
+    def __init__(self):
+        self.columns = {name: [0] if name.endswith('_offsets') else [] for name in _SCHEMA}
+        self._labels = {}
+
+    def label(self, text):
+        return self._labels.setdefault(text, len(self._labels))
+
+    def close(self, group):
+        """Ends the current owner of a ragged group."""
+        offsets = self.columns[f'{group}_offsets']
+        offsets.append(len(self.columns[self._first_column[group]]))
+
+    def series(self, name, series):
+        self.columns[f'{name}_values'].extend(series.values.tolist())
+        self.columns[f'{name}_timestamps'].extend(series.timestamps.view(np.int64).tolist())
+        self.close(name)
+
+    def forecaster(self, name, forecaster):
+        state, last_season = forecaster.get_state()
+        self.columns[f'{name}_forecaster_state'].append(state)
+        self.columns[f'{name}_season_values'].extend(last_season.tolist())
+        self.close(f'{name}_season')
+
+    def arrays(self):
+        arrays = {}
+        for name, dtype in _SCHEMA.items():
+            values = self.columns[name]
+            if name.endswith('_forecaster_state'):
+                arrays[name] = np.array(values, dtype=dtype).reshape(-1, len(forecastEngine.STATE_FIELDS))
+            else:
+                arrays[name] = np.array(values, dtype=dtype)
+        arrays['labels'] = np.array(list(self._labels), dtype=str)
+        return arrays
+
+    # Column whose length marks the end of each ragged group's owner
+    _first_column = {
+        'income': 'income_label', 'expense': 'expense_label', 'budget': 'budget_label',
+        'bank': 'bank_label', 'debt': 'debt_label', 'payment': 'payment_balances',
+        **{name: f'{name}_values' for name in _SERIES},
+        **{f'{name}_season': f'{name}_season_values' for name in _FORECASTERS},
+    }
+
+
+def _capacity(series):
+    return NO_CAPACITY if series.capacity is None else series.capacity
+
+
+def _write_user(writer, user_id, health):
+    columns = writer.columns
+    tracker = health.income_tracker
+    columns['user_ids'].append(user_id)
+
+    columns['tracker_history_capacity'].append(_capacity(tracker.historical_income))
+    columns['savings_contributions'].append(tracker.savings_contributions)
+    for group, sources in (('income', tracker.income_sources), ('expense', tracker.expenses_sources)):
+        for source, (amount, frequency, daily_amount) in sources.items():
+            columns[f'{group}_label'].append(writer.label(source))
+            columns[f'{group}_amount'].append(amount)
+            columns[f'{group}_frequency'].append(writer.label(frequency))
+            columns[f'{group}_daily'].append(daily_amount)
+        writer.close(group)
+    for category, amount in tracker.budgets.items():
+        columns['budget_label'].append(writer.label(category))
+        columns['budget_amount'].append(amount)
+    writer.close('budget')
+    writer.series('historical_income', tracker.historical_income)
+    writer.series('historical_expenses', tracker.historical_expenses)
+    writer.forecaster('income', tracker.income_forecaster)
+    writer.forecaster('expenses', tracker.expenses_forecaster)
+
+    columns['health_history_capacity'].append(_capacity(health.historical_scores))
+    columns['savings'].append(health.savings)
+    columns['liquid_assets'].append(health.liquid_assets)
+    columns['total_debts'].append(health.total_debts)
+    for account, balance in health.bank_accounts.items():
+        columns['bank_label'].append(writer.label(account))
+        columns['bank_balance'].append(balance)
+    writer.close('bank')
+    for name in ('historical_scores', 'historical_savings', 'historical_debts'):
+        writer.series(name, getattr(health, name))
+
+    debt_manager = health.debt_manager
+    for name, details in debt_manager.debts.items():
+        columns['debt_label'].append(writer.label(name))
+        columns['debt_balance'].append(details.balance)
+        columns['debt_interest_rate'].append(details.interest_rate)
+        columns['debt_urgency'].append(details.urgency)
+        history = debt_manager.debt_history[name]
+        columns['payment_balances'].extend(history.balances.tolist())
+        columns['payment_timestamps'].extend(history.timestamps.view(np.int64).tolist())
+        writer.close('payment')
+    writer.close('debt')
+
+
+def save_snapshot(path, users, compressed=False):
+    """
+    Writes a population to `path`. `users` maps user ids to FinancialHealth objects,
+    whose income_tracker and debt_manager are saved with them.
+
+    A path ending in .npz gives a single NumPy archive (`compressed` uses zip deflate);
+    any other path is a directory with one .npy file per column and a manifest.json,
+    which load_snapshot can memory-map. Users are stored sorted by id.
+    """
+    writer = _ColumnWriter()
+    for user_id in sorted(users):
+        _write_user(writer, user_id, users[user_id])
+    arrays = writer.arrays()
+    manifest = {
+        'format': FORMAT_NAME,
+        'version': FORMAT_VERSION,
+        'users': len(arrays['user_ids']),
+        'columns': {name: {'dtype': array.dtype.str, 'shape': list(array.shape)} for name, array in arrays.items()},
+    }
+
+    if path.endswith('.npz'):
+        save = np.savez_compressed if compressed else np.savez
+        save(path, **arrays, **{NPZ_MANIFEST: np.array(json.dumps(manifest))})
+        return path
+    os.makedirs(path, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(os.path.join(path, f'{name}.npy'), array)
+    # The manifest goes last, so an interrupted save is never mistaken for a complete snapshot
+    with open(os.path.join(path, MANIFEST), 'w') as file:
+        json.dump(manifest, file, indent=2)
+    return path
+
+
+def load_snapshot(path, mmap=True):
+    """
+    Opens a snapshot written by save_snapshot. Directory snapshots are memory-mapped
+    read-only by default, so processes opening the same snapshot share its pages;
+    .npz members are read into memory once, on first use.
+    """
+    if path.endswith('.npz'):
+        archive = np.load(path)
+        manifest = json.loads(archive[NPZ_MANIFEST].item())
+        columns = _NpzColumns(archive)
+    else:
+        with open(os.path.join(path, MANIFEST)) as file:
+            manifest = json.load(file)
+        mmap_mode = 'r' if mmap else None
+        columns = {name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode=mmap_mode)
+                   for name in manifest['columns']}
+    if manifest.get('format') != FORMAT_NAME:
+        raise ValueError(f"{path} is not a snapshot.")
+    if manifest['version'] > FORMAT_VERSION:
+        raise ValueError(f"Snapshot version {manifest['version']} is newer than supported ({FORMAT_VERSION}).")
+    return Snapshot(columns, manifest)
+
+
+class _NpzColumns:
+    """Caches .npz members, which NumPy would otherwise re-read on every access."""
+
+    def __init__(self, archive):
+        self._archive = archive
+        self._arrays = {}
+
+    def __getitem__(self, name):
+        array = self._arrays.get(name)
+        if array is None:
+            array = self._arrays[name] = self._archive[name]
+        return array
+
+
+class Snapshot:
+    """
+    Read-only view of a saved population. Whole columns are available for vectorized jobs
+    through column(); income_tracker, debt_manager and financial_health materialize the
+    objects of a single user, copying only that user's rows.
+    """
+
+    def __init__(self, columns, manifest):
+        self._columns = columns
+        self.manifest = manifest
+        self.user_ids = columns['user_ids']
+        self._labels = None
+
+    def column(self, name):
+        """Returns a stored column (memory-mapped for directory snapshots)."""
+        return self._columns[name]
+
+    @property
+    def labels(self):
+        """Source, frequency, budget, account and debt names, indexed by the *_label and *_frequency columns."""
+        if self._labels is None:
+            self._labels = self._columns['labels'].tolist()
+        return self._labels
+
+    def __len__(self):
+        return len(self.user_ids)
+
+    def __iter__(self):
+        return iter(self.user_ids.tolist())
+
+    def __contains__(self, user_id):
+        index = np.searchsorted(self.user_ids, user_id)
+        return index < len(self.user_ids) and self.user_ids[index] == user_id
+
+    def _row(self, user_id):
+        index = int(np.searchsorted(self.user_ids, user_id))
+        if index == len(self.user_ids) or self.user_ids[index] != user_id:
+            raise KeyError(user_id)
+        return index
+
+    def _span(self, group, row):
+        offsets = self._columns[f'{group}_offsets']
+        return slice(int(offsets[row]), int(offsets[row + 1]))
+
+    def _series(self, name, row, capacity):
+        span = self._span(name, row)
+        return TimeSeries.from_arrays(self._columns[f'{name}_values'][span],
+                                      self._columns[f'{name}_timestamps'][span],
+                                      capacity=None if capacity == NO_CAPACITY else int(capacity))
+
+    def _sources(self, group, row):
+        span = self._span(group, row)
+        labels = self.labels
+        return {
+            labels[label]: SourceEntry(amount, labels[frequency], daily_amount)
+            for label, amount, frequency, daily_amount in zip(
+                self._columns[f'{group}_label'][span].tolist(),
+                self._columns[f'{group}_amount'][span].tolist(),
+                self._columns[f'{group}_frequency'][span].tolist(),
+                self._columns[f'{group}_daily'][span].tolist(),
+            )
+        }
+
+    def _income_tracker(self, row):
+        columns = self._columns
+        capacity = int(columns['tracker_history_capacity'][row])
+        tracker = IncomeTracker(None if capacity == NO_CAPACITY else capacity)
+        tracker.income_sources = self._sources('income', row)
+        tracker.expenses_sources = self._sources('expense', row)
+        tracker.recalculate_totals()
+        span = self._span('budget', row)
+        tracker.budgets = dict(zip([self.labels[label] for label in columns['budget_label'][span].tolist()],
+                                   columns['budget_amount'][span].tolist()))
+        tracker.savings_contributions = float(columns['savings_contributions'][row])
+        tracker.historical_income = self._series('historical_income', row, capacity)
+        tracker.historical_expenses = self._series('historical_expenses', row, capacity)
+        for name in _FORECASTERS:
+            span = self._span(f'{name}_season', row)
+            forecaster = forecastEngine.StreamingForecaster.from_state(
+                columns[f'{name}_forecaster_state'][row], columns[f'{name}_season_values'][span])
+            setattr(tracker, f'{name}_forecaster', forecaster)
+        return tracker
+
+    def _debt_manager(self, row):
+        columns = self._columns
+        debt_manager = DebtManagement()
+        span = self._span('debt', row)
+        payment_offsets = columns['payment_offsets']
+        for debt, name_id, balance, interest_rate, urgency in zip(
+            range(span.start, span.stop),
+            columns['debt_label'][span].tolist(),
+            columns['debt_balance'][span].tolist(),
+            columns['debt_interest_rate'][span].tolist(),
+            columns['debt_urgency'][span].astype(np.int64).tolist(),  # Stored as float64 by earlier writers
+        ):
+            name = self.labels[name_id]
+            debt_manager.debts[name] = DebtRecord(balance, interest_rate, urgency)
+            payments = slice(int(payment_offsets[debt]), int(payment_offsets[debt + 1]))
+            debt_manager.debt_history[name] = PaymentHistory.from_arrays(
+                columns['payment_balances'][payments], columns['payment_timestamps'][payments])
+        return debt_manager
+
+    def income_tracker(self, user_id):
+        """Materializes a user's IncomeTracker."""
+        return self._income_tracker(self._row(user_id))
+
+    def debt_manager(self, user_id):
+        """Materializes a user's DebtManagement."""
+        return self._debt_manager(self._row(user_id))
+
+    def financial_health(self, user_id):
+        """Materializes a user's FinancialHealth, together with its IncomeTracker and DebtManagement."""
+        row = self._row(user_id)
+        columns = self._columns
+        capacity = int(columns['health_history_capacity'][row])
+        health = FinancialHealth(self._income_tracker(row), None if capacity == NO_CAPACITY else capacity)
+        health.debt_manager = self._debt_manager(row)
+        health.savings = float(columns['savings'][row])
+        health.liquid_assets = float(columns['liquid_assets'][row])
+        health.total_debts = float(columns['total_debts'][row])
+        span = self._span('bank', row)
+        health.bank_accounts = dict(zip([self.labels[label] for label in columns['bank_label'][span].tolist()],
+                                        columns['bank_balance'][span].tolist()))
+        for name in ('historical_scores', 'historical_savings', 'historical_debts'):
+            setattr(health, name, self._series(name, row, capacity))
+        return health
+
+#---------------------------------------------------Example Usage---------------------------------------------------------------------------------------------------
+
+# users = {user_id: FinancialHealth(IncomeTracker()) for user_id in range(3)}
+# users[0].income_tracker.add_income_source("Salary", 3000, 'M')
+# users[0].debt_manager.add_debt("Credit Card", 5000, 18.9)
+# save_snapshot("population_snapshot", users)
+#
+# snapshot = load_snapshot("population_snapshot")  # Memory-mapped, shared between workers
+# health = snapshot.financial_health(0)
+# total_savings = snapshot.column('savings').sum()  # Population-wide, straight from the mapped column
@@ -0,0 +1,56 @@
+# test_budget_alerts.py
+import random
+
+import numpy as np
+import pytest
+
+from budgetAlerts import LEVEL_APPROACHING, LEVEL_EXCEEDED, LEVEL_OK, BudgetAlertEngine
+from budgetManagement import IncomeTracker
+from populationLedger import PopulationLedger
+
+
+def test_levels_follow_the_thresholds():
+    engine = BudgetAlertEngine()
+    results = engine.evaluate([1, 1, 1, 1, 2], [0, 1, 2, 3, 0], [79, 80, 100, 101, 50], [100, 100, 100, 100, 0])
+    np.testing.assert_array_equal(results['level'],
+                                  [LEVEL_OK, LEVEL_APPROACHING, LEVEL_APPROACHING, LEVEL_EXCEEDED, LEVEL_EXCEEDED])
+    np.testing.assert_allclose(results['utilization'][:4], [79, 80, 100, 101])
+    assert engine.count_by_level(results) == {'OK': 1, 'Approaching': 2, 'Exceeded': 2}
+
+    alerts = engine.evaluate([1, 1, 1, 1], [0, 1, 2, 3], [79, 80, 100, 101], [100] * 4, alerts_only=True)
+    np.testing.assert_array_equal(alerts['category_id'], [1, 2, 3])
+
+
+def test_custom_thresholds():
+    results = BudgetAlertEngine(50, 90).evaluate([1, 1, 1], [0, 1, 2], [40, 60, 95], [100, 100, 100])
+    np.testing.assert_array_equal(results['level'], [LEVEL_OK, LEVEL_APPROACHING, LEVEL_EXCEEDED])
+    with pytest.raises(ValueError):
+        BudgetAlertEngine(120, 100)
+
+
+def test_ledger_alerts_match_check_budget_alerts():
+    rng = random.Random(0)
+    ledger = PopulationLedger()
+    trackers = {user: IncomeTracker() for user in range(50)}
+    budget_users, budget_categories, budget_amounts = [], [], []
+    for user, tracker in trackers.items():
+        for category in ("Rent", "Food", "Fun"):
+            if rng.random() < 0.7:
+                amount = rng.choice([100, 300, 450, 500, 900])
+                tracker.add_expense_source(category, amount, "M")
+                ledger.expenses.add([user], [category], [amount], ["M"])
+            if rng.random() < 0.7:  # Budgets without a matching expense are skipped
+                budget = rng.choice([400, 500, 1000])
+                tracker.set_budget(category, budget)
+                budget_users.append(user)
+                budget_categories.append(category)
+                budget_amounts.append(budget)
+
+    engine = BudgetAlertEngine()
+    alerts = engine.evaluate_ledger(ledger, budget_users, budget_categories, budget_amounts, alerts_only=True)
+    found = sorted((int(alert['user_id']), ledger.category_name(alert['category_id']),
+                    bool(alert['level'] == LEVEL_EXCEEDED), float(alert['utilization'])) for alert in alerts)
+    expected = sorted((user, alert.category, alert.exceeded, alert.utilization)
+                      for user, tracker in trackers.items() for alert in tracker.check_budget_alerts(quiet=True))
+    assert expected and [row[:3] for row in found] == [row[:3] for row in expected]
+    np.testing.assert_allclose([row[3] for row in found], [row[3] for row in expected])
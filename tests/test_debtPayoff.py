@@ -0,0 +1,68 @@
+# test_debt_payoff.py
+import numpy as np
+import pytest
+
+from debtManagement import (AVALANCHE, PAYOFF_NEVER, SNOWBALL, DebtManagement, payoff_months,
+                            repayment_order, simulate_debt_payoff)
+
+
+@pytest.mark.parametrize("balance, rate, payment", [
+    (5000, 18.9, 250), (12000, 6.5, 400), (1000, 0, 75), (300, 24, 301), (20000, 3.2, 180),
+])
+def test_single_debt_simulation_matches_payoff_months(balance, rate, payment):
+    simulation = simulate_debt_payoff([balance], [rate], payment)
+    assert simulation.payoff_month[0] == payoff_months(balance, rate, payment)
+    assert simulation.months == simulation.payoff_month[0]
+    assert simulation.debt_free
+
+
+def test_payments_too_small_for_the_interest_never_pay_off():
+    assert payoff_months(10000, 24, 200) == PAYOFF_NEVER
+    simulation = simulate_debt_payoff([10000], [24], 200, max_months=120)
+    assert simulation.payoff_month[0] == -1
+    assert simulation.months == 120
+    assert not simulation.debt_free
+
+
+def test_payoff_months_broadcasts():
+    months = payoff_months(np.array([1000, 5000])[:, None], np.array([12, 20])[:, None], np.array([50, 100, 500]))
+    expected = [[payoff_months(balance, rate, payment) for payment in (50, 100, 500)]
+                for balance, rate in ((1000, 12), (5000, 20))]
+    np.testing.assert_array_equal(months, expected)
+
+
+def test_simulation_keeps_the_books_balanced():
+    balances, rates, minimums = [5000, 800, 12000], [18.9, 24, 6.5], [50, 25, 150]
+    simulation = simulate_debt_payoff(balances, rates, 900, minimum_payments=minimums)
+    assert simulation.debt_free
+    assert (simulation.balances >= 0).all()
+    assert (simulation.payments.sum(axis=1) <= 900 + 1e-9).all()
+    np.testing.assert_allclose(simulation.payments.sum(axis=0), np.array(balances) + simulation.total_interest)
+    np.testing.assert_array_equal(simulation.balances[0], balances)
+
+
+def test_extra_money_follows_the_repayment_order():
+    balances, rates = [5000, 800, 12000], [18.9, 24, 6.5]
+    avalanche = simulate_debt_payoff(balances, rates, 700, order=AVALANCHE)
+    snowball = simulate_debt_payoff(balances, rates, 700, order=SNOWBALL)
+    custom = simulate_debt_payoff(balances, rates, 700, order=[2, 0, 1])
+    assert list(repayment_order(balances, rates, strategy=AVALANCHE)) == [1, 0, 2]
+    assert list(np.argsort(avalanche.payoff_month)) == [1, 0, 2]
+    assert list(np.argsort(custom.payoff_month)) == [2, 0, 1]
+    # Paying the highest rate first never costs more interest
+    assert avalanche.total_interest.sum() <= snowball.total_interest.sum()
+    assert avalanche.total_interest.sum() <= custom.total_interest.sum()
+
+
+def test_invalid_budgets_and_orders_are_rejected():
+    with pytest.raises(ValueError):
+        simulate_debt_payoff([1000, 2000], [5, 5], 100, minimum_payments=[60, 60])
+    with pytest.raises(ValueError):
+        simulate_debt_payoff([1000, 2000], [5, 5], 100, order=[0, 0])
+
+
+def test_calculate_payoff_time_uses_payoff_months():
+    manager = DebtManagement()
+    manager.add_debt("Credit Card", 5000, 18.9)
+    assert manager.calculate_payoff_time("Credit Card", 250, quiet=True).months == payoff_months(5000, 18.9, 250)
+    assert manager.calculate_payoff_time("Missing", 250, quiet=True) is None
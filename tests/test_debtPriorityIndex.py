@@ -0,0 +1,99 @@
+# test_debt_priority_index.py
+import copy
+import pickle
+import random
+
+from debtManagement import DebtManagement, DebtPriorityIndex
+from records import DebtRecord
+
+
+def ranked(manager):
+    """Names in prioritize_debts order, computed by a full sort of the current records."""
+    order = sorted(enumerate(manager.debts.items()),
+                   key=lambda item: (-item[1][1]['interest_rate'], item[1][1]['balance'], -item[1][1]['urgency'], item[0]))
+    return [name for _, (name, _) in order]
+
+
+def test_key_returning_to_an_earlier_value_is_listed_once():
+    manager = DebtManagement()
+    manager.add_debt("A", 100, 5)
+    manager.make_payment("A", 50)
+    manager.add_debt("A", 100, 5)
+    assert [name for name, _ in manager.top_priority_debts(2)] == ["A"]
+    assert manager.priority_index.top_k(2) == ["A"]
+    assert list(manager.priority_index) == ["A"]
+
+
+def test_removed_sequence_numbers_are_not_reused():
+    index = DebtPriorityIndex()
+    index.update("x", 100, 5, 1)
+    index.update("y", 100, 5, 1)
+    index.remove("x")
+    index.update("z", 100, 5, 1)
+    assert index.top_k(2) == ["y", "z"]
+    assert list(index) == ["y", "z"]
+
+
+def test_iteration_follows_updates_and_removals():
+    index = DebtPriorityIndex()
+    for name, rate in (("a", 5), ("b", 10), ("c", 1)):
+        index.update(name, 100, rate, 1)
+    assert list(index) == ["b", "a", "c"]
+    index.update("c", 100, 20, 1)
+    index.remove("b")
+    index.update("b", 50, 5, 1)
+    assert list(index) == ["c", "b", "a"]
+    assert index.top_k(3) == ["c", "b", "a"]
+
+
+def test_direct_record_edits_rerank():
+    manager = DebtManagement()
+    manager.add_debt("A", 1000, 5)
+    manager.add_debt("B", 1000, 9)
+    manager.debts["A"]["interest_rate"] = 20
+    assert [name for name, _ in manager.prioritize_debts(quiet=True)] == ["A", "B"]
+    assert manager.priority_index.top_k(1) == ["A"]
+
+
+def test_direct_dict_writes_and_deletes_update_the_index():
+    manager = DebtManagement()
+    manager.add_debt("A", 1000, 5)
+    manager.debts["B"] = {'balance': 500, 'interest_rate': 12}
+    assert isinstance(manager.debts["B"], DebtRecord)
+    assert manager.priority_index.top_k(1) == ["B"]
+    replaced = manager.debts["B"]
+    manager.debts["B"] = DebtRecord(500, 1)
+    replaced["interest_rate"] = 30  # No longer stored, so it must not move "B"
+    assert list(manager.priority_index) == ["A", "B"]
+    del manager.debts["A"]
+    assert list(manager.priority_index) == ["B"]
+
+
+def test_random_operations_match_a_full_sort():
+    rng = random.Random(0)
+    manager = DebtManagement()
+    for step in range(2000):
+        name = f"Debt {rng.randrange(40)}"
+        action = rng.random()
+        if action < 0.4 or name not in manager.debts:
+            manager.add_debt(name, rng.choice([100, 200, 300]), rng.choice([5, 10]), rng.choice([1, 2]))
+        elif action < 0.6:
+            manager.make_payment(name, rng.choice([0, 50, 100]))
+        elif action < 0.8:
+            manager.debts[name]["interest_rate"] = rng.choice([5, 10])
+        else:
+            del manager.debts[name]
+        if step % 50 == 0:
+            expected = ranked(manager)
+            assert list(manager.priority_index) == expected
+            assert manager.priority_index.top_k(len(expected)) == expected
+
+
+def test_copies_keep_the_index_linked():
+    manager = DebtManagement()
+    manager.add_debt("A", 1000, 5)
+    manager.add_debt("B", 1000, 9)
+    for restored in (pickle.loads(pickle.dumps(manager)), copy.deepcopy(manager)):
+        restored.debts["A"]["interest_rate"] = 20
+        assert restored.priority_index.top_k(2) == ["A", "B"]
+    assert manager.priority_index.top_k(2) == ["B", "A"]
@@ -0,0 +1,66 @@
+# test_frequency_engine.py
+import calendar
+
+import numpy as np
+import pytest
+
+import frequencyEngine
+from frequencyEngine import FREQUENCIES, monthly_total, to_annual, to_daily, to_monthly
+
+
+@pytest.mark.parametrize("year", [2023, 2024, 1900, 2000])
+def test_calendar_months_add_up_to_the_year(year):
+    for code in FREQUENCIES:
+        months = to_monthly(np.ones(12), code, year, np.arange(1, 13))
+        assert months.sum() == pytest.approx(to_annual(1, code, year))
+    assert to_annual(1000, 'M', year) == pytest.approx(12_000)
+    assert to_annual(500, 'Q', year) == pytest.approx(2000)
+    assert to_annual(1200, 'Y', year) == pytest.approx(1200)
+    assert to_annual(7, 'D', year) == pytest.approx(7 * (366 if calendar.isleap(year) else 365))
+
+
+def test_amounts_are_spread_over_the_days_of_their_period():
+    assert to_monthly(1000, 'M', 2024, 2) == pytest.approx(1000)
+    assert to_monthly(70, 'W', 2024, 2) == pytest.approx(290)  # 29 days of 10 a day
+    assert to_monthly(140, 'B', 2023, 2) == pytest.approx(280)
+    assert to_monthly(900, 'Q', 2023, 1) == pytest.approx(900 * 31 / 90)
+    assert to_monthly(3660, 'Y', 2024, 2) == pytest.approx(290)
+    assert to_daily(1500, 'M', 2023, 4) == pytest.approx(50)
+    np.testing.assert_allclose(to_daily(1500, 'M', 2023, [1, 2]), [1500 / 31, 1500 / 28])
+
+
+def test_average_month_does_not_depend_on_the_date():
+    assert to_monthly(1000, 'M') == pytest.approx(1000)
+    assert to_monthly(100, 'W') == pytest.approx(100 * 365.2425 / 12 / 7)
+    assert 12 * to_monthly(1200, 'Y') == pytest.approx(1200)
+    assert to_annual(1000, 'M') == pytest.approx(12_000)
+    np.testing.assert_allclose(
+        np.mean([to_monthly(100, 'W', year, month) for year in range(2000, 2400) for month in range(1, 13)]),
+        to_monthly(100, 'W'))
+
+
+def test_one_time_and_unknown_codes_convert_to_zero():
+    np.testing.assert_array_equal(to_monthly([500, 500], ['O', '?'], 2024, 1), [0, 0])
+    assert to_annual(500, 'O') == 0
+    assert frequencyEngine.frequency_id('?') == frequencyEngine.ONE_TIME
+
+
+def test_monthly_total_matches_per_amount_conversion():
+    amounts = np.array([1000, 50, 1200, 300, 7, 140, 99])
+    codes = ['M', 'W', 'Y', 'Q', 'D', 'B', 'O']
+    by_frequency = [0.0] * len(FREQUENCIES)
+    for amount, code in zip(amounts.tolist(), codes):
+        by_frequency[frequencyEngine.frequency_id(code)] += amount
+    for year, month in ((2024, 2), (2023, 12), (None, None)):
+        assert monthly_total(by_frequency, year, month) == pytest.approx(to_monthly(amounts, codes, year, month).sum())
+
+
+def test_year_and_month_go_together():
+    with pytest.raises(ValueError):
+        to_monthly(100, 'M', 2024)
+    with pytest.raises(ValueError):
+        monthly_total([0.0] * len(FREQUENCIES), month=2)
+
+
+def test_leap_years():
+    np.testing.assert_array_equal(frequencyEngine.is_leap_year([1900, 2000, 2023, 2024]), [0, 1, 0, 1])
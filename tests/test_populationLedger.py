@@ -0,0 +1,108 @@
+# test_population_ledger.py
+import random
+
+import numpy as np
+import pytest
+
+from budgetManagement import IncomeTracker
+from populationLedger import PopulationLedger, SourcesView
+
+CATEGORIES = ["Salary", "Rent", "Food", "Bonus", "Rental Income"]
+FREQUENCIES = ["D", "W", "B", "M", "Q", "Y", "O"]
+
+
+def assert_matches(ledger, trackers):
+    """Per-user totals of the ledger equal those of the reference trackers."""
+    user_ids = sorted(trackers)
+    np.testing.assert_allclose(ledger.get_total_income(user_ids),
+                               [trackers[user].total_income for user in user_ids], atol=1e-9)
+    np.testing.assert_allclose(ledger.get_total_expenses(user_ids),
+                               [trackers[user].total_expenses for user in user_ids], atol=1e-9)
+    np.testing.assert_allclose(ledger.get_monthly_income(user_ids, 2024, 2),
+                               [trackers[user].get_monthly_income(2024, 2) for user in user_ids], atol=1e-9)
+    np.testing.assert_allclose(ledger.get_monthly_expenses(user_ids),
+                               [trackers[user].get_monthly_expenses() for user in user_ids], atol=1e-9)
+    for user in user_ids:
+        assert dict(SourcesView(ledger.income, user)) == trackers[user].income_sources
+        assert dict(SourcesView(ledger.expenses, user)) == trackers[user].expenses_sources
+
+
+@pytest.mark.parametrize("preload", [0, 6000])
+def test_random_operations_match_income_trackers(preload):
+    rng = random.Random(preload)
+    ledger = PopulationLedger()
+    trackers = {user: IncomeTracker() for user in range(30)}
+    if preload:
+        # Enough rows for a sorted index, so later operations hit both the index and the unindexed tail
+        extra_users = np.arange(100, 100 + preload)
+        ledger.income.add(extra_users, ["Salary"] * preload, np.full(preload, 1000.0), ["M"] * preload)
+
+    for step in range(1500):
+        user = rng.randrange(30)
+        category = rng.choice(CATEGORIES)
+        is_income = rng.random() < 0.5
+        tracker = trackers[user]
+        sources = tracker.income_sources if is_income else tracker.expenses_sources
+        table = ledger.income if is_income else ledger.expenses
+        action = rng.random()
+        if action < 0.5 or category not in sources:
+            amount, frequency = rng.choice([0, 100, 250.5, 3000]), rng.choice(FREQUENCIES)
+            table.add([user], [category], [amount], [frequency])
+            (tracker.add_income_source if is_income else tracker.add_expense_source)(category, amount, frequency)
+        elif action < 0.75:
+            amount = rng.choice([50, 1200])
+            table.update([user], [category], amounts=[amount])
+            (tracker.update_income_source if is_income else tracker.update_expense_source)(category, amount)
+        else:
+            table.delete([user], [category])
+            (tracker.remove_income_source if is_income else tracker.remove_expense_source)(category)
+        if step % 100 == 0:
+            assert_matches(ledger, trackers)
+    assert_matches(ledger, trackers)
+
+
+def test_bulk_add_keeps_the_last_value_of_repeated_pairs():
+    ledger = PopulationLedger()
+    ledger.income.add([1, 2, 1], ["Salary", "Salary", "Salary"], [100, 200, 300], ["M", "M", "W"])
+    assert len(ledger.income) == 2
+    assert SourcesView(ledger.income, 1)["Salary"][:2] == (300, "W")
+    assert list(SourcesView(ledger.income, 2)) == ["Salary"]
+
+
+def test_missing_pairs_raise_and_leave_the_ledger_unchanged():
+    ledger = PopulationLedger()
+    ledger.expenses.add([1], ["Rent"], [1500], ["M"])
+    with pytest.raises(KeyError):
+        ledger.expenses.update([1, 1], ["Rent", "Food"], amounts=[10, 20])
+    with pytest.raises(KeyError):
+        ledger.expenses.delete([1, 2], ["Rent", "Rent"])
+    assert SourcesView(ledger.expenses, 1)["Rent"][0] == 1500
+    ledger.expenses.delete([2], ["Rent"], missing_ok=True)
+    assert len(ledger.expenses) == 1
+
+
+def test_out_of_range_user_ids_are_rejected():
+    ledger = PopulationLedger()
+    with pytest.raises(ValueError):
+        ledger.income.add([-1], ["Salary"], [100], ["M"])
+    with pytest.raises(ValueError):
+        ledger.income.add([2**31], ["Salary"], [100], ["M"])
+
+
+def test_tracker_writes_through_to_the_ledger():
+    ledger = PopulationLedger()
+    ledger.income.add([7], ["Salary"], [3000], ["M"])
+    tracker = ledger.tracker(7)
+    assert tracker.total_income == pytest.approx(ledger.get_total_income([7])[0])
+
+    tracker.add_income_source("Bonus", 1200, "Y")
+    tracker.add_expense_source("Rent", 1500, "M")
+    tracker.update_income_source("Salary", 3500)
+    assert SourcesView(ledger.income, 7)["Salary"][0] == 3500
+    assert ledger.get_total_expenses([7])[0] == pytest.approx(tracker.total_expenses)
+    assert ledger.get_total_income([7])[0] == pytest.approx(tracker.total_income)
+
+    tracker.remove_income_source("Bonus")
+    assert list(SourcesView(ledger.income, 7)) == ["Salary"]
+    assert ledger.tracker(7).total_income == pytest.approx(tracker.total_income)
+    assert ledger.get_total_income([8])[0] == 0
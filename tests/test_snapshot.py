@@ -0,0 +1,104 @@
+# test_snapshot.py
+import numpy as np
+import pytest
+
+from budgetManagement import IncomeTracker
+from financialHealth import FinancialHealth
+from forecastEngine import MODELS
+from snapshot import load_snapshot, save_snapshot
+
+
+def make_users():
+    """A small population covering every saved field, including bounded and empty histories."""
+    users = {}
+    for user_id in (42, 3, 17):
+        capacity = 4 if user_id == 17 else None
+        health = FinancialHealth(IncomeTracker(history_capacity=capacity), history_capacity=capacity)
+        users[user_id] = health
+        if user_id == 3:
+            continue  # A user with nothing recorded
+        tracker = health.income_tracker
+        tracker.add_income_source("Salary", 3000 + user_id, "M")
+        tracker.add_income_source("Dividends", 400, "Q")
+        tracker.add_expense_source("Rent", 1500, "M")
+        tracker.add_expense_source("Food", 90, "W")
+        tracker.set_budget("Food", 350)
+        tracker.add_savings_contributions(250)
+        for month in range(14):
+            tracker.add_historical_data(3000 + 10 * month, 2000 + 5 * month, timestamp=1_700_000_000 + month)
+        health.update_savings(5000 + user_id, timestamp=1_700_000_000)
+        health.update_total_debts(8000, timestamp=1_700_000_001)
+        health.update_liquid_assets(1200)
+        health.add_bank_account("Checking", 1200, quiet=True)
+        for _ in range(5):
+            health.record_financial_health_score(timestamp=1_700_000_002, year=2024, month=2)
+        debts = health.debt_manager
+        debts.add_debt("Credit Card", 5000, 18.9, 3, timestamp=1_700_000_000)
+        debts.add_debt("Car Loan", 12000, 6.5, timestamp=1_700_000_000)
+        debts.make_payment("Credit Card", 400, timestamp=1_700_000_100)
+    return users
+
+
+def assert_series_equal(restored, original):
+    assert restored.capacity == original.capacity
+    np.testing.assert_array_equal(restored.values, original.values)
+    np.testing.assert_array_equal(restored.timestamps, original.timestamps)
+
+
+def assert_same_user(restored, original):
+    tracker, expected = restored.income_tracker, original.income_tracker
+    assert tracker.income_sources == expected.income_sources
+    assert tracker.expenses_sources == expected.expenses_sources
+    assert tracker.budgets == expected.budgets
+    assert tracker.savings_contributions == expected.savings_contributions
+    assert tracker.total_income == pytest.approx(expected.total_income)
+    assert tracker.total_expenses == pytest.approx(expected.total_expenses)
+    assert_series_equal(tracker.historical_income, expected.historical_income)
+    assert_series_equal(tracker.historical_expenses, expected.historical_expenses)
+    models = MODELS if len(expected.historical_income) >= 12 else MODELS[:-1]
+    for model in models:
+        np.testing.assert_array_equal(tracker.forecast_income_expenses(3, model),
+                                      expected.forecast_income_expenses(3, model))
+
+    for name in ('savings', 'liquid_assets', 'total_debts', 'bank_accounts'):
+        assert getattr(restored, name) == getattr(original, name)
+    for name in ('historical_scores', 'historical_savings', 'historical_debts'):
+        assert_series_equal(getattr(restored, name), getattr(original, name))
+
+    debts, expected_debts = restored.debt_manager, original.debt_manager
+    assert dict(debts.debts) == dict(expected_debts.debts)
+    assert debts.priority_index.top_k(5) == expected_debts.priority_index.top_k(5)
+    for name, history in expected_debts.debt_history.items():
+        np.testing.assert_array_equal(debts.debt_history[name].balances, history.balances)
+        np.testing.assert_array_equal(debts.debt_history[name].timestamps, history.timestamps)
+
+
+@pytest.mark.parametrize("name, mmap", [("snapshot", True), ("snapshot", False), ("snapshot.npz", False)])
+def test_round_trip_restores_every_user(tmp_path, name, mmap):
+    users = make_users()
+    path = save_snapshot(str(tmp_path / name), users)
+    snapshot = load_snapshot(path, mmap=mmap)
+    np.testing.assert_array_equal(snapshot.column('user_ids'), [3, 17, 42])
+    for user_id, health in users.items():
+        assert_same_user(snapshot.financial_health(user_id), health)
+
+
+def test_restored_users_keep_working(tmp_path):
+    users = make_users()
+    snapshot = load_snapshot(save_snapshot(str(tmp_path / "snapshot"), users))
+    restored = snapshot.financial_health(17)
+    original = users[17]
+    for health in (restored, original):
+        health.income_tracker.add_historical_data(9000, 1000, timestamp=1_800_000_000)
+        health.debt_manager.debts["Car Loan"]["interest_rate"] = 30
+    assert_same_user(restored, original)
+    assert restored.debt_manager.priority_index.top_k(1) == ["Car Loan"]
+
+
+def test_unknown_user_and_foreign_files_are_rejected(tmp_path):
+    snapshot = load_snapshot(save_snapshot(str(tmp_path / "snapshot.npz"), make_users()))
+    with pytest.raises(KeyError):
+        snapshot.financial_health(99)
+    np.savez(tmp_path / "other.npz", __manifest__=np.array('{"format": "other"}'))
+    with pytest.raises(ValueError):
+        load_snapshot(str(tmp_path / "other.npz"))
@@ -0,0 +1,85 @@
+# test_transaction_ingest.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from budgetManagement import IncomeTracker
+from populationLedger import PopulationLedger, SourcesView
+from transactionIngest import CategoryAggregates, TransactionIngester
+
+
+def reference_totals(user_ids, category_ids, amounts):
+    """{(user, category): (sum, count)} computed with a plain dictionary."""
+    totals = {}
+    for key in zip(user_ids.tolist(), category_ids.tolist()):
+        totals.setdefault(key, [0.0, 0])
+    for user, category, amount in zip(user_ids.tolist(), category_ids.tolist(), amounts.tolist()):
+        totals[user, category][0] += amount
+        totals[user, category][1] += 1
+    return {key: tuple(value) for key, value in totals.items()}
+
+
+def test_folding_chunks_matches_one_pass_over_all_rows():
+    rng = np.random.default_rng(0)
+    user_ids = rng.integers(0, 300, 20_000)
+    category_ids = rng.integers(0, 12, 20_000)
+    amounts = rng.uniform(1, 100, 20_000).round(2)
+    aggregates = CategoryAggregates()
+    for start in range(0, 20_000, 1_500):  # Later chunks both update existing pairs and add new ones
+        stop = start + 1_500
+        aggregates.fold(user_ids[start:stop], category_ids[start:stop], amounts[start:stop])
+
+    keys = (aggregates.user_ids << 32) | aggregates.category_ids
+    assert (np.diff(keys) > 0).all()
+    expected = reference_totals(user_ids, category_ids, amounts)
+    assert list(zip(aggregates.user_ids.tolist(), aggregates.category_ids.tolist())) == sorted(expected)
+    np.testing.assert_allclose(aggregates.amounts, [expected[key][0] for key in sorted(expected)])
+    np.testing.assert_array_equal(aggregates.counts, [expected[key][1] for key in sorted(expected)])
+
+
+def test_empty_chunks_fold_to_nothing():
+    aggregates = CategoryAggregates()
+    empty = np.empty(0, dtype=np.int64)
+    aggregates.fold(empty, empty, np.empty(0))
+    assert len(aggregates) == 0
+
+
+def write_transactions(path):
+    frame = pd.DataFrame({
+        'user_id': ['1', '1', '2', '2', '1', '3.5', '-4', '99999999999', 'x', '2', '3'],
+        'category': ['Salary', 'Food', 'Food', 'Food', 'Salary', 'Food', 'Food', 'Food', 'Food', None, 'Rent'],
+        'amount': [3000, -40.5, -10, -15, 200, -1, -1, -1, -1, -1, 0],
+    })
+    frame.to_csv(path, index=False)
+
+
+@pytest.mark.parametrize("chunk_size", [2, 100])
+def test_ingest_rejects_bad_rows_and_loads_totals(tmp_path, chunk_size):
+    path = str(tmp_path / "transactions.csv")
+    write_transactions(path)
+    ingester = TransactionIngester(chunk_size=chunk_size)
+    stats = ingester.ingest(path)
+    # Fractional, negative, out-of-range and unparsable ids, a missing category and a zero amount
+    assert (stats.rows, stats.income_rows, stats.expense_rows, stats.skipped_rows) == (11, 2, 3, 6)
+
+    ledger = PopulationLedger()
+    ingester.to_ledger(ledger)
+    assert dict(SourcesView(ledger.income, 1))['Salary'][:2] == (3200, 'M')
+    assert dict(SourcesView(ledger.expenses, 1))['Food'][:2] == (40.5, 'M')
+    assert dict(SourcesView(ledger.expenses, 2))['Food'][:2] == (25, 'M')
+    assert len(ledger.income) + len(ledger.expenses) == 3
+
+    tracker = IncomeTracker()
+    ingester.to_tracker(tracker, 2)
+    assert list(tracker.expenses_sources) == ['Food'] and not tracker.income_sources
+    assert tracker.total_expenses == pytest.approx(ledger.get_total_expenses([2])[0])
+
+
+def test_type_column_decides_income_or_expense(tmp_path):
+    path = tmp_path / "transactions.jsonl"
+    pd.DataFrame({'user_id': [1, 1, 1], 'category': ['Refund', 'Rent', 'Rent'], 'amount': [20, 1500, -10],
+                  'type': ['Credit', 'debit', 'debit']}).to_json(path, orient='records', lines=True)
+    ingester = TransactionIngester(type_column='type')
+    ingester.ingest(str(path))
+    assert ingester.income.amounts.tolist() == [20]
+    assert ingester.expenses.amounts.tolist() == [1510]
@@ -0,0 +1,126 @@
+# time_series.py
+import functools
+import time
+
+import numpy as np
+
+
+def to_ns(timestamp):
+    """Converts None (now), a datetime, a numpy datetime64 or an int of nanoseconds to int64 nanoseconds."""
+    if timestamp is None:
+        return time.time_ns()
+    if isinstance(timestamp, (int, np.integer)):
+        return int(timestamp)
+    return int(np.datetime64(timestamp, 'ns').astype(np.int64))
+
+
+@functools.lru_cache(maxsize=None)
+def _entry_dtype(dtype):
+    """Structured (value, timestamp) dtype, shared by every series of the same value dtype."""
+    return np.dtype([('value', dtype), ('timestamp', np.int64)])
+
+
+class TimeSeries:
+    """
+    Compact history of one quantity: a typed value with an int64 timestamp (nanoseconds
+    since the epoch) per entry, kept together in one structured buffer. Timestamps never
+    decrease.
+
+    Unbounded series start with room for INITIAL_LENGTH entries and grow by doubling, so a
+    short history (a debt with a payment or two) costs one small array. With a `capacity`,
+    only the latest `capacity` entries are kept: the buffer is twice that size and the live
+    window slides along it, moving back to the front once it reaches the end, so appends
+    stay amortized O(1) and the window is always contiguous. Accessors return views, valid
+    until the next append.
+    """
+    __slots__ = ('capacity', '_buffer', '_start', '_end')
+
+    INITIAL_LENGTH = 2
+
+    def __init__(self, dtype=np.float64, capacity=None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity = capacity
+        length = self.INITIAL_LENGTH if capacity is None else 2 * capacity
+        self._buffer = np.empty(length, dtype=_entry_dtype(np.dtype(dtype)))
+        self._start = 0
+        self._end = 0
+
+    @classmethod
+    def from_arrays(cls, values, timestamps, dtype=np.float64, capacity=None):
+        """Builds a series holding a copy of the given values and int64 nanosecond timestamps."""
+        values = np.asarray(values, dtype=dtype)
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        if len(values) != len(timestamps):
+            raise ValueError("values and timestamps must have the same length.")
+        if np.any(timestamps[1:] < timestamps[:-1]):
+            raise ValueError("Timestamps must not go back in time.")
+        if capacity is not None:
+            values, timestamps = values[-capacity:], timestamps[-capacity:]
+        series = cls(dtype, capacity)
+        size = len(values)
+        if size > len(series._buffer):
+            series._buffer = np.empty(size, dtype=series._buffer.dtype)
+        series._buffer['value'][:size] = values
+        series._buffer['timestamp'][:size] = timestamps
+        series._end = size
+        return series
+
+    def append(self, value, timestamp=None):
+        """Records a value at `timestamp` (defaults to now), dropping the oldest entry if full."""
+        timestamp = to_ns(timestamp)
+        buffer = self._buffer
+        if self._end > self._start and timestamp < buffer['timestamp'][self._end - 1]:
+            raise ValueError("Timestamps must not go back in time.")
+        if self._end == len(buffer):
+            if self.capacity is None:
+                buffer = self._buffer = np.resize(buffer, 2 * len(buffer))
+            else:
+                # Move the live window back to the front of the buffer
+                size = self._end - self._start
+                buffer[:size] = buffer[self._start:self._end]
+                self._start, self._end = 0, size
+        buffer[self._end] = (value, timestamp)
+        self._end += 1
+        if self.capacity is not None and self._end - self._start > self.capacity:
+            self._start += 1
+
+    @property
+    def values(self):
+        """Recorded values, oldest first (a view)."""
+        return self._buffer['value'][self._start:self._end]
+
+    @property
+    def timestamps(self):
+        """Recorded timestamps as datetime64[ns] (a view)."""
+        return self._buffer['timestamp'][self._start:self._end].view('datetime64[ns]')
+
+    @property
+    def last(self):
+        """The most recent value (None while empty)."""
+        return self._buffer['value'][self._end - 1].item() if self._end > self._start else None
+
+    def between(self, start=None, end=None):
+        """
+        Returns (timestamps, values) views of the entries with start <= timestamp <= end.
+        Either bound may be omitted.
+        """
+        timestamps = self._buffer['timestamp'][self._start:self._end]
+        lo = 0 if start is None else np.searchsorted(timestamps, to_ns(start), side='left')
+        hi = len(timestamps) if end is None else np.searchsorted(timestamps, to_ns(end), side='right')
+        return timestamps[lo:hi].view('datetime64[ns]'), self.values[lo:hi]
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __iter__(self):
+        return iter(self.values.tolist())
+
+    def __array__(self, dtype=None, copy=None):
+        return self.values if dtype is None else self.values.astype(dtype)
+
+    def __repr__(self):
+        return f"TimeSeries({self.values.tolist()})"
@@ -0,0 +1,194 @@
+# transaction_ingest.py
+import os
+import time
+
+import numpy as np
+
+import utilities
+from populationLedger import Interner, KEY_SHIFT, MAX_USER_ID
+
+# Pandas is imported on first use, like the plotting libraries
+pd = utilities.LazyModule("pandas")
+
+# Values of the type column (lower-cased) that mark a row as income; every other value is an expense
+INCOME_TYPES = frozenset({'income', 'credit', 'deposit'})
+
+# File formats understood by TransactionIngester.ingest, by extension
+FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+
+class IngestStats:
+    """Row counts and timing of everything an ingester has read so far."""
+
+    def __init__(self):
+        self.rows = 0
+        self.income_rows = 0
+        self.expense_rows = 0
+        self.skipped_rows = 0  # Missing or unparsable user, category or amount, a user id that is not an
+                               # integer in [0, MAX_USER_ID], or a zero amount without a type
+        self.chunks = 0
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __repr__(self):
+        return (f"IngestStats({self.rows:,} rows in {self.chunks} chunks, {self.seconds:.2f} s, "
+                f"{self.rows_per_second:,.0f} rows/s; {self.income_rows:,} income, "
+                f"{self.expense_rows:,} expense, {self.skipped_rows:,} skipped)")
+
+
+class CategoryAggregates:
+    """
+    Running totals per (user, category) pair, held as sorted packed keys with a sum and
+    a transaction count each. Memory grows with the number of distinct pairs, not rows.
+    """
+
+    def __init__(self):
+        self._keys = np.empty(0, dtype=np.int64)
+        self.amounts = np.empty(0, dtype=np.float64)
+        self.counts = np.empty(0, dtype=np.int64)
+
+    def fold(self, user_ids, category_ids, amounts):
+        """
+        Adds a batch of transactions to the totals. The batch is reduced to its own distinct
+        pairs first, then merged into the sorted totals, so a fold costs O(batch log batch)
+        plus a linear merge instead of re-sorting every pair seen so far.
+        """
+        keys, inverse = np.unique((user_ids << KEY_SHIFT) | category_ids, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        batch_amounts = np.bincount(inverse, weights=amounts, minlength=len(keys))
+        batch_counts = np.bincount(inverse, minlength=len(keys)).astype(np.int64)
+
+        positions = np.searchsorted(self._keys, keys)
+        found = positions < len(self._keys)
+        found[found] = self._keys[positions[found]] == keys[found]
+        # Keys are distinct, so every existing pair is updated at most once
+        self.amounts[positions[found]] += batch_amounts[found]
+        self.counts[positions[found]] += batch_counts[found]
+        new = ~found
+        if new.any():
+            self._keys = np.insert(self._keys, positions[new], keys[new])
+            self.amounts = np.insert(self.amounts, positions[new], batch_amounts[new])
+            self.counts = np.insert(self.counts, positions[new], batch_counts[new])
+
+    @property
+    def user_ids(self):
+        return self._keys >> KEY_SHIFT
+
+    @property
+    def category_ids(self):
+        return self._keys & ((1 << KEY_SHIFT) - 1)
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class TransactionIngester:
+    """
+    Streams a CSV or JSONL file of raw transactions in fixed-size chunks and folds them
+    into per-user, per-category income and expense totals.
+
+    A row is income if its `type_column` value is one of INCOME_TYPES, or, without a type
+    column, if its amount is positive (negative amounts are expenses). Totals are kept as
+    positive amounts and can then be loaded into a PopulationLedger or an IncomeTracker.
+    """
+
+    def __init__(self, user_column='user_id', category_column='category', amount_column='amount',
+                 type_column=None, chunk_size=100_000):
+        self.user_column = user_column
+        self.category_column = category_column
+        self.amount_column = amount_column
+        self.type_column = type_column
+        self.chunk_size = chunk_size
+        self.categories = Interner()
+        self.income = CategoryAggregates()
+        self.expenses = CategoryAggregates()
+        self.stats = IngestStats()
+
+    def _columns(self):
+        columns = [self.user_column, self.category_column, self.amount_column]
+        if self.type_column is not None:
+            columns.append(self.type_column)
+        return columns
+
+    def ingest(self, path, fmt=None):
+        """Reads a whole file ('csv' or 'jsonl', inferred from the extension by default) and returns the stats."""
+        if fmt is None:
+            fmt = FORMATS.get(os.path.splitext(path)[1].lower())
+        if fmt == 'csv':
+            reader = pd.read_csv(path, usecols=self._columns(), chunksize=self.chunk_size,
+                                 dtype={self.category_column: str})
+        elif fmt == 'jsonl':
+            reader = pd.read_json(path, lines=True, chunksize=self.chunk_size, dtype=False)
+        else:
+            raise ValueError(f"Unsupported transaction file format: {fmt}")
+
+        start = time.perf_counter()
+        with reader:
+            for chunk in reader:
+                self.ingest_chunk(chunk)
+        self.stats.seconds += time.perf_counter() - start
+        return self.stats
+
+    def ingest_chunk(self, chunk):
+        """Folds one DataFrame of transactions into the totals."""
+        stats = self.stats
+        stats.rows += len(chunk)
+        stats.chunks += 1
+
+        user_ids = pd.to_numeric(chunk[self.user_column], errors='coerce').to_numpy(dtype=np.float64)
+        amounts = pd.to_numeric(chunk[self.amount_column], errors='coerce').to_numpy(dtype=np.float64)
+        categories = chunk[self.category_column]
+        # User ids must be whole numbers in range: fractional ids are rejected, not truncated
+        valid = (~np.isnan(amounts) & (user_ids >= 0) & (user_ids <= MAX_USER_ID)
+                 & (np.floor(user_ids) == user_ids) & categories.notna().to_numpy())
+        if self.type_column is not None:
+            is_income = chunk[self.type_column].astype(str).str.lower().isin(INCOME_TYPES).to_numpy()
+        else:
+            is_income = amounts > 0
+            valid &= amounts != 0
+
+        stats.skipped_rows += int(len(chunk) - valid.sum())
+        user_ids = user_ids[valid].astype(np.int64)
+        amounts = np.abs(amounts[valid])
+        category_ids = self.categories.intern_many(categories.to_numpy()[valid].astype(str))
+        is_income = is_income[valid]
+
+        stats.income_rows += int(is_income.sum())
+        stats.expense_rows += int(len(is_income) - is_income.sum())
+        self.income.fold(user_ids[is_income], category_ids[is_income], amounts[is_income])
+        self.expenses.fold(user_ids[~is_income], category_ids[~is_income], amounts[~is_income])
+
+    def _labels(self, category_ids):
+        return np.array(self.categories.labels, dtype=object)[category_ids]
+
+    def to_ledger(self, ledger, frequency='M'):
+        """
+        Adds (or replaces) every aggregated pair as a source of a PopulationLedger, using one bulk
+        add per side. `frequency` is the period the ingested file covers (e.g. 'M' for one month).
+        """
+        for aggregates, sources in ((self.income, ledger.income), (self.expenses, ledger.expenses)):
+            if len(aggregates):
+                sources.add(aggregates.user_ids, self._labels(aggregates.category_ids).astype(str),
+                            aggregates.amounts, np.full(len(aggregates), frequency))
+
+    def to_tracker(self, tracker, user_id, frequency='M'):
+        """Adds (or replaces) one user's aggregated categories as sources of an IncomeTracker."""
+        for aggregates, add_sources in ((self.income, tracker.add_income_sources),
+                                        (self.expenses, tracker.add_expense_sources)):
+            mine = aggregates.user_ids == user_id
+            if mine.any():
+                add_sources(self._labels(aggregates.category_ids[mine]).tolist(), aggregates.amounts[mine],
+                            np.full(int(mine.sum()), frequency))
+
+#---------------------------------------------------Example Usage---------------------------------------------------------------------------------------------------
+
+# ingester = TransactionIngester(type_column="type", chunk_size=250_000)
+# print(ingester.ingest("transactions_2024_05.csv"))  # Rows, timing and rows/s
+# ledger = PopulationLedger()
+# ingester.to_ledger(ledger, frequency='M')
+#
+# tracker = IncomeTracker()
+# ingester.to_tracker(tracker, user_id=42, frequency='M')
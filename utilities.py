@@ -1,6 +1,61 @@
-import pandas as pd
+import contextlib
+import importlib
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is only imported on first attribute access.
+    Used for the plotting libraries so that compute-only code never loads them.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+plt = LazyModule("matplotlib.pyplot")
+
+# Process-wide default for the printing methods' `quiet` argument; see set_quiet and quiet
+_quiet = False
+
+
+def set_quiet(enabled=True):
+    """Makes the printing methods of every module silent (or talkative again) by default."""
+    global _quiet
+    _quiet = bool(enabled)
+
+
+@contextlib.contextmanager
+def quiet(enabled=True):
+    """Scopes set_quiet to a with-block, restoring the previous default on exit."""
+    global _quiet
+    previous = _quiet
+    _quiet = bool(enabled)
+    try:
+        yield
+    finally:
+        _quiet = previous
+
+
+def should_print(quiet=None):
+    """Whether a printing method should print: its per-call `quiet` argument wins over the default."""
+    return not (_quiet if quiet is None else quiet)
+
+
+# Average days per period for each frequency code; any other code (including 'O', one-time)
+# converts to a daily amount of 0. frequencyEngine converts exactly for a given calendar month.
+DAILY_DIVISORS = {'D': 1, 'W': 7, 'B': 14, 'M': 30, 'Q': 365 / 4, 'Y': 365}
 
 class Utilities:
     def __init__(self):
@@ -14,12 +69,30 @@ class Utilities:
             return amount
         elif frequency == 'W':
             return amount / 7
+        elif frequency == 'B':
+            return amount / 14
         elif frequency == 'M':
             return amount / 30
+        elif frequency == 'Q':
+            return amount / (365 / 4)
         elif frequency == 'Y':
             return amount / 365
         else:
             return 0
+
+    def calculate_daily_amounts(self, amounts, frequencies):
+        """
+        Vectorized calculate_daily_amount: converts arrays of amounts and frequency
+        codes to daily amounts in one pass. Unknown codes give 0.
+        """
+        amounts = np.asarray(amounts, dtype=np.float64)
+        frequencies = np.asarray(frequencies)
+        if amounts.shape != frequencies.shape:
+            raise ValueError("Amounts and frequencies must have the same shape.")
+        divisors = np.full(amounts.shape, np.inf)
+        for code, days in DAILY_DIVISORS.items():
+            divisors[frequencies == code] = days
+        return amounts / divisors
     
     def calculate_total_expenses(self, expenses):
         return sum(expenses)